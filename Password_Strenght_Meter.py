@@ -1,11 +1,689 @@
-import streamlit as st
+import argparse
+import hashlib
+import heapq
+import json
+import mmap
+import os
 import re
 import secrets
 import string
+import struct
+import sys
+import tempfile
+import time
 import math  # Add math import for potential entropy calculation
+from array import array
+from bisect import bisect_right
+from collections import Counter, OrderedDict, defaultdict, deque
+from functools import lru_cache
+from itertools import accumulate, combinations, islice
+
+STRENGTH_LEVELS = [
+    (5, "Strong", "green"),
+    (4, "Moderate", "orange"),
+    (0, "Weak", "red")
+]
+
+# Bytes requested from os.urandom per call when generating passwords in bulk
+URANDOM_BLOCK_SIZE = 1 << 20
+# Bundled word list for passphrases: 2048 common words, 11 bits each
+PASSPHRASE_WORDLIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "passphrase_words.txt")
+
+# Default location of the breached-password index built with `build-blocklist`
+BREACHED_INDEX_PATH = "breached_passwords.idx"
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_BUCKET_RANGE = struct.Struct(">QQ")
+
+class BreachedPasswordIndex:
+    """Memory-mapped sorted index of breached-password SHA-1 hashes.
+
+    File layout: a 16-byte header (magic, record count), the first 8 bytes
+    of every distinct SHA-1 digest in ascending order, then 65537 record
+    offsets indexed by each digest's first two bytes. A lookup scans one
+    bucket of the mapped file, so opening is instant and only the pages
+    touched are read. With 8-byte prefixes the false-positive rate is about
+    count / 2**64.
+    """
+
+    MAGIC = b"PWBLK001"
+    HEADER = struct.Struct(">8sQ")
+    PREFIX = 8
+    BUCKET_BITS = 16
+    RUN_SIZE = 2_000_000
+
+    def __init__(self, path):
+        """
+        Open an index file built by BreachedPasswordIndex.build().
+        
+        Args:
+            path (str): Index file
+        
+        Raises:
+            ValueError: If the file is not a valid index
+        """
+        self.path = path
+        error = ValueError(f"{path} is not a breached-password index")
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file cannot be mapped
+                raise error from None
+        buckets = (1 << self.BUCKET_BITS) + 1
+        magic = None
+        if len(self._map) >= self.HEADER.size:
+            magic, self.count = self.HEADER.unpack_from(self._map, 0)
+            self._table = self.HEADER.size + self.count * self.PREFIX
+        # The records and the whole bucket table must be in the file, and nothing else
+        if magic != self.MAGIC or len(self._map) != self._table + buckets * 8:
+            self._map.close()
+            raise error
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, password):
+        return self.contains_digest(hashlib.sha1(password.encode("utf-8", "surrogateescape")).digest())
+
+    def contains_digest(self, digest):
+        """
+        Check a SHA-1 digest (or its first 8 bytes) against the index.
+        
+        Args:
+            digest (bytes): Raw SHA-1 digest
+        
+        Returns:
+            bool: True if the hash is in the index
+        """
+        key = digest[:self.PREFIX]
+        bucket = (key[0] << 8 | key[1]) * 8 + self._table
+        low, high = _BUCKET_RANGE.unpack_from(self._map, bucket)
+        # Buckets average count / 65536 records, so scanning one in C beats a Python binary search
+        records = self._map[self.HEADER.size + low * self.PREFIX:self.HEADER.size + high * self.PREFIX]
+        position = records.find(key)
+        while position != -1:
+            if position % self.PREFIX == 0:
+                return True
+            position = records.find(key, position + 1)
+        return False
+
+    def close(self):
+        self._map.close()
+
+    @classmethod
+    def build(cls, lines, path, hashed=True, run_size=RUN_SIZE):
+        """
+        Build an index file from breached-password lines.
+        
+        Lines are sorted in runs of run_size keys spilled to temporary files and
+        merged, so inputs much larger than memory are fine.
+        
+        Args:
+            lines (iterable): "SHA1HEX" or "SHA1HEX:count" lines (HIBP format), or
+                plaintext passwords when hashed is False
+            path (str): Index file to write (replaced atomically)
+            hashed (bool): Whether lines are SHA-1 hex digests
+            run_size (int): Keys sorted in memory at a time
+        
+        Returns:
+            tuple: (distinct hashes written, lines skipped as invalid)
+        """
+        runs = []
+        keys = []
+        skipped = 0
+        try:
+            for line in lines:
+                entry = line.rstrip("\r\n")
+                if hashed:
+                    hex_digest = entry[:40]
+                    if len(hex_digest) != 40 or entry[40:41] not in ("", ":") or not _HEX_DIGITS.issuperset(hex_digest):
+                        skipped += 1
+                        continue
+                    keys.append(int(hex_digest[:2 * cls.PREFIX], 16))
+                elif entry:
+                    keys.append(int.from_bytes(
+                        hashlib.sha1(entry.encode("utf-8", "surrogateescape")).digest()[:cls.PREFIX], "big"))
+                if len(keys) >= run_size:
+                    runs.append(cls._spill(keys))
+                    keys = []
+            keys.sort()
+            count = cls._write(heapq.merge(keys, *(cls._read_run(run) for run in runs)), path)
+        finally:
+            for run in runs:
+                run.close()
+        return count, skipped
+
+    @staticmethod
+    def _spill(keys):
+        keys.sort()
+        run = tempfile.TemporaryFile()
+        array("Q", keys).tofile(run)
+        run.seek(0)
+        return run
+
+    @staticmethod
+    def _read_run(run, block=65536):
+        while True:
+            keys = array("Q")
+            keys.frombytes(run.read(block * keys.itemsize))
+            if not keys:
+                return
+            yield from keys
+
+    @classmethod
+    def _write(cls, sorted_keys, path):
+        bucket_shift = 8 * cls.PREFIX - cls.BUCKET_BITS
+        counts = [0] * (1 << cls.BUCKET_BITS)
+        count = 0
+        previous = None
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, 0))
+            block = array("Q")
+            for key in sorted_keys:
+                if key == previous:
+                    continue
+                previous = key
+                block.append(key)
+                counts[key >> bucket_shift] += 1
+                if len(block) >= 65536:
+                    count += cls._write_block(f, block)
+                    block = array("Q")
+            count += cls._write_block(f, block)
+
+            offsets = array("Q", [0])
+            for bucket_count in counts:
+                offsets.append(offsets[-1] + bucket_count)
+            cls._write_block(f, offsets)
+            f.seek(0)
+            f.write(cls.HEADER.pack(cls.MAGIC, count))
+        os.replace(temp_path, path)
+        return count
+
+    @staticmethod
+    def _write_block(f, block):
+        # Records and offsets are stored big-endian so byte order matches sort order
+        if sys.byteorder == "little":
+            block.byteswap()
+        block.tofile(f)
+        return len(block)
+
+# Pattern-aware guess estimation (after zxcvbn): the password is covered by the
+# cheapest sequence of dictionary words, l33t words, keyboard walks, repeats,
+# sequences, dates and brute-force runs, and entropy is log2 of the guesses.
+PASSWORD_DICTIONARY_PATH = "password_dictionaries.json"
+
+# Ranked word lists, most common first; `build-dictionaries` compiles bigger ones
+_BUILTIN_DICTIONARIES = {
+    "passwords": """
+        123456 password 12345678 qwerty 123456789 12345 1234 111111 1234567 dragon
+        123123 baseball abc123 football monkey letmein 696969 shadow master 666666
+        qwertyuiop 123321 mustang 1234567890 michael 654321 superman 1qaz2wsx 7777777 121212
+        000000 qazwsx 123qwe killer trustno1 jordan jennifer zxcvbnm asdfgh hunter
+        buster soccer harley batman andrew tigger sunshine iloveyou 2000 charlie
+        robert thomas hockey ranger daniel starwars klaster 112233 george computer
+        michelle jessica pepper 1111 zxcvbn 555555 11111111 131313 freedom 777777
+        pass maggie 159753 aaaaaa ginger princess joshua cheese amanda summer
+        love ashley nicole chelsea biteme matthew access yankees 987654321 dallas
+        austin thunder taylor matrix admin welcome mypassword password1 password123 abc
+        qwerty123 1q2w3e4r tryagain secret login hello monkey1 football1 princess1 welcome1
+        """,
+    "english": """
+        the of and to in is you that it he was for on are as with his they be at
+        one have this from or had by hot word but what some we can out other were all
+        there when up use your how said an each she which do their time if will way
+        about many then them write would like so these her long make thing see him two
+        has look more day could go come did number sound no most people my over know
+        water than call first who may down side been now find any new work part take
+        get place made live where after back little only round man year came show every
+        good me give our under name very through just form sentence great think say help
+        low line differ turn cause much mean before move right boy old too same tell
+        does set three want air well also play small end put home read hand port large
+        spell add even land here must big high such follow act why ask men change went
+        light kind off need house picture try us again animal point mother world near
+        build self earth father head stand own page should country found answer school
+        grow study still learn plant cover food sun four between state keep eye never
+        last let thought city tree cross farm hard start might story saw far sea draw
+        left late run while press close night real life few north open seem together
+        next white children begin got walk example ease paper group always music those
+        both mark often letter until mile river car feet care second book carry took
+        science eat room friend began idea fish mountain stop once base hear horse cut
+        sure watch color face wood main enough plain girl usual young ready above ever
+        red list though feel talk bird soon body dog family direct pose leave song
+        measure door product black short numeral class wind question happen complete
+        ship area half rock order fire south problem piece told knew pass since top
+        whole king space heard best hour better true during hundred five remember step
+        early hold west ground interest reach fast verb sing listen six table travel
+        less morning ten simple several vowel toward war lay against pattern slow center
+        love person money serve appear road map rain rule govern pull cold notice voice
+        unit power town fine certain fly fall lead cry dark machine note wait plan
+        figure star box noun field rest correct able pound done beauty drive stood
+        contain front teach week final gave green quick develop ocean warm free minute
+        strong special mind behind clear tail produce fact street inch multiply nothing
+        course stay wheel full force blue object decide surface deep moon island foot
+        system busy test record boat common gold possible plane stead dry wonder laugh
+        thousand ago ran check game shape equate miss brought heat snow tire bring yes
+        distant fill east paint language among secret dragon monkey summer winter spring
+        """,
+    "names": """
+        james john robert michael william david richard joseph thomas charles christopher
+        daniel matthew anthony mark donald steven paul andrew joshua kenneth kevin brian
+        george timothy ronald edward jason jeffrey ryan jacob gary nicholas eric jonathan
+        stephen larry justin scott brandon benjamin samuel gregory alexander frank patrick
+        raymond jack dennis jerry tyler aaron jose adam nathan henry douglas zachary peter
+        mary patricia jennifer linda elizabeth barbara susan jessica sarah karen lisa nancy
+        betty margaret sandra ashley kimberly emily donna michelle carol amanda dorothy
+        melissa deborah stephanie rebecca sharon laura cynthia kathleen amy angela shirley
+        anna brenda pamela emma nicole helen samantha katherine christine debra rachel
+        carolyn janet catherine maria heather diane ruth julie olivia joyce virginia
+        smith johnson williams brown jones garcia miller davis rodriguez martinez
+        """,
+}
+
+# Character -> letters it can stand for in l33t speak
+L33T_TABLE = {
+    "4": "a", "@": "a", "8": "b", "(": "c", "{": "c", "[": "c", "<": "c", "3": "e",
+    "6": "g", "9": "g", "1": "il", "!": "i", "|": "il", "7": "lt", "0": "o", "$": "s",
+    "5": "s", "+": "t", "%": "x", "2": "z"
+}
+
+# US QWERTY rows as (unshifted, shifted, column offset); the offsets give the keys' slant
+_KEYBOARD_ROWS = [
+    ("`1234567890-=", "~!@#$%^&*()_+", 0),
+    ("qwertyuiop[]\\", "QWERTYUIOP{}|", 1),
+    ("asdfghjkl;'", 'ASDFGHJKL:"', 1),
+    ("zxcvbnm,./", "ZXCVBNM<>?", 1),
+]
+
+BRUTEFORCE_CARDINALITY = 10
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE = 10000
+MIN_SUBMATCH_GUESSES_SINGLE_CHAR = 10
+MIN_SUBMATCH_GUESSES_MULTI_CHAR = 50
+MIN_YEAR_SPACE = 20
+REFERENCE_YEAR = time.localtime().tm_year
+MAX_WORD_LENGTH = 24
+# Characters analyzed for patterns; anything longer is brute force past this point
+MAX_ANALYZED_LENGTH = 100
+GUESS_CACHE_SIZE = 1024
+
+_SEPARATED_DATE = re.compile(r"(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})")
+_YEAR = re.compile(r"19\d\d|20\d\d")
+_GREEDY_REPEAT = re.compile(r"(.+)\1+")
+_LAZY_REPEAT = re.compile(r"(.+?)\1+")
+_LAZY_ANCHORED_REPEAT = re.compile(r"^(.+?)\1+$")
+
+@lru_cache(maxsize=None)
+def ranked_dictionaries(path=PASSWORD_DICTIONARY_PATH):
+    """ {dictionary name: {word: rank}}, loaded on first use.
+        Lists compiled by `build-dictionaries` replace the built-in list of the same name. """
+    dictionaries = {name: {word: rank for rank, word in enumerate(dict.fromkeys(words.split()), 1)}
+                    for name, words in _BUILTIN_DICTIONARIES.items()}
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            dictionaries.update(json.load(f))
+    return dictionaries
+
+def build_dictionaries(sources, path=PASSWORD_DICTIONARY_PATH):
+    """ Compile ranked word lists (one word per line, most common first) into the JSON
+        file ranked_dictionaries() loads. sources maps dictionary name -> file path.
+        Returns {name: words kept}. """
+    compiled = {}
+    for name, source in sources.items():
+        ranks = {}
+        for word in read_passwords(source):
+            word = word.lower()
+            if len(word) <= MAX_WORD_LENGTH and word not in ranks:
+                ranks[word] = len(ranks) + 1
+        compiled[name] = ranks
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(compiled, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+    ranked_dictionaries.cache_clear()
+    _guess_cache.clear()
+    return {name: len(ranks) for name, ranks in compiled.items()}
+
+def _keyboard_graph():
+    """ Neighbours of every key on a slanted QWERTY layout, keyed by unshifted character """
+    positions = {}
+    for row, (keys, _, offset) in enumerate(_KEYBOARD_ROWS):
+        for column, key in enumerate(keys):
+            positions[(column + offset, row)] = key
+    # Same row, the row above (up-left, up-right) and the row below (down-left, down-right)
+    directions = [(-1, 0), (1, 0), (0, -1), (1, -1), (-1, 1), (0, 1)]
+    graph = {}
+    for (x, y), key in positions.items():
+        graph[key] = [positions.get((x + dx, y + dy)) for dx, dy in directions]
+    return graph
+
+KEYBOARD_GRAPH = _keyboard_graph()
+_UNSHIFTED = {shifted: key for keys, shifted_keys, _ in _KEYBOARD_ROWS for key, shifted in zip(keys, shifted_keys)}
+_KEYBOARD_STARTS = len(KEYBOARD_GRAPH)
+_KEYBOARD_DEGREE = sum(sum(1 for n in neighbours if n) for neighbours in KEYBOARD_GRAPH.values()) / _KEYBOARD_STARTS
+
+def _variations(changed, unchanged):
+    """ Ways to place `changed` characters among `changed + unchanged` (used for case and l33t) """
+    if changed == 0 or unchanged == 0:
+        return 2 if changed else 1
+    return sum(math.comb(changed + unchanged, i) for i in range(1, min(changed, unchanged) + 1))
+
+def _uppercase_variations(token):
+    if token.islower() or not any(c.isalpha() for c in token):
+        return 1
+    if token[0].isupper() and token[1:].islower() or token[-1].isupper() and token[:-1].islower() \
+            or token.isupper():
+        return 2
+    upper = sum(c.isupper() for c in token)
+    lower = sum(c.islower() for c in token)
+    return _variations(upper, lower)
+
+def _dictionary_matches(password, translated=None, subs=None):
+    """ Dictionary words (and reversed words) found in the password.
+        With translated/subs, matches come from a l33t-decoded copy of the password. """
+    source = (translated or password).lower()
+    length = len(password)
+    if subs is not None:
+        # substituted[k] = substituted characters in password[:k], to skip substrings without any
+        substituted = [0]
+        for c in password:
+            substituted.append(substituted[-1] + (c in subs))
+    matches = []
+    for name, ranks in ranked_dictionaries().items():
+        for i in range(length):
+            for j in range(i, min(length, i + MAX_WORD_LENGTH)):
+                if subs is not None and substituted[j + 1] == substituted[i]:
+                    continue
+                word = source[i:j + 1]
+                rank = ranks.get(word)
+                if rank is not None:
+                    token = password[i:j + 1]
+                    guesses = rank * _uppercase_variations(token)
+                    if subs is None:
+                        matches.append((i, j, "dictionary", f"{name} #{rank}: {word}", guesses))
+                    else:
+                        for c in set(token).intersection(subs):
+                            guesses *= _variations(token.count(c), token.lower().count(subs[c]))
+                        matches.append((i, j, "l33t", f"{name} #{rank}: {word}", guesses))
+                if subs is None and j > i:
+                    reversed_rank = ranks.get(word[::-1])
+                    if reversed_rank is not None and word != word[::-1]:
+                        matches.append((i, j, "dictionary", f"{name} #{reversed_rank}: {word[::-1]} (reversed)",
+                                        reversed_rank * _uppercase_variations(password[i:j + 1]) * 2))
+    return matches
+
+def _l33t_matches(password):
+    present = [c for c in dict.fromkeys(password) if c in L33T_TABLE]
+    if not present:
+        return []
+    # One substitution table per combination of readings for the ambiguous characters
+    tables = [{}]
+    for c in present:
+        tables = [dict(table, **{c: letter}) for table in tables for letter in L33T_TABLE[c]]
+    matches = []
+    seen = set()
+    for table in tables:
+        translated = password.translate(str.maketrans(table))
+        for match in _dictionary_matches(password, translated, table):
+            if match[:2] + (match[3],) not in seen:
+                seen.add(match[:2] + (match[3],))
+                matches.append(match)
+    return matches
+
+def _spatial_matches(password):
+    matches = []
+    i = 0
+    while i < len(password) - 2:
+        j = i
+        turns = 0
+        shifted = 1 if password[i] in _UNSHIFTED else 0
+        last_direction = None
+        while j + 1 < len(password):
+            current = _UNSHIFTED.get(password[j], password[j])
+            following = _UNSHIFTED.get(password[j + 1], password[j + 1])
+            neighbours = KEYBOARD_GRAPH.get(current)
+            if not neighbours or following not in neighbours:
+                break
+            direction = neighbours.index(following)
+            if direction != last_direction:
+                turns += 1
+                last_direction = direction
+            shifted += password[j + 1] in _UNSHIFTED
+            j += 1
+        if j - i >= 2:
+            length = j - i + 1
+            guesses = sum(math.comb(k - 1, t - 1) * _KEYBOARD_STARTS * _KEYBOARD_DEGREE ** t
+                          for k in range(2, length + 1) for t in range(1, min(turns, k - 1) + 1))
+            guesses *= _variations(shifted, length - shifted)
+            matches.append((i, j, "spatial", "keyboard walk", guesses))
+        i = max(j, i + 1)
+    return matches
+
+def _sequence_matches(password):
+    matches = []
+    i = 0
+    while i < len(password) - 2:
+        delta = ord(password[i + 1]) - ord(password[i])
+        j = i + 1
+        while j + 1 < len(password) and ord(password[j + 1]) - ord(password[j]) == delta:
+            j += 1
+        if j - i >= 2 and 0 < abs(delta) <= 5:
+            first = password[i]
+            base = 4 if first in "aAzZ019" else 10 if first.isdigit() else 26
+            guesses = base * (j - i + 1) * (2 if delta < 0 else 1)
+            matches.append((i, j, "sequence", "sequence", guesses))
+        i = j if j - i >= 2 else i + 1
+    return matches
+
+def _repeat_matches(password):
+    matches = []
+    position = 0
+    while position < len(password):
+        greedy = _GREEDY_REPEAT.search(password, position)
+        if not greedy:
+            break
+        lazy = _LAZY_REPEAT.search(password, position)
+        if len(greedy.group(0)) > len(lazy.group(0)):
+            # "aabaab": the greedy match is longer, its smallest unit comes from the anchored lazy regex
+            match, base = greedy, _LAZY_ANCHORED_REPEAT.match(greedy.group(0)).group(1)
+        else:
+            match, base = lazy, lazy.group(1)
+        repeats = len(match.group(0)) // len(base)
+        guesses = _estimate(base)["guesses"] * repeats
+        matches.append((match.start(), match.end() - 1, "repeat", f"'{base}' repeated {repeats} times", guesses))
+        position = match.end()
+    return matches
+
+def _date_guesses(year, separator):
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE) * 365 * (4 if separator else 1)
+
+def _full_year(year):
+    if year < 100:
+        return year + (1900 if year > 50 else 2000)
+    return year
+
+def _valid_date(day, month, year):
+    year = _full_year(year)
+    return 1 <= day <= 31 and 1 <= month <= 12 and 1000 <= year <= 2050, year
+
+def _date_matches(password):
+    matches = []
+    for match in _YEAR.finditer(password):
+        year = int(match.group(0))
+        matches.append((match.start(), match.end() - 1, "date", f"year {year}",
+                        max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE)))
+    for match in _SEPARATED_DATE.finditer(password):
+        a, b, c = int(match.group(1)), int(match.group(3)), int(match.group(4))
+        for day, month, year in ((a, b, c), (b, a, c), (c, b, a)):
+            valid, full_year = _valid_date(day, month, year)
+            if valid:
+                matches.append((match.start(), match.end() - 1, "date", "date",
+                                _date_guesses(full_year, True)))
+                break
+    # Compact dates: DDMMYYYY, MMDDYYYY, YYYYMMDD and the two-digit-year forms
+    for i in range(len(password)):
+        for length in (6, 8):
+            token = password[i:i + length]
+            if len(token) != length or not token.isdigit():
+                continue
+            year_digits = length - 4
+            splits = ((token[:2], token[2:4], token[4:]), (token[2:4], token[:2], token[4:]),
+                      (token[-2:], token[-4:-2], token[:year_digits]))
+            for day, month, year in splits:
+                valid, full_year = _valid_date(int(day), int(month), int(year))
+                if valid:
+                    matches.append((i, i + length - 1, "date", "date", _date_guesses(full_year, False)))
+                    break
+    return matches
+
+def _bruteforce_guesses(length):
+    guesses = BRUTEFORCE_CARDINALITY ** length
+    return max(guesses, MIN_SUBMATCH_GUESSES_SINGLE_CHAR + 1 if length == 1 else MIN_SUBMATCH_GUESSES_MULTI_CHAR + 1)
+
+def _minimum_guesses(password, matches):
+    """ Cheapest cover of the password by matches and brute-force runs.
+        An l-match cover costs l! * product(guesses) + 10000^(l-1), as in zxcvbn. """
+    n = len(password)
+    by_end = defaultdict(list)
+    for i, j, pattern, description, guesses in matches:
+        if j - i + 1 < n:
+            floor = MIN_SUBMATCH_GUESSES_SINGLE_CHAR if i == j else MIN_SUBMATCH_GUESSES_MULTI_CHAR
+            guesses = max(guesses, floor)
+        guesses = max(guesses, 1)
+        by_end[j].append(((i, j, pattern, description, guesses), math.log2(guesses)))
+
+    # The search compares log2 costs in floats (big-int products are slow and overflow floats);
+    # the exact guess count is recomputed from the winning sequence at the end
+    log_factorials = [math.lgamma(length + 1) / math.log(2) for length in range(n + 2)]
+    log_growth = [(length - 1) * math.log2(MIN_GUESSES_BEFORE_GROWING_SEQUENCE) for length in range(n + 2)]
+    bruteforce_guesses = [0] + [_bruteforce_guesses(length) for length in range(1, n + 1)]
+    log_bruteforce = [0.0] + [math.log2(guesses) for guesses in bruteforce_guesses[1:]]
+
+    # best[k][l] = (log2 total, log2 product, last match): the best cover of password[:k + 1]
+    # by l matches, stored only if no shorter cover of the same prefix is at least as good
+    best = [dict() for _ in range(n)]
+
+    def update(match, log_guesses, length):
+        i, k = match[0], match[1]
+        log_product = log_guesses + (best[i - 1][length - 1][1] if length > 1 else 0.0)
+        a, b = log_factorials[length] + log_product, log_growth[length]
+        log_total = max(a, b) + math.log2(1 + 2 ** (min(a, b) - max(a, b)))
+        for other_length, (other_total, _, _) in best[k].items():
+            if other_length <= length and other_total <= log_total:
+                return
+        best[k][length] = (log_total, log_product, match)
+
+    # A brute-force run password[i:k + 1] of 2+ characters costs (k - i + 1) * log2(10), so the
+    # best start for each cover length is the one minimizing log2 product - i * log2(10);
+    # tracking that running minimum avoids trying every start at every k
+    log_cardinality = math.log2(BRUTEFORCE_CARDINALITY)
+    best_start = {}
+
+    def extend_with_bruteforce(i, k, length):
+        bruteforce = (i, k, "bruteforce", "brute force", bruteforce_guesses[k - i + 1])
+        update(bruteforce, log_bruteforce[k - i + 1], length + 1)
+
+    for k in range(n):
+        for match, log_guesses in by_end[k]:
+            if match[0] == 0:
+                update(match, log_guesses, 1)
+            else:
+                for length in list(best[match[0] - 1]):
+                    update(match, log_guesses, length + 1)
+        update((0, k, "bruteforce", "brute force", bruteforce_guesses[k + 1]), log_bruteforce[k + 1], 1)
+        if k >= 2:
+            # Starts at i = k - 1 become available for runs of two or more characters
+            i = k - 1
+            for length, (_, log_product, last) in best[i - 1].items():
+                if last[2] != "bruteforce":
+                    key = log_product - i * log_cardinality
+                    if length not in best_start or key < best_start[length][0]:
+                        best_start[length] = (key, i)
+        for length, (_, i) in list(best_start.items()):
+            extend_with_bruteforce(i, k, length)
+        if k >= 1:
+            # Single-character runs have a floor on their guesses, so they are tried directly
+            for length, (_, _, last) in list(best[k - 1].items()):
+                if last[2] != "bruteforce":
+                    extend_with_bruteforce(k, k, length)
+
+    length = min(best[n - 1].items(), key=lambda item: item[1][0])[0]
+    sequence = []
+    k = n - 1
+    while k >= 0:
+        match = best[k][length][2]
+        sequence.append(match)
+        k = match[0] - 1
+        length -= 1
+    sequence.reverse()
+    total = math.factorial(len(sequence)) * math.prod(match[4] for match in sequence) \
+        + MIN_GUESSES_BEFORE_GROWING_SEQUENCE ** (len(sequence) - 1)
+    return total, sequence
+
+_guess_cache = OrderedDict()
+
+def _estimate(password):
+    # Bounded LRU memo keyed by a digest, so retyping or re-rendering costs one hash
+    key = hashlib.sha256(password.encode("utf-8", "surrogateescape")).digest()
+    result = _guess_cache.get(key)
+    if result is not None:
+        _guess_cache.move_to_end(key)
+        return result
+    if not password:
+        result = {"guesses": 1, "entropy": 0.0, "sequence": []}
+    else:
+        # Only a bounded prefix is matched; the rest is scored as brute force (as zxcvbn does),
+        # so a long paste costs the same as a MAX_ANALYZED_LENGTH password
+        head, tail = password[:MAX_ANALYZED_LENGTH], password[MAX_ANALYZED_LENGTH:]
+        matches = (_dictionary_matches(head) + _l33t_matches(head) + _spatial_matches(head)
+                   + _sequence_matches(head) + _repeat_matches(head) + _date_matches(head))
+        guesses, sequence = _minimum_guesses(head, matches)
+        guesses = int(guesses)
+        if tail:
+            tail_guesses = BRUTEFORCE_CARDINALITY ** len(tail)
+            guesses *= tail_guesses
+            if sequence[-1][2] == "bruteforce":
+                # Extend a brute-force run that already ends the prefix
+                start, _, _, _, run_guesses = sequence.pop()
+                tail_guesses *= run_guesses
+            else:
+                start = len(head)
+            sequence.append((start, len(password) - 1, "bruteforce", "brute force", tail_guesses))
+        result = {
+            "guesses": guesses,
+            "entropy": round(math.log2(guesses), 2),
+            "sequence": [{"pattern": pattern, "token": password[i:j + 1], "description": description,
+                          "guesses": match_guesses}
+                         for i, j, pattern, description, match_guesses in sequence]
+        }
+    _guess_cache[key] = result
+    if len(_guess_cache) > GUESS_CACHE_SIZE:
+        _guess_cache.popitem(last=False)
+    return result
+
+# Feedback for each kind of pattern found in a password
+PATTERN_WARNINGS = {
+    "dictionary": "⚠️ Avoid common words, names and passwords",
+    "l33t": "⚠️ Swapping letters for look-alikes (p@ssw0rd) is easy to guess",
+    "spatial": "⚠️ Avoid keyboard patterns like qwerty or asdf",
+    "repeat": "⚠️ Repeated chunks like 'abcabc' add little strength",
+    "sequence": "⚠️ Avoid sequences like abc or 123",
+    "date": "⚠️ Avoid dates and years"
+}
+
+def estimate_guesses(password):
+    """
+    Estimate how many guesses a pattern-aware attacker needs for a password.
+    
+    Args:
+        password (str): Password to analyze
+    
+    Returns:
+        dict: guesses, entropy (log2 of guesses) and the cheapest pattern sequence
+    """
+    return _estimate(password)
 
 class PasswordStrengthMeter:
-    def __init__(self):
+    def __init__(self, breached_path=BREACHED_INDEX_PATH):
         self.characters = {
             "lower": string.ascii_lowercase,
             "upper": string.ascii_uppercase,
@@ -17,6 +695,62 @@ class PasswordStrengthMeter:
             "mypassword", "welcome", "password123", 
             "abc123", "111111", "iloveyou",'tryagain'
         }
+        self._class_sets = {key: frozenset(chars) for key, chars in self.characters.items()}
+        self._class_tuple = tuple(self._class_sets.values())
+        # Compiled PasswordPolicy per length for generate_strong_passwords
+        self._policies = {}
+        # Optional breached-password blocklist, used when its index file exists
+        self.breached = BreachedPasswordIndex(breached_path) \
+            if breached_path and os.path.exists(breached_path) else None
+
+    def is_breached(self, password):
+        """
+        Check the password against the breached-password index, if one is loaded.
+        
+        Args:
+            password (str): Password to look up
+        
+        Returns:
+            bool: True if the password appears in the index
+        """
+        return self.breached is not None and password in self.breached
+
+    def classify(self, password):
+        """
+        Find which character classes a password uses in a single pass.
+        
+        Args:
+            password (str): Password to inspect
+        
+        Returns:
+            tuple: (dict of class name -> bool, number of distinct characters)
+        """
+        present = set(password)
+        char_checks = {key: not present.isdisjoint(chars) for key, chars in self._class_sets.items()}
+        return char_checks, len(present)
+
+    def score_password(self, password):
+        """
+        Score a password without building feedback, for bulk audits.
+        
+        Args:
+            password (str): Password to score
+        
+        Returns:
+            tuple: (score, strength label), matching check_password_strength
+        """
+        if password.lower() in self.weak_passwords or self.is_breached(password):
+            return 0, "Very Weak"
+        # Same checks as classify(), unrolled: this runs once per password in an audit
+        present = set(password)
+        lower, upper, digits, special = self._class_tuple
+        score = ((len(password) >= 8) + (not present.isdisjoint(lower)) + (not present.isdisjoint(upper))
+                 + (not present.isdisjoint(digits)) + (not present.isdisjoint(special)))
+        if len(present) < len(password) * 0.7:
+            score = max(0, score - 1)
+        for level, label, _ in STRENGTH_LEVELS:
+            if score >= level:
+                return score, label
 
     def check_password_strength(self, password):
         """
@@ -39,6 +773,13 @@ class PasswordStrengthMeter:
                 "color": "red", 
                 "feedback": ["❌ Common and easily guessable password"]
             }
+        if self.is_breached(password):
+            return {
+                "score": 0, 
+                "strength": "Very Weak", 
+                "color": "red", 
+                "feedback": ["❌ This password has appeared in a data breach"]
+            }
 
         # Length check
         if len(password) >= 8:
@@ -46,10 +787,7 @@ class PasswordStrengthMeter:
         else:
             feedback.append("❌ At least 8 characters required")
 
-        char_checks = {
-            key: bool(re.search(fr"[{chars}]", password)) 
-            for key, chars in self.characters.items()
-        }
+        char_checks, distinct = self.classify(password)
         score += sum(char_checks.values())
 
         # Feedback for missing any character types
@@ -62,50 +800,39 @@ class PasswordStrengthMeter:
         if not char_checks["special"]:
             feedback.append("❌ Add a special character (!@#$%^&*)")
 
-        if len(set(password)) < len(password) * 0.7:
+        if distinct < len(password) * 0.7:
             feedback.append("⚠️ Avoid too many repeating characters")
             score = max(0, score - 1)
 
+        # Guessable patterns (words, keyboard walks, dates...) found by the estimator
+        estimate = estimate_guesses(password)
+        for warning in dict.fromkeys(PATTERN_WARNINGS[match["pattern"]] for match in estimate["sequence"]
+                                     if match["pattern"] in PATTERN_WARNINGS):
+            feedback.append(warning)
+
         # Determine strength levels
-        strength_levels = [
-            (5, "Strong", "green"), 
-            (4, "Moderate", "orange"), 
-            (0, "Weak", "red")
-        ]
-        
-        for level, label, color in strength_levels:
+        for level, label, color in STRENGTH_LEVELS:
             if score >= level:
                 return {
                     "score": score, 
                     "strength": label, 
                     "color": color, 
                     "feedback": feedback or ["✅ Good password!"],
-                    "entropy": self._calculate_entropy(password)
+                    "entropy": estimate["entropy"],
+                    "patterns": estimate["sequence"]
                 }
 
     def _calculate_entropy(self, password):
         """
-        Calculate password entropy.
+        Calculate password entropy from the guesses a pattern-aware attacker needs.
         
         Args:
             password (str): Password to calculate entropy for
         
         Returns:
-            float: Calculated entropy
-        """
-        # Determine character set size
-        char_set_size = 0
-        if re.search(r'[a-z]', password):
-            char_set_size += 26
-        if re.search(r'[A-Z]', password):
-            char_set_size += 26
-        if re.search(r'\d', password):
-            char_set_size += 10
-        if re.search(r'[!@#$%^&*]', password):
-            char_set_size += 10
-        
-        # Calculate entropy
-        return round(len(password) * math.log2(char_set_size), 2) if char_set_size > 0 else 0
+            float: log2 of the estimated guesses
+        """
+        return estimate_guesses(password)["entropy"]
 
     def generate_strong_password(self, length=12):
         """
@@ -128,11 +855,402 @@ class PasswordStrengthMeter:
         
         return "".join(password)
 
+    def generate_strong_passwords(self, count, length=12):
+        """
+        Generate many cryptographically secure passwords in one call.
+        
+        Uses a PasswordPolicy requiring every character type, so each output is
+        uniform over the valid passwords of this length.
+        
+        Args:
+            count (int): Number of passwords to generate
+            length (int): Length of each password
+        
+        Returns:
+            list: Generated passwords
+        """
+        policy = self._policies.get(length)
+        if policy is None:
+            policy = self._policies[length] = PasswordPolicy(length, special=self.characters["special"])
+        return policy.generate(count)
+
+# Characters that are easily confused when read or typed, left out with no_ambiguous
+AMBIGUOUS_CHARACTERS = "Il1|O0o`'\""
+
+CHARACTER_CLASSES = {
+    "lower": string.ascii_lowercase,
+    "upper": string.ascii_uppercase,
+    "digits": string.digits,
+    "special": "!@#$%^&*"
+}
+
+class PasswordPolicy:
+    """
+    Password rules compiled once into a reusable generator.
+    
+    Passwords are drawn uniformly from every string the policy allows, so the
+    reported entropy is exact: log2 of the number of allowed passwords.
+    """
+    def __init__(self, min_length=12, max_length=None, required=tuple(CHARACTER_CLASSES), forbidden=(),
+                 special=CHARACTER_CLASSES["special"], no_ambiguous=False):
+        max_length = min_length if max_length is None else max_length
+        required = tuple(dict.fromkeys(required))
+        unknown = (set(required) | set(forbidden)) - set(CHARACTER_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown character classes: {', '.join(sorted(unknown))}")
+        if set(required) & set(forbidden):
+            raise ValueError("A character class can't be both required and forbidden")
+        if not set(special) <= set(string.punctuation):
+            raise ValueError("Special characters must be ASCII punctuation")
+
+        classes = {}
+        for name, chars in dict(CHARACTER_CLASSES, special=special).items():
+            chars = "".join(c for c in dict.fromkeys(chars) if not (no_ambiguous and c in AMBIGUOUS_CHARACTERS))
+            if name not in forbidden and chars:
+                classes[name] = chars
+        if not classes:
+            raise ValueError("The policy allows no characters")
+        missing = [name for name in required if name not in classes]
+        if missing:
+            raise ValueError(f"No characters left for required classes: {', '.join(missing)}")
+        if min_length < max(1, len(required)) or max_length < min_length:
+            raise ValueError(f"Lengths must satisfy {max(1, len(required))} <= min_length <= max_length")
+
+        self.classes = classes
+        self.required = required
+        self.alphabet = "".join(classes.values())
+        self.min_length = min_length
+        self.max_length = max_length
+        # Allowed passwords of each length, by inclusion-exclusion over the required classes
+        self.counts = [self._count(length) for length in range(min_length, max_length + 1)]
+        self.combinations = sum(self.counts)
+        self._cumulative = list(accumulate(self.counts))
+
+        # bytes.translate tables: random bytes below the largest multiple of the alphabet size
+        # map to characters, the rest are deleted (rejection sampling without modulo bias)
+        alphabet = self.alphabet.encode("ascii")
+        accepted = 256 - 256 % len(alphabet)
+        self._byte_to_char = bytes(alphabet[b % len(alphabet)] for b in range(accepted)) + bytes(256 - accepted)
+        self._rejected_bytes = bytes(range(accepted, 256))
+        # Each character -> the first character of its class, to check required classes on bytes
+        marks = bytearray(256)
+        for chars in classes.values():
+            for c in chars.encode("ascii"):
+                marks[c] = ord(chars[0])
+        self._class_marks = bytes(marks)
+        self._required_marks = frozenset(ord(classes[name][0]) for name in required)
+
+    def _count(self, length):
+        total = 0
+        for size in range(len(self.required) + 1):
+            for left_out in combinations(self.required, size):
+                total += (-1) ** size * (len(self.alphabet) - sum(len(self.classes[name]) for name in left_out)) ** length
+        return total
+
+    @property
+    def entropy(self):
+        """ Exact entropy in bits of one generated password """
+        return math.log2(self.combinations)
+
+    def generate(self, count=1):
+        """
+        Generate passwords that satisfy the policy.
+        
+        Random bytes come from os.urandom in large blocks; lengths are drawn in proportion
+        to how many passwords each allows, and candidates missing a required class are
+        discarded, so every allowed password is equally likely.
+        
+        Args:
+            count (int): Number of passwords to generate
+        
+        Returns:
+            list: Generated passwords
+        """
+        passwords = []
+        required = self._required_marks
+        text, marks, position = "", b"", 0
+        length = self.min_length
+        while len(passwords) < count:
+            if self.max_length > self.min_length:
+                length = self.min_length + bisect_right(self._cumulative, secrets.randbelow(self.combinations))
+            while True:
+                if position + length > len(text):
+                    # Enough bytes for the remaining passwords after rejections, within one block
+                    needed = (count - len(passwords)) * self.max_length * 2
+                    chars = os.urandom(min(needed, URANDOM_BLOCK_SIZE)).translate(self._byte_to_char,
+                                                                                 self._rejected_bytes)
+                    text, marks, position = chars.decode("ascii"), chars.translate(self._class_marks), 0
+                    continue
+                start = position
+                position += length
+                if required.issubset(marks[start:position]):
+                    passwords.append(text[start:position])
+                    break
+        return passwords
+
+@lru_cache(maxsize=None)
+def load_wordlist(path=PASSPHRASE_WORDLIST_PATH):
+    """ Distinct lowercase words from a word list file (one per line), in file order """
+    with open(path, encoding="utf-8") as f:
+        return tuple(dict.fromkeys(word for word in (line.strip().lower() for line in f) if word))
+
+class PassphrasePolicy:
+    """
+    Diceware-style passphrases: words drawn uniformly from a word list.
+    
+    The separator must keep word boundaries readable (or every word is capitalized),
+    so each passphrase has exactly words * log2(len(wordlist)) bits of entropy.
+    """
+    def __init__(self, words=6, separator="-", capitalize=False, wordlist_path=PASSPHRASE_WORDLIST_PATH):
+        if words < 1:
+            raise ValueError("A passphrase needs at least one word")
+        if not capitalize and (not separator or any(c.isalpha() for c in separator)):
+            raise ValueError("Use a separator without letters, or capitalize the words")
+        self.wordlist = load_wordlist(wordlist_path)
+        if len(self.wordlist) < 2:
+            raise ValueError(f"{wordlist_path} has fewer than two distinct words")
+        self.words = words
+        self.separator = separator
+        self.capitalize = capitalize
+
+    @property
+    def entropy(self):
+        """ Exact entropy in bits of one generated passphrase """
+        return self.words * math.log2(len(self.wordlist))
+
+    def generate(self, count=1):
+        """
+        Generate passphrases.
+        
+        Args:
+            count (int): Number of passphrases to generate
+        
+        Returns:
+            list: Generated passphrases
+        """
+        wordlist = [word.capitalize() for word in self.wordlist] if self.capitalize else self.wordlist
+        return [self.separator.join(secrets.choice(wordlist) for _ in range(self.words)) for _ in range(count)]
+
+# Passwords per generate_strong_passwords call when streaming from the CLI
+GENERATE_BATCH_SIZE = 10000
+
+# Passwords per chunk sent to a worker process
+AUDIT_CHUNK_SIZE = 20000
+
+_audit_meters = {}
+
+def _audit_chunk(passwords, breached_path=BREACHED_INDEX_PATH):
+    """ Strength and score histograms for one chunk (runs in worker processes) """
+    meter = _audit_meters.get(breached_path)
+    if meter is None:
+        meter = _audit_meters[breached_path] = PasswordStrengthMeter(breached_path)
+    score_password = meter.score_password
+    strengths = Counter()
+    scores = Counter()
+    for password in passwords:
+        score, strength = score_password(password)
+        strengths[strength] += 1
+        scores[score] += 1
+    return len(passwords), strengths, scores
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def audit_passwords(passwords, workers=1, chunk_size=AUDIT_CHUNK_SIZE, breached_path=BREACHED_INDEX_PATH):
+    """
+    Score every password from an iterable and summarise the results.
+    
+    Args:
+        passwords (iterable): Passwords, e.g. read_passwords(path); consumed lazily
+        workers (int): Processes to spread chunks over (1 = this process)
+        chunk_size (int): Passwords per chunk
+        breached_path (str): Breached-password index to check against, if it exists
+    
+    Returns:
+        dict: count, strength histogram, score histogram, seconds and passwords per second
+    """
+    started = time.perf_counter()
+    count = 0
+    strengths = Counter()
+    scores = Counter()
+
+    def collect(result):
+        nonlocal count
+        chunk_count, chunk_strengths, chunk_scores = result
+        count += chunk_count
+        strengths.update(chunk_strengths)
+        scores.update(chunk_scores)
+
+    if workers <= 1:
+        for chunk in _chunks(passwords, chunk_size):
+            collect(_audit_chunk(chunk, breached_path))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # At most 2 chunks per worker in flight, so memory stays bounded on huge dumps
+        with ProcessPoolExecutor(workers) as pool:
+            pending = deque()
+            for chunk in _chunks(passwords, chunk_size):
+                pending.append(pool.submit(_audit_chunk, chunk, breached_path))
+                if len(pending) >= workers * 2:
+                    collect(pending.popleft().result())
+            while pending:
+                collect(pending.popleft().result())
+
+    seconds = time.perf_counter() - started
+    return {
+        "count": count,
+        "strengths": dict(strengths),
+        "scores": dict(sorted(scores.items())),
+        "seconds": seconds,
+        "per_second": count / seconds if seconds > 0 else 0.0
+    }
+
+def read_passwords(path):
+    """ Yield one password per line from a file (or stdin for "-"), keeping inner whitespace """
+    source = sys.stdin if path == "-" else open(path, encoding="utf-8", errors="surrogateescape")
+    try:
+        for line in source:
+            password = line.rstrip("\r\n")
+            if password:
+                yield password
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+def write_passwords(count, path, policy, batch_size=GENERATE_BATCH_SIZE):
+    """ Stream `count` passwords from a PasswordPolicy or PassphrasePolicy to a file
+        (or stdout for "-") in batches; returns the count """
+    target = sys.stdout if path == "-" else open(path, "w", encoding="ascii")
+    try:
+        written = 0
+        while written < count:
+            batch = policy.generate(min(batch_size, count - written))
+            target.write("\n".join(batch) + "\n")
+            written += len(batch)
+    finally:
+        if target is not sys.stdout:
+            target.close()
+    return written
+
+def print_audit_report(report, out=sys.stdout):
+    """ Print the strength histogram and throughput of an audit """
+    count = report["count"]
+    print(f"Audited {count:,} passwords in {report['seconds']:.2f}s "
+          f"({report['per_second']:,.0f} passwords/sec)", file=out)
+    width = max(1, count)
+    for label in ("Very Weak", "Weak", "Moderate", "Strong"):
+        n = report["strengths"].get(label, 0)
+        bar = "#" * round(40 * n / width)
+        print(f"  {label:<10}{n:>12,} {n / width:>7.1%}  {bar}", file=out)
+    print("  Scores: " + ", ".join(f"{score}: {n:,}" for score, n in report["scores"].items()), file=out)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Password strength tools for the command line.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    audit = commands.add_parser("audit", help="score a file of passwords (one per line)")
+    audit.add_argument("path", nargs="?", default="-", help="password file, or - for stdin")
+    audit.add_argument("--workers", type=int, default=1, help="processes used to score chunks")
+    audit.add_argument("--chunk-size", type=int, default=AUDIT_CHUNK_SIZE)
+    audit.add_argument("--breached", default=BREACHED_INDEX_PATH, help="breached-password index to check against")
+
+    blocklist = commands.add_parser("build-blocklist", help="build the breached-password index from a hash list")
+    blocklist.add_argument("source", help="SHA1HEX[:count] lines (e.g. the HIBP download), or - for stdin")
+    blocklist.add_argument("-o", "--output", default=BREACHED_INDEX_PATH)
+    blocklist.add_argument("--plain", action="store_true", help="source holds plaintext passwords, not hashes")
+
+    generate = commands.add_parser("generate", help="write strong passwords or passphrases, one per line")
+    generate.add_argument("count", type=int)
+    generate.add_argument("-o", "--output", default="-", help="output file, or - for stdout")
+    generate.add_argument("--length", type=int, default=12, help="password length (the minimum with --max-length)")
+    generate.add_argument("--max-length", type=int, help="draw lengths from --length to this")
+    generate.add_argument("--require", nargs="*", choices=list(CHARACTER_CLASSES), default=list(CHARACTER_CLASSES),
+                          help="character types every password must include")
+    generate.add_argument("--forbid", nargs="*", choices=list(CHARACTER_CLASSES), default=[],
+                          help="character types to leave out")
+    generate.add_argument("--special", default=CHARACTER_CLASSES["special"], help="special characters to use")
+    generate.add_argument("--no-ambiguous", action="store_true", help=f"leave out {AMBIGUOUS_CHARACTERS}")
+    generate.add_argument("--passphrase", type=int, metavar="WORDS", help="generate passphrases of WORDS words instead")
+    generate.add_argument("--separator", default="-", help="passphrase word separator")
+    generate.add_argument("--capitalize", action="store_true", help="capitalize passphrase words")
+    generate.add_argument("--wordlist", default=PASSPHRASE_WORDLIST_PATH, help="passphrase word list")
+
+    dictionaries = commands.add_parser("build-dictionaries",
+                                       help="compile ranked word lists for the entropy estimator")
+    dictionaries.add_argument("sources", nargs="+", metavar="NAME=PATH",
+                              help="word list with one word per line, most common first (e.g. passwords=top10k.txt)")
+    dictionaries.add_argument("-o", "--output", default=PASSWORD_DICTIONARY_PATH)
+    return parser
+
+def run_cli(argv=None):
+    """ Command mode: python Password_Strenght_Meter.py audit dump.txt --workers 8 """
+    args = build_parser().parse_args(argv)
+    if args.command == "audit":
+        try:
+            report = audit_passwords(read_passwords(args.path), args.workers, args.chunk_size, args.breached)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print_audit_report(report)
+    elif args.command == "build-blocklist":
+        started = time.perf_counter()
+        try:
+            count, skipped = BreachedPasswordIndex.build(read_passwords(args.source), args.output,
+                                                         hashed=not args.plain)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        size_mb = os.path.getsize(args.output) / 1e6
+        print(f"Indexed {count:,} distinct hashes into {args.output} ({size_mb:.1f} MB) "
+              f"in {time.perf_counter() - started:.1f}s")
+        if skipped:
+            print(f"Skipped {skipped:,} lines that are not SHA-1 hex digests", file=sys.stderr)
+    elif args.command == "generate":
+        started = time.perf_counter()
+        try:
+            if args.passphrase:
+                policy = PassphrasePolicy(args.passphrase, args.separator, args.capitalize, args.wordlist)
+            else:
+                policy = PasswordPolicy(args.length, args.max_length, args.require, args.forbid, args.special,
+                                        args.no_ambiguous)
+            written = write_passwords(args.count, args.output, policy)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        # Reported on stderr so stdout stays one password per line
+        print(f"Wrote {written:,} passwords to {'stdout' if args.output == '-' else args.output} in {time.perf_counter() - started:.1f}s, "
+              f"{policy.entropy:.1f} bits of entropy each", file=sys.stderr if args.output == "-" else sys.stdout)
+    elif args.command == "build-dictionaries":
+        sources = dict(source.partition("=")[::2] for source in args.sources)
+        if not all(sources) or not all(sources.values()):
+            print("Error: sources must look like NAME=PATH", file=sys.stderr)
+            return 1
+        try:
+            counts = build_dictionaries(sources, args.output)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"Wrote {args.output}: " + ", ".join(f"{name} ({n:,} words)" for name, n in counts.items()))
+    return 0
+
 def main():
+    # Imported here so the audit workers and command mode don't load Streamlit
+    import streamlit as st
+
     st.set_page_config(page_title="Password Strength Meter", page_icon="🔐", layout="centered")
     
-    # Initialize password meter
-    password_meter = PasswordStrengthMeter()
+    # Initialize password meter; a damaged blocklist should not take the page down
+    try:
+        password_meter = PasswordStrengthMeter()
+    except (OSError, ValueError) as e:
+        st.warning(f"⚠️ Breached-password check disabled: {e}")
+        password_meter = PasswordStrengthMeter(breached_path=None)
 
     # Title and description
     st.title("🔐 Password Strength Meter")
@@ -167,20 +1285,49 @@ def main():
             
             # Show entropy if calculated
             if 'entropy' in result:
-                st.metric("Password Entropy", result['entropy'])
+                st.metric("Password Entropy", f"{result['entropy']} bits")
+
+            # Show how an attacker would split the password
+            if result.get('patterns'):
+                st.subheader("Detected Patterns")
+                st.table([{"Token": match["token"], "Pattern": match["pattern"],
+                           "Details": match["description"], "Guesses": f"{match['guesses']:,.0f}"}
+                          for match in result['patterns']])
 
     with tab2:
         st.header("Generate Strong Password")
         
-        length = st.slider("Password Length", 12, 24, 16)
+        mode = st.radio("Type", ["Password", "Passphrase"], horizontal=True)
+        
+        # Compile the chosen policy; its entropy is exact, no need to analyze each output
+        try:
+            if mode == "Password":
+                min_length, max_length = st.slider("Password Length", 8, 32, (16, 16))
+                classes = list(CHARACTER_CLASSES)
+                required = st.multiselect("Must include", classes, default=classes)
+                forbidden = st.multiselect("Leave out", [name for name in classes if name not in required])
+                special = st.text_input("Special characters", CHARACTER_CLASSES["special"])
+                no_ambiguous = st.checkbox(f"Avoid look-alike characters ({AMBIGUOUS_CHARACTERS})")
+                policy = PasswordPolicy(min_length, max_length, required, forbidden, special, no_ambiguous)
+            else:
+                words = st.slider("Number of Words", 4, 10, 6)
+                separator = st.text_input("Separator", "-")
+                capitalize = st.checkbox("Capitalize words")
+                policy = PassphrasePolicy(words, separator, capitalize)
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            policy = None
+        
+        if policy is not None:
+            st.metric("Entropy", f"{policy.entropy:.1f} bits")
         
         # Generate button
-        if st.button("Generate Password"):
+        if policy is not None and st.button(f"Generate {mode}"):
             # Create password
-            generated_password = password_meter.generate_strong_password(length)
+            generated_password = policy.generate()[0]
             
             # Display generated password
-            st.success("🎲 Generated Password:")
+            st.success(f"🎲 Generated {mode}:")
             st.code(generated_password)
             
             # Analyze generated password
@@ -201,4 +1348,7 @@ def main():
     st.markdown("### Author: \n **MOIZ MANSOORI**")
 
 if __name__ == "__main__":
+    # Arguments select command mode; `streamlit run Password_Strenght_Meter.py` passes none
+    if len(sys.argv) > 1:
+        sys.exit(run_cli())
     main()
\ No newline at end of file
@@ -1,173 +1,188 @@
-import streamlit as st
-import pandas as pd
+import argparse
+import csv
+import math
+import re
+import sys
+import time
+from collections import deque
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache
+from itertools import islice
+
+# Defining the conversion categories and their units
+CATEGORIES = {
+    "Length": {
+        "Nanometer": 1e-9,
+        "Micrometer": 1e-6,
+        "Millimeter": 1e-3,
+        "Centimeter": 1e-2,
+        "Meter": 1,
+        "Kilometer": 1e3,
+        "Inch": 0.0254,
+        "Foot": 0.3048,
+        "Yard": 0.9144,
+        "Mile": 1609.34,
+        "Nautical mile": 1852
+    },
+    "Mass": {
+        "Microgram": 1e-9,
+        "Milligram": 1e-6,
+        "Gram": 1e-3,
+        "Kilogram": 1,
+        "Metric ton": 1e3,
+        "Ounce": 0.0283495,
+        "Pound": 0.453592,
+        "Stone": 6.35029,
+        "US ton": 907.185,
+        "Imperial ton": 1016.05
+    },
+    "Area": {
+        "Square millimeter": 1e-6,
+        "Square centimeter": 1e-4,
+        "Square meter": 1,
+        "Hectare": 10000,
+        "Square kilometer": 1e+6,
+        "Square inch": 0.00064516,
+        "Square foot": 0.092903,
+        "Square yard": 0.836127,
+        "Acre": 4046.86,
+        "Square mile": 2.59e+6
+    },
+    "Data Transfer Rate": {
+        "Bit per second": 1,
+        "Kilobit per second": 1e3,
+        "Megabit per second": 1e6,
+        "Gigabit per second": 1e9,
+        "Terabit per second": 1e12,
+        "Byte per second": 8,
+        "Kilobyte per second": 8e3,
+        "Megabyte per second": 8e6,
+        "Gigabyte per second": 8e9,
+        "Terabyte per second": 8e12
+    },
+    "Digital Storage": {
+        "Bit": 1,
+        "Kilobit": 1e3,
+        "Megabit": 1e6,
+        "Gigabit": 1e9,
+        "Terabit": 1e12,
+        "Petabit": 1e15,
+        "Byte": 8,
+        "Kilobyte": 8e3,
+        "Megabyte": 8e6,
+        "Gigabyte": 8e9,
+        "Terabyte": 8e12,
+        "Petabyte": 8e15
+    },
+    "Energy": {
+        "Joule": 1,
+        "Kilojoule": 1e3,
+        "Calorie": 4.184,
+        "Kilocalorie": 4184,
+        "Watt hour": 3600,
+        "Kilowatt hour": 3.6e6,
+        "Electronvolt": 1.602e-19,
+        "British thermal unit": 1055.06,
+        "US therm": 1.055e+8,
+        "Foot-pound": 1.35582
+    },
+    "Frequency": {
+        "Hertz": 1,
+        "Kilohertz": 1e3,
+        "Megahertz": 1e6,
+        "Gigahertz": 1e9,
+        "Terahertz": 1e12,
+        "RPM": 1/60
+    },
+    "Fuel Economy": {
+        "Miles per gallon (US)": 1,
+        "Miles per gallon (UK)": 1.20095,
+        "Kilometer per liter": 0.425144,
+        "Liter per 100 kilometers": lambda x: 235.215/x, 
+        "Miles per liter": 0.264172
+    },
+    "Plane Angle": {
+        "Degree": 1,
+        "Gradian": 0.9,
+        "Milliradian": 0.057296,
+        "Minute of arc": 1/60,
+        "Radian": 57.2958,
+        "Second of arc": 1/3600
+    },
+    "Pressure": {
+        "Pascal": 1,
+        "Kilopascal": 1e3,
+        "Megapascal": 1e6,
+        "Bar": 1e5,
+        "Pound per square inch": 6894.76,
+        "Torr": 133.322,
+        "Millimeter of mercury": 133.322,
+        "Atmosphere": 101325,
+        "Inch of mercury": 3386.39
+    },
+    "Speed": {
+        "Centimeter per second": 0.01,
+        "Meter per second": 1,
+        "Kilometer per hour": 0.277778,
+        "Foot per second": 0.3048,
+        "Mile per hour": 0.44704,
+        "Knot": 0.514444,
+        "Speed of light": 299792458
+    },
+    "Temperature": {
+        "Celsius": "C",
+        "Fahrenheit": "F",
+        "Kelvin": "K"
+    },
+    "Time": {
+        "Nanosecond": 1e-9,
+        "Microsecond": 1e-6,
+        "Millisecond": 1e-3,
+        "Second": 1,
+        "Minute": 60,
+        "Hour": 3600,
+        "Day": 86400,
+        "Week": 604800,
+        "Month": 2.628e+6,
+        "Year": 3.154e+7,
+        "Decade": 3.154e+8,
+        "Century": 3.154e+9
+    },
+    "Volume": {
+        "Milliliter": 1e-6,
+        "Cubic centimeter": 1e-6,
+        "Liter": 1e-3,
+        "Cubic meter": 1,
+        "Gallon (US)": 0.00378541,
+        "Quart (US)": 0.000946353,
+        "Pint (US)": 0.000473176,
+        "Cup (US)": 0.000236588,
+        "Fluid ounce (US)": 2.9574e-5,
+        "Gallon (UK)": 0.00454609,
+        "Quart (UK)": 0.00113652,
+        "Pint (UK)": 0.000568261,
+        "Cup (UK)": 0.000284131,
+        "Fluid ounce (UK)": 2.84131e-5
+    }
+}
 
 def main():
+    # Imported here so the conversion engine below loads with only the stdlib
+    import streamlit as st
+
     st.title("Unit Converter")
     st.write("### by MOIZ MANSOORI")    
 
-    # Defining the conversion categories and their units
-    categories = {
-        "Length": {
-            "Nanometer": 1e-9,
-            "Micrometer": 1e-6,
-            "Millimeter": 1e-3,
-            "Centimeter": 1e-2,
-            "Meter": 1,
-            "Kilometer": 1e3,
-            "Inch": 0.0254,
-            "Foot": 0.3048,
-            "Yard": 0.9144,
-            "Mile": 1609.34,
-            "Nautical mile": 1852
-        },
-        "Mass": {
-            "Microgram": 1e-9,
-            "Milligram": 1e-6,
-            "Gram": 1e-3,
-            "Kilogram": 1,
-            "Metric ton": 1e3,
-            "Ounce": 0.0283495,
-            "Pound": 0.453592,
-            "Stone": 6.35029,
-            "US ton": 907.185,
-            "Imperial ton": 1016.05
-        },
-        "Area": {
-            "Square millimeter": 1e-6,
-            "Square centimeter": 1e-4,
-            "Square meter": 1,
-            "Hectare": 10000,
-            "Square kilometer": 1e+6,
-            "Square inch": 0.00064516,
-            "Square foot": 0.092903,
-            "Square yard": 0.836127,
-            "Acre": 4046.86,
-            "Square mile": 2.59e+6
-        },
-        "Data Transfer Rate": {
-            "Bit per second": 1,
-            "Kilobit per second": 1e3,
-            "Megabit per second": 1e6,
-            "Gigabit per second": 1e9,
-            "Terabit per second": 1e12,
-            "Byte per second": 8,
-            "Kilobyte per second": 8e3,
-            "Megabyte per second": 8e6,
-            "Gigabyte per second": 8e9,
-            "Terabyte per second": 8e12
-        },
-        "Digital Storage": {
-            "Bit": 1,
-            "Kilobit": 1e3,
-            "Megabit": 1e6,
-            "Gigabit": 1e9,
-            "Terabit": 1e12,
-            "Petabit": 1e15,
-            "Byte": 8,
-            "Kilobyte": 8e3,
-            "Megabyte": 8e6,
-            "Gigabyte": 8e9,
-            "Terabyte": 8e12,
-            "Petabyte": 8e15
-        },
-        "Energy": {
-            "Joule": 1,
-            "Kilojoule": 1e3,
-            "Calorie": 4.184,
-            "Kilocalorie": 4184,
-            "Watt hour": 3600,
-            "Kilowatt hour": 3.6e6,
-            "Electronvolt": 1.602e-19,
-            "British thermal unit": 1055.06,
-            "US therm": 1.055e+8,
-            "Foot-pound": 1.35582
-        },
-        "Frequency": {
-            "Hertz": 1,
-            "Kilohertz": 1e3,
-            "Megahertz": 1e6,
-            "Gigahertz": 1e9,
-            "Terahertz": 1e12,
-            "RPM": 1/60
-        },
-        "Fuel Economy": {
-            "Miles per gallon (US)": 1,
-            "Miles per gallon (UK)": 1.20095,
-            "Kilometer per liter": 0.425144,
-            "Liter per 100 kilometers": lambda x: 235.215/x, 
-            "Miles per liter": 0.264172
-        },
-        "Plane Angle": {
-            "Degree": 1,
-            "Gradian": 0.9,
-            "Milliradian": 0.057296,
-            "Minute of arc": 1/60,
-            "Radian": 57.2958,
-            "Second of arc": 1/3600
-        },
-        "Pressure": {
-            "Pascal": 1,
-            "Kilopascal": 1e3,
-            "Megapascal": 1e6,
-            "Bar": 1e5,
-            "Pound per square inch": 6894.76,
-            "Torr": 133.322,
-            "Millimeter of mercury": 133.322,
-            "Atmosphere": 101325,
-            "Inch of mercury": 3386.39
-        },
-        "Speed": {
-            "Centimeter per second": 0.01,
-            "Meter per second": 1,
-            "Kilometer per hour": 0.277778,
-            "Foot per second": 0.3048,
-            "Mile per hour": 0.44704,
-            "Knot": 0.514444,
-            "Speed of light": 299792458
-        },
-        "Temperature": {
-            "Celsius": "C",
-            "Fahrenheit": "F",
-            "Kelvin": "K"
-        },
-        "Time": {
-            "Nanosecond": 1e-9,
-            "Microsecond": 1e-6,
-            "Millisecond": 1e-3,
-            "Second": 1,
-            "Minute": 60,
-            "Hour": 3600,
-            "Day": 86400,
-            "Week": 604800,
-            "Month": 2.628e+6,
-            "Year": 3.154e+7,
-            "Decade": 3.154e+8,
-            "Century": 3.154e+9
-        },
-        "Volume": {
-            "Milliliter": 1e-6,
-            "Cubic centimeter": 1e-6,
-            "Liter": 1e-3,
-            "Cubic meter": 1,
-            "Gallon (US)": 0.00378541,
-            "Quart (US)": 0.000946353,
-            "Pint (US)": 0.000473176,
-            "Cup (US)": 0.000236588,
-            "Fluid ounce (US)": 2.9574e-5,
-            "Gallon (UK)": 0.00454609,
-            "Quart (UK)": 0.00113652,
-            "Pint (UK)": 0.000568261,
-            "Cup (UK)": 0.000284131,
-            "Fluid ounce (UK)": 2.84131e-5
-        }
-    }
-
-    category = st.sidebar.selectbox("Select category", list(categories.keys()))
+    category = st.sidebar.selectbox("Select category", list(REGISTRY.units))
+    backend = st.sidebar.selectbox("Numeric backend", BACKENDS)
+    precision = st.sidebar.number_input("Decimal digits", min_value=1, max_value=200, value=DECIMAL_PRECISION) \
+        if backend == "decimal" else DECIMAL_PRECISION
     
     col1, col2 = st.columns(2)
     
     # Get units for selected category
-    units = list(categories[category].keys())
+    units = REGISTRY.units[category]
     
     with col1:
         st.subheader("From")
@@ -178,113 +193,63 @@ def main():
         st.subheader("To")
         to_unit = st.selectbox("To Unit", units, key="to_unit")
         
-    if category == "Temperature":
-
-        if input_value is not None:
-            result = convert_temperature(input_value, from_unit, to_unit)
-            
-            with col2:
-                st.success(f"{result:.10g}")
-    elif category == "Fuel Economy" and (callable(categories[category][from_unit]) or callable(categories[category][to_unit])):
+    if input_value is not None:
+        result = convert_value(input_value, category, from_unit, to_unit, backend, precision)
         
-        if input_value is not None:
-            result = convert_fuel_economy(input_value, from_unit, to_unit, categories[category])
-            
-            with col2:
-                st.success(f"{result:.10g}")
-    else:
-        
-        if input_value is not None:
-            from_factor = categories[category][from_unit]
-            to_factor = categories[category][to_unit]
-            
-            result = input_value * (from_factor / to_factor)
-            
-            with col2:
+        with col2:
+            if backend == "float":
                 st.success(f"{result:.10g}")
+            elif backend == "fraction":
+                st.success(f"{result} (≈ {float(result):.10g})")
+            else:
+                st.success(str(result))
     
     # Display conversion formula
     st.markdown("---")
     st.subheader("Conversion Formula:")
     
-    if category == "Temperature":
-        if from_unit == "Celsius" and to_unit == "Fahrenheit":
-            st.write("°F = (°C × 9/5) + 32")
-        elif from_unit == "Fahrenheit" and to_unit == "Celsius":
-            st.write("°C = (°F - 32) × 5/9")
-        elif from_unit == "Celsius" and to_unit == "Kelvin":
-            st.write("K = °C + 273.15")
-        elif from_unit == "Kelvin" and to_unit == "Celsius":
-            st.write("°C = K - 273.15")
-        elif from_unit == "Fahrenheit" and to_unit == "Kelvin":
-            st.write("K = (°F - 32) × 5/9 + 273.15")
-        elif from_unit == "Kelvin" and to_unit == "Fahrenheit":
-            st.write("°F = (K - 273.15) × 9/5 + 32")
-    elif category == "Fuel Economy":
-        if from_unit == "Liter per 100 kilometers" or to_unit == "Liter per 100 kilometers":
-            if from_unit == "Liter per 100 kilometers":
-                st.write(f"{to_unit} = 235.215 / (L/100km)")
-            else:
-                st.write(f"L/100km = 235.215 / ({from_unit})")
-        else:
-            from_factor = categories[category][from_unit]
-            to_factor = categories[category][to_unit]
-            st.write(f"1 {from_unit} = {from_factor/to_factor:.10g} {to_unit}")
+    scale, offset, reciprocal = REGISTRY.coefficients(category, from_unit, to_unit)
+    if reciprocal:
+        st.write(f"{to_unit} = {scale:.10g} / ({from_unit})")
+    elif offset:
+        st.write(f"{to_unit} = {from_unit} × {scale:.10g} {'+' if offset > 0 else '-'} {abs(offset):.10g}")
     else:
-        from_factor = categories[category][from_unit]
-        to_factor = categories[category][to_unit]
-        st.write(f"1 {from_unit} = {from_factor/to_factor:.10g} {to_unit}")
+        st.write(f"1 {from_unit} = {scale:.10g} {to_unit}")
 
     st.markdown("---")
     st.subheader(f"Common {category} Conversions")
     
-    if category == "Temperature":
+    st.dataframe(common_conversions(category, from_unit))
+
+    st.markdown("---")
+    with st.expander("Compound units (e.g. kN*m/s^2, MiB/h)"):
+        expression_value = st.number_input("Value", value=1.0, format="%.10f", key="expression_value")
+        from_expression = st.text_input("From expression", value="km/h", key="from_expression")
+        to_expression = st.text_input("To expression", value="m/s", key="to_expression")
+        try:
+            result = convert_units(expression_value, from_expression, to_expression)
+            st.success(f"{result:.10g} {to_expression}")
+        except ValueError as e:
+            st.error(str(e))
 
-        temps = [-40, 0, 20, 37, 100, 212] if from_unit == "Celsius" else \
+@lru_cache(maxsize=256)
+def common_conversions(category, from_unit):
+    """ Common Conversions table for a category/unit, built once per process.
+        The table only depends on these two values, so reruns and sessions share it;
+        callers must treat the returned DataFrame as read-only. """
+    if category == "Temperature":
+        base_values = [-40, 0, 20, 37, 100, 212] if from_unit == "Celsius" else \
                [-40, 32, 68, 98.6, 212, 400] if from_unit == "Fahrenheit" else \
                [233.15, 273.15, 293.15, 310.15, 373.15, 485.15]
-        
-        common_conversions = {}
-        for temp in temps:
-            row = {}
-            for unit in units:
-                if unit != from_unit:
-                    row[unit] = convert_temperature(temp, from_unit, unit)
-            common_conversions[f"{temp} {from_unit}"] = row
-        
-        df = pd.DataFrame(common_conversions).T
-        st.dataframe(df)
     elif category == "Fuel Economy":
-
         base_values = [5, 10, 15, 20, 25, 30]
-        
-        common_conversions = {}
-        for base in base_values:
-            converted_values = {}
-            for unit in units:
-                if unit != from_unit:
-                    converted_values[unit] = convert_fuel_economy(base, from_unit, unit, categories[category])
-            
-            common_conversions[f"{base} {from_unit}"] = converted_values
-        
-        df = pd.DataFrame(common_conversions).T
-        st.dataframe(df)
     else:
-        common_conversions = {}
         base_values = [0.1, 0.5, 1, 2, 5, 10, 100]
-        
-        for base in base_values:
-            converted_values = {}
-            for unit in units:
-                if unit != from_unit:
-                    from_factor = categories[category][from_unit]
-                    to_factor = categories[category][unit]
-                    converted_values[unit] = base * (from_factor / to_factor)
-            
-            common_conversions[f"{base} {from_unit}"] = converted_values
-        
-        df = pd.DataFrame(common_conversions).T
-        st.dataframe(df)
+    
+    import pandas as pd
+
+    columns, table = REGISTRY.table(category, from_unit, base_values)
+    return pd.DataFrame(table, index=[f"{base} {from_unit}" for base in base_values], columns=columns)
 
 def convert_temperature(value, from_unit, to_unit):
     
@@ -318,5 +283,714 @@ def convert_fuel_economy(value, from_unit, to_unit, units_dict):
         to_factor = units_dict[to_unit]
         return mpg_us * to_factor
 
+class Transform:
+    """Conversion x -> (a*x + b) / (c*x + d), kept as a 2x2 matrix.
+
+    Affine conversions (c == 0) and reciprocal ones (a == d == 0, as between
+    L/100km and MPG) both fit, and chaining conversions is a matrix product,
+    so any path of edges composes into one transform. Division is deferred
+    to coefficients(), which keeps factor ratios as exact as the inputs.
+    """
+
+    __slots__ = ("a", "b", "c", "d")
+
+    def __init__(self, a, b=0, c=0, d=1):
+        self.a, self.b, self.c, self.d = a, b, c, d
+
+    def then(self, other):
+        """Transform that applies self, then other."""
+        return Transform(other.a * self.a + other.b * self.c, other.a * self.b + other.b * self.d,
+                         other.c * self.a + other.d * self.c, other.c * self.b + other.d * self.d)
+
+    def inverse(self):
+        return Transform(self.d, -self.b, -self.c, self.a)
+
+    def coefficients(self):
+        """Return (scale, offset, reciprocal) as used by UnitRegistry.
+
+        Returns:
+            tuple: value * scale + offset, or scale / value when reciprocal.
+        """
+        if self.c == 0:
+            return self.a / self.d, self.b / self.d, False
+        if self.a == 0 and self.d == 0:
+            return self.b / self.c, 0, True
+        raise ValueError("Transform is neither affine nor reciprocal")
+
+class ConversionGraph:
+    """Units as nodes, transforms as edges, all pairs precomputed.
+
+    Each unit only needs one edge to any unit already in the graph; the
+    transform between every pair is composed along the shortest path once,
+    so lookups are a dict hit.
+    """
+
+    def __init__(self, edges=()):
+        """Build the graph and its pair table.
+
+        Args:
+            edges (iterable): (from_unit, to_unit, Transform) triples.
+        """
+        self.edges = {}
+        for from_unit, to_unit, transform in edges:
+            self._link(from_unit, to_unit, transform)
+        self._build()
+
+    def _link(self, from_unit, to_unit, transform):
+        self.edges.setdefault(from_unit, {})[to_unit] = transform
+        self.edges.setdefault(to_unit, {})[from_unit] = transform.inverse()
+
+    def add_edge(self, from_unit, to_unit, transform):
+        """Add a conversion (and its inverse) and recompute the pair table.
+
+        Args:
+            from_unit (str): Source unit.
+            to_unit (str): Target unit.
+            transform (Transform): Maps from_unit values to to_unit values.
+        """
+        self._link(from_unit, to_unit, transform)
+        self._build()
+
+    def _build(self):
+        # Breadth-first from every unit: fewest hops means fewest roundings
+        self.paths = {}
+        for source in self.edges:
+            paths = {source: Transform(1)}
+            queue = deque([source])
+            while queue:
+                unit = queue.popleft()
+                for neighbour, edge in self.edges[unit].items():
+                    if neighbour not in paths:
+                        paths[neighbour] = paths[unit].then(edge)
+                        queue.append(neighbour)
+            self.paths[source] = paths
+
+    def transform(self, from_unit, to_unit):
+        """Return the composed Transform from one unit to another.
+
+        Raises:
+            ValueError: If the units are not connected.
+        """
+        try:
+            return self.paths[from_unit][to_unit]
+        except KeyError:
+            raise ValueError(f"No conversion path from {from_unit!r} to {to_unit!r}")
+
+# Temperature edges out of Celsius, e.g. °F = (9 * °C + 160) / 5
+FROM_CELSIUS = {
+    "Fahrenheit": Transform(9, 160, 0, 5),
+    "Kelvin": Transform(1, 273.15)
+}
+FUEL_BASE = "Miles per gallon (US)"
+L100KM = "Liter per 100 kilometers"
+L100KM_MPG = 235.215
+
+# Exact values for the factors the float tables round, e.g. the international
+# mile is defined as exactly 1609.344 m. Units not listed here use their float
+# literal read as the decimal it was written as.
+EXACT_FACTORS = {
+    "Length": {"Mile": Fraction("1609.344")},
+    "Mass": {
+        "Ounce": Fraction("0.028349523125"),
+        "Pound": Fraction("0.45359237"),
+        "Stone": 14 * Fraction("0.45359237"),
+        "US ton": 2000 * Fraction("0.45359237"),
+        "Imperial ton": 2240 * Fraction("0.45359237")
+    },
+    "Area": {
+        "Square foot": Fraction("0.3048") ** 2,
+        "Square yard": Fraction("0.9144") ** 2,
+        "Acre": 43560 * Fraction("0.3048") ** 2,
+        "Square mile": Fraction("1609.344") ** 2
+    },
+    "Energy": {
+        "Electronvolt": Fraction("1.602176634e-19"),
+        "British thermal unit": Fraction("1055.05585262"),
+        "US therm": 100000 * Fraction("1055.05585262"),
+        "Foot-pound": Fraction("0.3048") * Fraction("0.45359237") * Fraction("9.80665")
+    },
+    "Frequency": {"RPM": Fraction(1, 60)},
+    "Fuel Economy": {
+        "Miles per gallon (UK)": Fraction("4.54609") / Fraction("3.785411784"),
+        "Kilometer per liter": Fraction("1.609344") / Fraction("3.785411784"),
+        "Miles per liter": 1 / Fraction("3.785411784")
+    },
+    "Plane Angle": {"Minute of arc": Fraction(1, 60), "Second of arc": Fraction(1, 3600)},
+    "Pressure": {
+        "Pound per square inch": Fraction("0.45359237") * Fraction("9.80665") / Fraction("0.0254") ** 2,
+        "Torr": Fraction(101325, 760),
+        "Millimeter of mercury": Fraction("133.322387415")
+    },
+    "Speed": {
+        "Kilometer per hour": Fraction(1000, 3600),
+        "Knot": Fraction(1852, 3600)
+    },
+    "Time": {
+        "Year": Fraction(365 * 86400),
+        "Decade": Fraction(3650 * 86400),
+        "Century": Fraction(36500 * 86400)
+    },
+    "Volume": {
+        "Gallon (US)": Fraction("0.003785411784"),
+        "Quart (US)": Fraction("0.003785411784") / 4,
+        "Pint (US)": Fraction("0.003785411784") / 8,
+        "Cup (US)": Fraction("0.003785411784") / 16,
+        "Fluid ounce (US)": Fraction("0.003785411784") / 128,
+        "Quart (UK)": Fraction("0.00454609") / 4,
+        "Pint (UK)": Fraction("0.00454609") / 8,
+        "Cup (UK)": Fraction("0.00454609") / 16,
+        "Fluid ounce (UK)": Fraction("0.00454609") / 160
+    }
+}
+EXACT_FROM_CELSIUS = {
+    "Fahrenheit": Transform(Fraction(9), Fraction(160), 0, Fraction(5)),
+    "Kelvin": Transform(1, Fraction("273.15"))
+}
+EXACT_L100KM_MPG = 100 * Fraction("3.785411784") / Fraction("1.609344")
+
+BACKENDS = ("float", "fraction", "decimal")
+DECIMAL_PRECISION = 28
+
+def exact_factor(category, unit):
+    """ Factor for a unit as a Fraction (see EXACT_FACTORS) """
+    exact = EXACT_FACTORS.get(category, {}).get(unit)
+    if exact is not None:
+        return exact
+    return Fraction(repr(CATEGORIES[category][unit]))
+
+def category_edges(category, exact=False):
+    """ Conversion graph edges for a category: one per unit, linking it to a reference unit.
+        With exact=True the transforms hold Fractions from the exact tables. """
+    if category == "Temperature":
+        table = EXACT_FROM_CELSIUS if exact else FROM_CELSIUS
+        return [("Celsius", unit, transform) for unit, transform in table.items()]
+
+    factors = {unit: exact_factor(category, unit) if exact else factor
+               for unit, factor in CATEGORIES[category].items() if unit != L100KM}
+    if category == "Fuel Economy":
+        # Factors are units per MPG (US); L/100km is 235.215 / MPG (US)
+        edges = [(FUEL_BASE, unit, Transform(factor)) for unit, factor in factors.items() if unit != FUEL_BASE]
+        edges.append((FUEL_BASE, L100KM, Transform(0, EXACT_L100KM_MPG if exact else L100KM_MPG, 1, 0)))
+        return edges
+
+    reference = next(unit for unit, factor in factors.items() if factor == 1)
+    return [(unit, reference, Transform(factor)) for unit, factor in factors.items() if unit != reference]
+
+@lru_cache(maxsize=None)
+def _exact_graph(category):
+    return ConversionGraph(category_edges(category, exact=True))
+
+@lru_cache(maxsize=1024)
+def exact_coefficients(category, from_unit, to_unit):
+    """ (scale, offset, reciprocal) for a unit pair as Fractions, composed once and cached """
+    scale, offset, reciprocal = _exact_graph(category).transform(from_unit, to_unit).coefficients()
+    return Fraction(scale), Fraction(offset), reciprocal
+
+@lru_cache(maxsize=1024)
+def _decimal_coefficients(category, from_unit, to_unit, precision):
+    scale, offset, reciprocal = exact_coefficients(category, from_unit, to_unit)
+    with localcontext() as context:
+        context.prec = precision
+        return (Decimal(scale.numerator) / Decimal(scale.denominator),
+                Decimal(offset.numerator) / Decimal(offset.denominator), reciprocal)
+
+def convert_value(value, category, from_unit, to_unit, backend="float", precision=DECIMAL_PRECISION):
+    """ Convert one value with the chosen numeric backend:
+        "float" is the fast registry path, "fraction" returns an exact Fraction and
+        "decimal" returns a Decimal rounded to `precision` significant digits.
+        Floats are read as the decimal they print as, so 0.1 means 1/10. """
+    if backend == "float":
+        return REGISTRY.convert(float(value), category, from_unit, to_unit)
+    if backend == "fraction":
+        scale, offset, reciprocal = exact_coefficients(category, from_unit, to_unit)
+        value = Fraction(repr(value)) if isinstance(value, float) else Fraction(value)
+        return scale / value if reciprocal else value * scale + offset
+    if backend == "decimal":
+        scale, offset, reciprocal = _decimal_coefficients(category, from_unit, to_unit, precision)
+        value = Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+        with localcontext() as context:
+            context.prec = precision
+            return scale / value if reciprocal else value * scale + offset
+    raise ValueError(f"Unknown numeric backend: {backend!r} (choose from {', '.join(BACKENDS)})")
+
+def conversion_coefficients(category, from_unit, to_unit):
+    """ (scale, offset, reciprocal) for a unit pair, read from the precomputed registry """
+    return REGISTRY.coefficients(category, from_unit, to_unit)
+
+def convert_batch(values, category, from_unit, to_unit):
+    """ Convert many values in one vectorized operation.
+        Accepts a NumPy array, pandas Series (index kept), list/iterable or a
+        single number; lists are turned into NumPy arrays when NumPy is available. """
+    scale, offset, reciprocal = conversion_coefficients(category, from_unit, to_unit)
+
+    if not isinstance(values, (int, float)) and not hasattr(values, "__array__"):
+        try:
+            import numpy as np
+        except ImportError:
+            return [_apply_coefficients(value, scale, offset, reciprocal) for value in values]
+        values = np.asarray(values, dtype=float)
+
+    return _apply_coefficients(values, scale, offset, reciprocal)
+
+def _apply_coefficients(values, scale, offset, reciprocal):
+    # float() so integer arrays are promoted before the in-place offset
+    if reciprocal:
+        if isinstance(values, (int, float)):
+            # Same as NumPy: x / 0 is signed infinity (0 L/100km), not an error
+            return float(scale) / values if values else math.copysign(math.inf, scale) * math.copysign(1.0, values)
+        import numpy as np
+
+        with np.errstate(divide="ignore"):
+            return float(scale) / values
+    result = values * float(scale)
+    if offset:
+        result += offset
+    return result
+
+class UnitRegistry:
+    """Conversion matrices for every category, built once at import.
+
+    Each category gets a name -> id lookup and three dense matrices indexed
+    by [from_id][to_id]: scale, offset and reciprocal, so any pair is
+    value * scale + offset (or scale / value for reciprocal pairs). The
+    entries come from the category's ConversionGraph.
+    """
+
+    def __init__(self, categories, graphs):
+        """Build the lookups and matrices.
+
+        Args:
+            categories (dict): Category name -> {unit name: factor}, for unit order.
+            graphs (dict): Category name -> ConversionGraph with every pair.
+        """
+        self.units = {}
+        self.unit_ids = {}
+        self.scale = {}
+        self.offset = {}
+        self.reciprocal = {}
+        for category, factors in categories.items():
+            units = list(factors)
+            self.units[category] = units
+            self.unit_ids[category] = {unit: i for i, unit in enumerate(units)}
+
+            # Row-major nested lists: at most a few hundred entries per category,
+            # and plain lists keep the registry importable without NumPy
+            coefficients = [[graphs[category].transform(from_unit, to_unit).coefficients() for to_unit in units]
+                            for from_unit in units]
+            self.scale[category] = [[float(scale) for scale, _, _ in row] for row in coefficients]
+            self.offset[category] = [[float(offset) for _, offset, _ in row] for row in coefficients]
+            self.reciprocal[category] = [[reciprocal for _, _, reciprocal in row] for row in coefficients]
+
+    def coefficients(self, category, from_unit, to_unit):
+        """Return (scale, offset, reciprocal) for a unit pair.
+
+        Args:
+            category (str): Category name.
+            from_unit (str): Source unit.
+            to_unit (str): Target unit.
+
+        Returns:
+            tuple: (float, float, bool)
+        """
+        ids = self.unit_ids[category]
+        i, j = ids[from_unit], ids[to_unit]
+        return self.scale[category][i][j], self.offset[category][i][j], self.reciprocal[category][i][j]
+
+    def convert(self, value, category, from_unit, to_unit):
+        """Convert a single value with one indexed lookup.
+
+        Args:
+            value (float): Value in from_unit.
+            category (str): Category name.
+            from_unit (str): Source unit.
+            to_unit (str): Target unit.
+
+        Returns:
+            float: Value in to_unit.
+        """
+        scale, offset, reciprocal = self.coefficients(category, from_unit, to_unit)
+        if reciprocal:
+            return scale / value
+        return value * scale + offset
+
+    def table(self, category, from_unit, base_values):
+        """Convert several values from one unit into every other unit at once.
+
+        Args:
+            category (str): Category name.
+            from_unit (str): Source unit.
+            base_values (list): Values in from_unit, one table row each.
+
+        Returns:
+            tuple: (list of target unit names, 2D array of shape rows x units)
+        """
+        import numpy as np
+
+        i = self.unit_ids[category][from_unit]
+        columns = [j for j in range(len(self.units[category])) if j != i]
+        scale = np.array(self.scale[category][i])[columns]
+        offset = np.array(self.offset[category][i])[columns]
+        reciprocal = np.array(self.reciprocal[category][i])[columns]
+
+        base = np.asarray(base_values, dtype=float)[:, None]
+        with np.errstate(divide="ignore"):
+            table = np.where(reciprocal, scale / base, np.outer(base, scale) + offset)
+        return [self.units[category][j] for j in columns], table
+
+GRAPHS = {category: ConversionGraph(category_edges(category)) for category in CATEGORIES}
+REGISTRY = UnitRegistry(CATEGORIES, GRAPHS)
+
+# Unit algebra: units are (factor to SI, dimension exponents) so compound
+# expressions such as "kN*m/s^2" or "MiB/h" can be parsed and converted
+BASE_DIMENSIONS = ("m", "kg", "s", "A", "K", "mol", "cd", "bit")
+
+def _dimension(**exponents):
+    return tuple(exponents.get(name, 0) for name in BASE_DIMENSIONS)
+
+SI_PREFIXES = {
+    "y": 1e-24, "z": 1e-21, "a": 1e-18, "f": 1e-15, "p": 1e-12, "n": 1e-9,
+    "u": 1e-6, "µ": 1e-6, "μ": 1e-6, "m": 1e-3, "c": 1e-2, "d": 1e-1,
+    "da": 1e1, "h": 1e2, "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12,
+    "P": 1e15, "E": 1e18, "Z": 1e21, "Y": 1e24
+}
+BINARY_PREFIXES = {"Ki": 2**10, "Mi": 2**20, "Gi": 2**30, "Ti": 2**40, "Pi": 2**50, "Ei": 2**60}
+
+_NEWTON = _dimension(kg=1, m=1, s=-2)
+_JOULE = _dimension(kg=1, m=2, s=-2)
+_PASCAL = _dimension(kg=1, m=-1, s=-2)
+_WATT = _dimension(kg=1, m=2, s=-3)
+
+# Symbol -> (factor to SI, dimension); non-SI factors come from CATEGORIES
+UNITS = {
+    "m": (1, _dimension(m=1)),
+    "g": (1e-3, _dimension(kg=1)),
+    "s": (1, _dimension(s=1)),
+    "A": (1, _dimension(A=1)),
+    "K": (1, _dimension(K=1)),
+    "mol": (1, _dimension(mol=1)),
+    "cd": (1, _dimension(cd=1)),
+    "bit": (1, _dimension(bit=1)),
+    "b": (1, _dimension(bit=1)),
+    "B": (CATEGORIES["Digital Storage"]["Byte"], _dimension(bit=1)),
+    "Hz": (1, _dimension(s=-1)),
+    "N": (1, _NEWTON),
+    "Pa": (1, _PASCAL),
+    "J": (1, _JOULE),
+    "W": (1, _WATT),
+    "C": (1, _dimension(A=1, s=1)),
+    "V": (1, _dimension(kg=1, m=2, s=-3, A=-1)),
+    "L": (CATEGORIES["Volume"]["Liter"], _dimension(m=3)),
+    "l": (CATEGORIES["Volume"]["Liter"], _dimension(m=3)),
+    "t": (CATEGORIES["Mass"]["Metric ton"], _dimension(kg=1)),
+    "eV": (CATEGORIES["Energy"]["Electronvolt"], _JOULE),
+    "Wh": (CATEGORIES["Energy"]["Watt hour"], _JOULE),
+    "cal": (CATEGORIES["Energy"]["Calorie"], _JOULE),
+    "bar": (CATEGORIES["Pressure"]["Bar"], _PASCAL),
+    "min": (CATEGORIES["Time"]["Minute"], _dimension(s=1)),
+    "h": (CATEGORIES["Time"]["Hour"], _dimension(s=1)),
+    "d": (CATEGORIES["Time"]["Day"], _dimension(s=1)),
+    "wk": (CATEGORIES["Time"]["Week"], _dimension(s=1)),
+    "yr": (CATEGORIES["Time"]["Year"], _dimension(s=1)),
+    "in": (CATEGORIES["Length"]["Inch"], _dimension(m=1)),
+    "ft": (CATEGORIES["Length"]["Foot"], _dimension(m=1)),
+    "yd": (CATEGORIES["Length"]["Yard"], _dimension(m=1)),
+    "mi": (CATEGORIES["Length"]["Mile"], _dimension(m=1)),
+    "nmi": (CATEGORIES["Length"]["Nautical mile"], _dimension(m=1)),
+    "oz": (CATEGORIES["Mass"]["Ounce"], _dimension(kg=1)),
+    "lb": (CATEGORIES["Mass"]["Pound"], _dimension(kg=1)),
+    "st": (CATEGORIES["Mass"]["Stone"], _dimension(kg=1)),
+    "ha": (CATEGORIES["Area"]["Hectare"], _dimension(m=2)),
+    "ac": (CATEGORIES["Area"]["Acre"], _dimension(m=2)),
+    "gal": (CATEGORIES["Volume"]["Gallon (US)"], _dimension(m=3)),
+    "qt": (CATEGORIES["Volume"]["Quart (US)"], _dimension(m=3)),
+    "pt": (CATEGORIES["Volume"]["Pint (US)"], _dimension(m=3)),
+    "mph": (CATEGORIES["Speed"]["Mile per hour"], _dimension(m=1, s=-1)),
+    "kn": (CATEGORIES["Speed"]["Knot"], _dimension(m=1, s=-1)),
+    "psi": (CATEGORIES["Pressure"]["Pound per square inch"], _PASCAL),
+    "atm": (CATEGORIES["Pressure"]["Atmosphere"], _PASCAL),
+    "Torr": (CATEGORIES["Pressure"]["Torr"], _PASCAL),
+    "mmHg": (CATEGORIES["Pressure"]["Millimeter of mercury"], _PASCAL),
+    "inHg": (CATEGORIES["Pressure"]["Inch of mercury"], _PASCAL),
+    "BTU": (CATEGORIES["Energy"]["British thermal unit"], _JOULE),
+    "rpm": (CATEGORIES["Frequency"]["RPM"], _dimension(s=-1))
+}
+# Units that take SI prefixes (kN, ms, GHz...); binary prefixes only apply to bits and bytes
+PREFIXABLE = {"m", "g", "s", "A", "K", "mol", "cd", "bit", "b", "B", "Hz", "N", "Pa",
+              "J", "W", "C", "V", "L", "l", "t", "eV", "Wh", "cal", "bar"}
+BINARY_PREFIXABLE = {"bit", "b", "B"}
+
+# Largest |n| accepted in "unit^n"; far beyond any physical unit, and small
+# enough that one power of a prefixed unit cannot build a huge number
+MAX_UNIT_EXPONENT = 24
+
+_TOKEN = re.compile(r"\s*(?:(?P<number>-?\d+)|(?P<name>[^\W\d_]+)|(?P<op>\*\*|[*/^·()]))")
+
+def _lookup_unit(symbol):
+    """ Resolve a unit symbol, trying exact names before prefix + unit """
+    if symbol in UNITS:
+        return UNITS[symbol]
+    for prefix, scale in BINARY_PREFIXES.items():
+        rest = symbol[len(prefix):]
+        if symbol.startswith(prefix) and rest in BINARY_PREFIXABLE:
+            return scale * UNITS[rest][0], UNITS[rest][1]
+    for prefix, scale in SI_PREFIXES.items():
+        rest = symbol[len(prefix):]
+        if symbol.startswith(prefix) and rest in PREFIXABLE:
+            return scale * UNITS[rest][0], UNITS[rest][1]
+    raise ValueError(f"Unknown unit: {symbol!r}")
+
+def _tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unexpected character in unit {expression!r} at position {position}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+class _UnitParser:
+    """Recursive-descent parser: expr := power (('*' | '/' | ' ') power)*,
+    power := atom (('^' | '**') integer)?, atom := unit | '1' | '(' expr ')'."""
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def error(self):
+        return ValueError(f"Cannot parse unit expression {self.expression!r}")
+
+    def checked(self, factor):
+        # Float products overflow to inf (or underflow to 0) silently
+        if not math.isfinite(factor) or not factor:
+            raise ValueError(f"Unit expression {self.expression!r} is out of range")
+        return factor
+
+    def parse(self):
+        if not self.tokens:
+            raise self.error()
+        result = self.expr()
+        if self.position != len(self.tokens):
+            raise self.error()
+        return result
+
+    def expr(self):
+        factor, dims = self.power()
+        while True:
+            kind, value = self.peek()
+            if value in ("*", "·", "/"):
+                self.take()
+            elif kind != "name" and value != "(":
+                return factor, dims
+            other_factor, other_dims = self.power()
+            if value == "/":
+                factor, dims = self.checked(factor / other_factor), tuple(a - b for a, b in zip(dims, other_dims))
+            else:
+                # Explicit '*' or juxtaposition as in "N m"
+                factor, dims = self.checked(factor * other_factor), tuple(a + b for a, b in zip(dims, other_dims))
+
+    def power(self):
+        factor, dims = self.atom()
+        if self.peek()[1] in ("^", "**"):
+            self.take()
+            kind, value = self.take()
+            if kind != "number":
+                raise self.error()
+            exponent = int(value)
+            if abs(exponent) > MAX_UNIT_EXPONENT:
+                raise ValueError(f"Exponent {exponent} in {self.expression!r} is out of range "
+                                 f"(at most {MAX_UNIT_EXPONENT} either way)")
+            try:
+                # float() so binary prefixes do not build huge exact ints
+                factor = self.checked(float(factor) ** exponent)
+            except OverflowError:
+                raise ValueError(f"Unit expression {self.expression!r} is out of range") from None
+            dims = tuple(d * exponent for d in dims)
+        return factor, dims
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "name":
+            return _lookup_unit(value)
+        if kind == "number" and value == "1":
+            return 1, _dimension()
+        if value == "(":
+            result = self.expr()
+            if self.take()[1] != ")":
+                raise self.error()
+            return result
+        raise self.error()
+
+@lru_cache(maxsize=1024)
+def parse_unit(expression):
+    """ Compile a unit expression to (factor to SI, dimension exponents).
+        Results are cached, so repeated conversions of the same string skip parsing. """
+    return _UnitParser(expression).parse()
+
+def format_dimensions(dims):
+    """ Render a dimension vector as e.g. kg·m·s^-2 ("1" when dimensionless) """
+    parts = [name if exponent == 1 else f"{name}^{exponent}"
+             for name, exponent in zip(BASE_DIMENSIONS, dims) if exponent]
+    return "·".join(parts) or "1"
+
+@lru_cache(maxsize=1024)
+def unit_conversion_factor(from_expression, to_expression):
+    """ Multiplier from one unit expression to another, after checking their dimensions match """
+    from_factor, from_dims = parse_unit(from_expression)
+    to_factor, to_dims = parse_unit(to_expression)
+    if from_dims != to_dims:
+        raise ValueError(f"Cannot convert {from_expression} [{format_dimensions(from_dims)}] "
+                         f"to {to_expression} [{format_dimensions(to_dims)}]")
+    factor = from_factor / to_factor
+    if not math.isfinite(factor) or not factor:
+        raise ValueError(f"Conversion factor from {from_expression} to {to_expression} is out of range")
+    return factor
+
+def convert_units(value, from_expression, to_expression):
+    """ Convert a value (or NumPy array) between compound unit expressions, e.g. 'km/h' -> 'm/s' """
+    return value * unit_conversion_factor(from_expression, to_expression)
+
+# Rows per chunk in file mode; memory stays bounded by chunk size x workers
+CHUNK_SIZE = 10000
+
+def _chunks(reader, size):
+    while True:
+        chunk = list(islice(reader, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _convert_chunk(rows, positions, scale, offset, reciprocal):
+    """ Convert the cells at the given column positions of a chunk of CSV rows.
+        Blank or non-numeric cells are left as they are and counted as skipped. """
+    skipped = 0
+    for row in rows:
+        for i in positions:
+            try:
+                value = float(row[i])
+                row[i] = repr(scale / value if reciprocal else value * scale + offset)
+            except (ValueError, IndexError, ZeroDivisionError):
+                skipped += 1
+    return rows, skipped
+
+def stream_convert(source, target, category, from_unit, to_unit, columns, chunk_size=CHUNK_SIZE, workers=1):
+    """ Stream CSV rows from source to target, converting the named columns.
+        Only a few chunks are held in memory at a time, so input size is unbounded.
+        Returns (rows, skipped cells). """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    repeated = sorted({column for column in columns if columns.count(column) > 1})
+    if repeated:
+        # Each repeat would convert the column again
+        raise ValueError(f"Column(s) given more than once: {', '.join(repeated)}")
+    reader = csv.reader(source)
+    writer = csv.writer(target)
+
+    header = next(reader, None)
+    if header is None:
+        return 0, 0
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"Column(s) not in the CSV header: {', '.join(missing)}")
+    positions = [header.index(column) for column in columns]
+    coefficients = conversion_coefficients(category, from_unit, to_unit)
+    writer.writerow(header)
+
+    rows = skipped = 0
+    if workers <= 1:
+        for chunk in _chunks(reader, chunk_size):
+            converted, chunk_skipped = _convert_chunk(chunk, positions, *coefficients)
+            writer.writerows(converted)
+            rows += len(converted)
+            skipped += chunk_skipped
+        return rows, skipped
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Keep a bounded number of chunks in flight and write them back in order
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in _chunks(reader, chunk_size):
+            pending.append(pool.submit(_convert_chunk, chunk, positions, *coefficients))
+            if len(pending) < workers * 2:
+                continue
+            converted, chunk_skipped = pending.popleft().result()
+            writer.writerows(converted)
+            rows += len(converted)
+            skipped += chunk_skipped
+        while pending:
+            converted, chunk_skipped = pending.popleft().result()
+            writer.writerows(converted)
+            rows += len(converted)
+            skipped += chunk_skipped
+    return rows, skipped
+
+def _positive_int(text):
+    """ argparse type for counts that must be at least 1 """
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Convert columns of a CSV file (or stdin) from one unit to another.")
+    parser.add_argument("input", nargs="?", default="-", help="CSV file to read, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="CSV file to write, or - for stdout")
+    parser.add_argument("--category", required=True, choices=list(CATEGORIES))
+    parser.add_argument("--from", dest="from_unit", required=True, help="unit of the input values")
+    parser.add_argument("--to", dest="to_unit", required=True, help="unit to convert to")
+    parser.add_argument("--column", dest="columns", action="append", required=True,
+                        help="column to convert (repeat for several)")
+    parser.add_argument("--chunk-size", type=_positive_int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=_positive_int, default=1, help="processes used to convert chunks")
+    return parser
+
+def run_cli(argv=None):
+    """ File mode: python Unit_converter.py data.csv --category Length --from Mile --to Kilometer --column distance """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    for unit in (args.from_unit, args.to_unit):
+        if unit not in CATEGORIES[args.category]:
+            parser.error(f"unknown {args.category} unit: {unit!r}")
+
+    source = target = None
+    started = time.perf_counter()
+    try:
+        # Input first, so a missing input file does not truncate the output
+        source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+        target = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+        rows, skipped = stream_convert(source, target, args.category, args.from_unit, args.to_unit,
+                                       args.columns, args.chunk_size, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if source not in (None, sys.stdin):
+            source.close()
+        if target not in (None, sys.stdout):
+            target.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"Converted {rows} rows in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} rows/sec)", file=sys.stderr)
+    if skipped:
+        print(f"Skipped {skipped} blank or non-numeric cells", file=sys.stderr)
+    return 0
+
 if __name__ == "__main__":
+    # Arguments select file mode; `streamlit run Unit_converter.py` passes none
+    if len(sys.argv) > 1:
+        sys.exit(run_cli())
     main()
\ No newline at end of file
@@ -0,0 +1,69 @@
+# bench_library_import.py
+# Measures bulk CSV import throughput and peak memory for a storage backend.
+#
+# Usage: python benchmarks/bench_library_import.py [--rows 1000000] [--backend sqlite|json]
+
+import argparse
+import csv
+import os
+import random
+import resource
+import string
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_library_search import FIRST_NAMES, LAST_NAMES, GENRES
+from library_manager import BOOK_FIELDS, import_books, open_storage
+
+
+def write_csv(path, rows, seed=7):
+    """Stream synthetic books to a CSV file, with a few duplicate and invalid rows."""
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(BOOK_FIELDS)
+        row = None
+        for i in range(rows):
+            if i % 1000 == 999:
+                # Repeat the previous row to exercise deduplication
+                writer.writerow(row)
+                continue
+            title = "".join(rng.choices(string.ascii_lowercase, k=12)).title()
+            year = rng.randint(1850, 2024) if i % 5000 else "unknown"
+            row = [title, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                   year, rng.choice(GENRES), rng.choice(["yes", "no"])]
+            writer.writerow(row)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (Linux reports KB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--backend", choices=["sqlite", "json"], default="sqlite")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "books.csv")
+        write_csv(source, args.rows)
+        baseline_mb = peak_rss_mb()
+
+        storage = open_storage(os.path.join(tmp, "library.db" if args.backend == "sqlite" else "library.txt"))
+        storage.load()
+        report = import_books(storage, source)
+        storage.save()
+        storage.close()
+
+    print(f"{args.rows:,} rows into {args.backend}: {report['seconds']:.1f}s "
+          f"({report['rows'] / report['seconds']:,.0f} rows/sec)")
+    print(f"imported {report['imported']:,}, duplicates {report['duplicates']:,}, invalid {report['invalid']:,}")
+    print(f"peak RSS {peak_rss_mb():.0f} MB (before import {baseline_mb:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# bench_library_memory.py
+# Reports bytes per book for dict records versus Book records, and for a full BookCatalog.
+#
+# Usage: python benchmarks/bench_library_memory.py [--books 100000]
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_library_search import make_books
+from library_manager import Book, BookCatalog
+
+
+def measure(build):
+    """Return (result, bytes allocated and still held by build())."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Round-trip through JSON so strings and ints are fresh objects, as after load_library
+    data = json.dumps(make_books(args.books))
+
+    dicts, dict_bytes = measure(lambda: json.loads(data))
+    records, book_bytes = measure(lambda: [Book.from_dict(book) for book in json.loads(data)])
+    catalog, catalog_bytes = measure(lambda: BookCatalog(json.loads(data)))
+
+    count = args.books
+    print(f"{count:,} books")
+    print(f"{'dict records':<26}{dict_bytes / count:>10.0f} bytes/book")
+    print(f"{'Book records':<26}{book_bytes / count:>10.0f} bytes/book")
+    print(f"{'BookCatalog with indexes':<26}{catalog_bytes / count:>10.0f} bytes/book")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# bench_library_search.py
+# Compares BookCatalog lookups against the original linear scan over a list of dicts,
+# and times the ranked fuzzy search.
+#
+# Usage: python benchmarks/bench_library_search.py [--sizes 10000 100000 1000000]
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library_manager import BookCatalog
+
+FIRST_NAMES = ["James", "Mark", "Robert", "Jane", "Agatha", "Leo", "Toni", "Haruki", "Ursula", "Isaac"]
+LAST_NAMES = ["Clear", "Manson", "Martin", "Austen", "Christie", "Tolstoy", "Morrison", "Murakami", "Le Guin", "Asimov"]
+GENRES = ["Fiction", "Self-Help", "Science", "History", "Fantasy", "Mystery"]
+
+
+def make_books(count, seed=42):
+    """Generate count synthetic books with mostly unique titles."""
+    rng = random.Random(seed)
+    books = []
+    for i in range(count):
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))) for _ in range(3)]
+        books.append({
+            "title": f"{' '.join(words).title()} {i}",
+            "author": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "year": rng.randint(1850, 2024),
+            "genre": rng.choice(GENRES),
+            "read": rng.random() < 0.5,
+        })
+    return books
+
+
+def linear_search(library, key, term):
+    """The original search_book loop."""
+    term = term.lower()
+    return [book for book in library if term in book[key].lower()]
+
+
+def linear_find_title(library, title):
+    """The original remove_book lookup, without the pop."""
+    for i, book in enumerate(library):
+        if book["title"].lower() == title.lower():
+            return i
+    return None
+
+
+def timed(func, repeat):
+    """Return the mean wall time of func() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(size, repeat):
+    books = make_books(size)
+    rng = random.Random(size)
+    target = rng.choice(books)
+    title = target["title"]
+    fragment = title.split()[1].lower()
+    author = target["author"].split()[1]
+
+    start = time.perf_counter()
+    catalog = BookCatalog(books)
+    # The indexes are built on first use; pay for them here so the table shows warm queries
+    catalog.find("title", title)
+    catalog.search("title", fragment)
+    build_s = time.perf_counter() - start
+
+    cases = [
+        ("exact title", lambda: linear_find_title(books, title), lambda: catalog.find("title", title)),
+        ("title substring", lambda: linear_search(books, "title", fragment), lambda: catalog.search("title", fragment)),
+        ("author substring", lambda: linear_search(books, "author", author), lambda: catalog.search("author", author)),
+    ]
+
+    print(f"\n{size:,} books (index build {build_s:.2f}s)")
+    print(f"{'query':<18}{'linear ms':>12}{'indexed ms':>12}{'speedup':>10}")
+    for name, linear, indexed in cases:
+        linear_ms = timed(linear, repeat)
+        indexed_ms = timed(indexed, repeat)
+        print(f"{name:<18}{linear_ms:>12.3f}{indexed_ms:>12.3f}{linear_ms / indexed_ms:>9.0f}x")
+
+    # Ranked search has no linear equivalent; report its one-off build and per-query cost
+    misspelt = fragment[1] + fragment[0] + fragment[2:]
+    start = time.perf_counter()
+    catalog.ranked_search(misspelt)
+    ranked_build_s = time.perf_counter() - start
+    ranked_ms = timed(lambda: catalog.ranked_search(f"{misspelt} {author}"), repeat)
+    print(f"{'ranked fuzzy':<18}{'-':>12}{ranked_ms:>12.3f}  (index build {ranked_build_s:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# bench_library_sqlite.py
+# Compares the JSON journal backend with the SQLite backend: startup time and query latency.
+#
+# Usage: python benchmarks/bench_library_sqlite.py [--sizes 10000 100000]
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_library_search import make_books, timed
+from library_manager import JournalStorage, SQLiteStorage, migrate_json_to_sqlite
+
+
+def run(size, repeat):
+    books = make_books(size)
+    title = books[size // 2]["title"]
+    fragment = title.split()[1].lower()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "library.txt")
+        db_path = os.path.join(tmp, "library.db")
+        with open(json_path, "w") as file:
+            json.dump(books, file)
+
+        start = time.perf_counter()
+        migrate_json_to_sqlite(json_path, db_path)
+        migrate_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        journal = JournalStorage(json_path)
+        journal.load()
+        # The catalog builds its indexes and statistics on first use; count them as loading
+        journal.contains(title, "")
+        journal.search("title", fragment)
+        journal.statistics()
+        json_load_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        sqlite = SQLiteStorage(db_path)
+        sqlite_load_ms = (time.perf_counter() - start) * 1000
+
+        print(f"\n{size:,} books (migration {migrate_s:.2f}s)")
+        print(f"{'operation':<18}{'json ms':>12}{'sqlite ms':>12}")
+        print(f"{'load':<18}{json_load_ms:>12.3f}{sqlite_load_ms:>12.3f}")
+
+        cases = [
+            ("exact title", lambda backend: backend.search("title", title)),
+            ("title substring", lambda backend: backend.search("title", fragment)),
+            ("statistics", lambda backend: backend.statistics()),
+            ("first 20 rows", lambda backend: [book for _, book in zip(range(20), backend)]),
+        ]
+        for name, query in cases:
+            json_ms = timed(lambda: query(journal), repeat)
+            sqlite_ms = timed(lambda: query(sqlite), repeat)
+            print(f"{name:<18}{json_ms:>12.3f}{sqlite_ms:>12.3f}")
+        sqlite.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# bench_password_audit.py
+# Passwords/sec for check_password_strength in a loop vs the bulk audit_passwords API.
+#
+# Usage: python benchmarks/bench_password_audit.py [--size 1000000] [--workers 1 4]
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Password_Strenght_Meter import PasswordStrengthMeter, audit_passwords
+
+ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*-_."
+
+
+def make_passwords(count, seed=0):
+    """Dump-like mix: short lowercase words, digits-only PINs and random strings."""
+    rng = random.Random(seed)
+    passwords = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            passwords.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))))
+        elif kind < 0.4:
+            passwords.append("".join(rng.choices(string.digits, k=rng.randint(4, 8))))
+        else:
+            passwords.append("".join(rng.choices(ALPHABET, k=rng.randint(6, 16))))
+    return passwords
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    passwords = make_passwords(args.size)
+    meter = PasswordStrengthMeter()
+    print(f"{args.size:,} passwords, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    for password in passwords:
+        meter.check_password_strength(password)
+    elapsed = time.perf_counter() - start
+    print(f"  {'check_password_strength loop':<32}{args.size / elapsed:>12,.0f} passwords/sec")
+
+    for workers in dict.fromkeys(args.workers):
+        report = audit_passwords(passwords, workers=workers)
+        print(f"  {f'audit_passwords workers={workers}':<32}{report['per_second']:>12,.0f} passwords/sec")
+
+
+if __name__ == "__main__":
+    main()
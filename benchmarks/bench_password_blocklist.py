@@ -0,0 +1,83 @@
+# bench_password_blocklist.py
+# Breached-password lookups: mmap'd BreachedPasswordIndex vs a Python set of the same list
+# (build time, open time, memory and lookup latency).
+#
+# Usage: python benchmarks/bench_password_blocklist.py [--size 2000000]
+
+import argparse
+import hashlib
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Password_Strenght_Meter import BreachedPasswordIndex
+
+
+def make_hash_lines(count, seed=0):
+    """HIBP-style "SHA1HEX:count" lines; returns (lines, a sample of the plaintexts)."""
+    rng = random.Random(seed)
+    lines = []
+    sample = []
+    for i in range(count):
+        password = "".join(rng.choices(string.ascii_letters + string.digits, k=rng.randint(6, 12)))
+        if i % 1000 == 0:
+            sample.append(password)
+        lines.append(f"{hashlib.sha1(password.encode()).hexdigest().upper()}:{rng.randint(1, 5000)}")
+    return lines, sample
+
+
+def per_lookup_us(contains, passwords, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for password in passwords:
+            contains(password)
+    return (time.perf_counter() - start) / (repeat * len(passwords)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    lines, hits = make_hash_lines(args.size)
+    misses = [password + "~" for password in hits]
+    path = os.path.join(tempfile.mkdtemp(), "breached.idx")
+
+    start = time.perf_counter()
+    BreachedPasswordIndex.build(lines, path)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = BreachedPasswordIndex(path)
+    open_ms = (time.perf_counter() - start) * 1000
+    assert all(password in index for password in hits)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    hashes = {line[:40] for line in lines}
+    set_s = time.perf_counter() - start
+    set_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+
+    def in_set(password):
+        return hashlib.sha1(password.encode()).hexdigest().upper() in hashes
+
+    print(f"{args.size:,} breached hashes")
+    print(f"  {'':<24}{'build/load':>12}{'memory':>12}{'hit us':>10}{'miss us':>10}")
+    print(f"  {'mmap sorted index':<24}{build_s:>10.1f} s{os.path.getsize(path) / 1e6:>9.1f} MB"
+          f"{per_lookup_us(index.__contains__, hits):>10.2f}{per_lookup_us(index.__contains__, misses):>10.2f}")
+    print(f"  {'Python set of hashes':<24}{set_s:>10.1f} s{set_mb:>9.1f} MB"
+          f"{per_lookup_us(in_set, hits):>10.2f}{per_lookup_us(in_set, misses):>10.2f}")
+    print(f"  Opening the index takes {open_ms:.2f} ms; its memory is file-backed pages, read on demand")
+    index.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# bench_password_entropy.py
+# Per-keystroke latency of the pattern-aware entropy estimator: every prefix of each
+# password is estimated as if typed, then retyped to measure the memo cache. Long and
+# repetitive pastes are timed separately against a per-estimate budget.
+#
+# Usage: python benchmarks/bench_password_entropy.py [--size 500] [--max-ms 5] [--max-paste-ms 250]
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Password_Strenght_Meter as psm
+
+WORDS = ["password", "dragon", "monkey", "summer", "michael", "letmein", "qwerty", "sunshine"]
+
+
+def make_passwords(count, seed=0):
+    """Human-style passwords (word + digits + symbol, l33t, walks, dates) and random strings."""
+    rng = random.Random(seed)
+    passwords = []
+    for _ in range(count):
+        kind = rng.random()
+        word = rng.choice(WORDS)
+        if kind < 0.3:
+            passwords.append(word.capitalize() + str(rng.randint(0, 9999)) + rng.choice("!@#$"))
+        elif kind < 0.45:
+            passwords.append(word.replace("a", "@").replace("o", "0").replace("e", "3") + str(rng.randint(1950, 2025)))
+        elif kind < 0.55:
+            passwords.append(rng.choice(["qwertyuiop", "asdfghjkl", "1qaz2wsx", "zxcvbnm"]) + word)
+        else:
+            passwords.append("".join(rng.choices(string.ascii_letters + string.digits + "!@#$%",
+                                                 k=rng.randint(8, 20))))
+    return passwords
+
+
+def make_pastes(seed=0):
+    """Long and repetitive inputs, e.g. a key or a document pasted into the field."""
+    rng = random.Random(seed)
+    printable = string.ascii_letters + string.digits + string.punctuation
+    pastes = {}
+    for length in (100, 300, 1000, 10000):
+        pastes[f"'a' * {length}"] = "a" * length
+        pastes[f"'ab' * {length // 2}"] = "ab" * (length // 2)
+        pastes[f"'Password1!' * {length // 10}"] = "Password1!" * (length // 10)
+        pastes[f"'qwerty123' walk x{length // 9}"] = "qwerty123" * (length // 9)
+        pastes[f"random {length}"] = "".join(rng.choices(printable, k=length))
+    return pastes
+
+
+def keystroke_ms(passwords):
+    """Milliseconds per estimate over every prefix of every password."""
+    timings = []
+    for password in passwords:
+        for end in range(1, len(password) + 1):
+            start = time.perf_counter()
+            psm.estimate_guesses(password[:end])
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=500)
+    parser.add_argument("--max-ms", type=float, default=5, help="budget for the p99 uncached keystroke")
+    parser.add_argument("--max-paste-ms", type=float, default=250, help="budget for any single long paste")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    psm.ranked_dictionaries()
+    print(f"Loading dictionaries: {(time.perf_counter() - start) * 1000:.1f} ms (once per process)")
+
+    passwords = make_passwords(args.size)
+    # Room for every prefix, so the second pass is served entirely from the memo cache
+    psm.GUESS_CACHE_SIZE = sum(map(len, passwords)) * 2
+    p99 = {}
+    for label in ("typing (uncached)", "retyping (cached)"):
+        timings = sorted(keystroke_ms(passwords))
+        p99[label] = timings[int(len(timings) * 0.99)]
+        print(f"  {label:<20} mean {statistics.fmean(timings):.3f} ms  p99 {p99[label]:.3f} ms"
+              f"  max {timings[-1]:.3f} ms over {len(timings):,} keystrokes")
+
+    slowest = 0.0
+    print("Long and repetitive pastes (uncached):")
+    for label, paste in make_pastes().items():
+        start = time.perf_counter()
+        psm.estimate_guesses(paste)
+        elapsed = (time.perf_counter() - start) * 1000
+        slowest = max(slowest, elapsed)
+        print(f"  {label:<28}{elapsed:>10.2f} ms")
+
+    failed = False
+    if p99["typing (uncached)"] > args.max_ms:
+        print(f"FAIL: p99 keystroke {p99['typing (uncached)']:.2f} ms exceeds the {args.max_ms:.0f} ms budget")
+        failed = True
+    if slowest > args.max_paste_ms:
+        print(f"FAIL: slowest paste {slowest:.1f} ms exceeds the {args.max_paste_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
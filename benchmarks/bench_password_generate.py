@@ -0,0 +1,49 @@
+# bench_password_generate.py
+# Passwords/sec for generate_strong_password in a loop vs the batch
+# generate_strong_passwords API and the streaming `generate` command.
+#
+# Usage: python benchmarks/bench_password_generate.py [--size 1000000] [--length 12]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Password_Strenght_Meter import PasswordPolicy, PasswordStrengthMeter, write_passwords
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--length", type=int, default=12)
+    args = parser.parse_args()
+
+    meter = PasswordStrengthMeter(breached_path=None)
+    print(f"{args.size:,} passwords of length {args.length}")
+
+    start = time.perf_counter()
+    for _ in range(args.size):
+        meter.generate_strong_password(args.length)
+    loop_s = time.perf_counter() - start
+    print(f"  {'generate_strong_password loop':<32}{args.size / loop_s:>12,.0f} passwords/sec")
+
+    start = time.perf_counter()
+    passwords = meter.generate_strong_passwords(args.size, args.length)
+    batch_s = time.perf_counter() - start
+    assert len(passwords) == args.size
+    print(f"  {'generate_strong_passwords':<32}{args.size / batch_s:>12,.0f} passwords/sec"
+          f"  ({loop_s / batch_s:.1f}x)")
+
+    path = os.path.join(tempfile.mkdtemp(), "passwords.txt")
+    start = time.perf_counter()
+    write_passwords(args.size, path, PasswordPolicy(args.length))
+    stream_s = time.perf_counter() - start
+    print(f"  {'generate command (to file)':<32}{args.size / stream_s:>12,.0f} passwords/sec")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
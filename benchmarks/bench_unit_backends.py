@@ -0,0 +1,65 @@
+# bench_unit_backends.py
+# Cost and drift of the float, Fraction and Decimal conversion backends.
+#
+# Usage: python benchmarks/bench_unit_backends.py [--size 100000] [--chain 1000] [--precision 28]
+
+import argparse
+import os
+import random
+import sys
+import time
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Unit_converter import BACKENDS, convert_value
+
+CASES = [
+    ("Length", "Mile", "Kilometer"),
+    ("Temperature", "Fahrenheit", "Celsius"),
+    ("Fuel Economy", "Liter per 100 kilometers", "Miles per gallon (UK)"),
+]
+
+
+def round_trip_drift(backend, precision, steps):
+    """Convert 1 Mile to Kilometer and back `steps` times; return the relative error."""
+    value = 1.0 if backend == "float" else Fraction(1) if backend == "fraction" else 1
+    for _ in range(steps):
+        value = convert_value(value, "Length", "Mile", "Kilometer", backend, precision)
+        value = convert_value(value, "Length", "Kilometer", "Mile", backend, precision)
+    return abs(Fraction(str(value)) - 1) if backend == "decimal" else abs(Fraction(value) - 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--chain", type=int, default=1000, help="round trips in the drift test")
+    parser.add_argument("--precision", type=int, default=28, help="Decimal significant digits")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    # Two-decimal readings, as typed into the app
+    readings = [round(rng.uniform(1, 100), 2) for _ in range(args.size)]
+
+    print(f"{args.size:,} conversions per backend (Decimal at {args.precision} digits)")
+    print(f"{'conversion':<62}" + "".join(f"{backend + ' k/s':>14}" for backend in BACKENDS))
+    for category, from_unit, to_unit in CASES:
+        rates = []
+        for backend in BACKENDS:
+            start = time.perf_counter()
+            for value in readings:
+                convert_value(value, category, from_unit, to_unit, backend, args.precision)
+            rates.append(args.size / (time.perf_counter() - start) / 1000)
+        name = f"{category}: {from_unit} -> {to_unit}"
+        print(f"{name:<62}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+    print(f"\nRelative error after {args.chain:,} Mile <-> Kilometer round trips")
+    for backend in BACKENDS:
+        start = time.perf_counter()
+        drift = round_trip_drift(backend, args.precision, args.chain)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"  {backend:<10}{float(drift):>12.3g}{elapsed_ms:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# bench_unit_batch.py
+# Compares convert_batch on a NumPy array with calling the scalar conversions in a Python loop.
+#
+# Usage: python benchmarks/bench_unit_batch.py [--size 1000000]
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Unit_converter import CATEGORIES, convert_batch, convert_fuel_economy, convert_temperature
+
+CASES = [
+    ("Length", "Mile", "Kilometer"),
+    ("Temperature", "Fahrenheit", "Kelvin"),
+    ("Fuel Economy", "Liter per 100 kilometers", "Kilometer per liter"),
+]
+
+
+def scalar_loop(values, category, from_unit, to_unit):
+    """What main() does per value, applied to every reading."""
+    units = CATEGORIES[category]
+    if category == "Temperature":
+        return [convert_temperature(value, from_unit, to_unit) for value in values]
+    if category == "Fuel Economy":
+        return [convert_fuel_economy(value, from_unit, to_unit, units) for value in values]
+    return [value * (units[from_unit] / units[to_unit]) for value in values]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    readings = np.random.default_rng(0).uniform(1, 100, args.size)
+    readings_list = readings.tolist()
+
+    print(f"{args.size:,} readings")
+    print(f"{'conversion':<62}{'loop ms':>10}{'batch ms':>10}{'speedup':>9}")
+    for category, from_unit, to_unit in CASES:
+        start = time.perf_counter()
+        expected = scalar_loop(readings_list, category, from_unit, to_unit)
+        loop_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        result = convert_batch(readings, category, from_unit, to_unit)
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        assert np.allclose(result, expected)
+        name = f"{category}: {from_unit} -> {to_unit}"
+        print(f"{name:<62}{loop_ms:>10.1f}{batch_ms:>10.1f}{loop_ms / batch_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# bench_unit_import.py
+# Cold-start guard for Unit_converter: measures `python -X importtime -c "import Unit_converter"`
+# and fails when the import gets slower than a budget or pulls in heavy packages.
+#
+# Usage: python benchmarks/bench_unit_import.py [--runs 5] [--max-ms 100] [--top 10]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only main() and the Common Conversions table may load these
+HEAVY_MODULES = ("streamlit", "pandas", "numpy", "multiprocessing")
+
+SCRIPT = f"import sys, Unit_converter; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+
+
+def import_profile():
+    """Run one fresh interpreter; return ({module: (self_us, cumulative_us)}, heavy modules loaded)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", SCRIPT],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    heavy = [name for name in result.stdout.strip().split(",") if name]
+    return modules, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=100, help="budget for the median import time")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args()
+
+    # First run warms __pycache__ so every measured run is a normal cold start
+    import_profile()
+    runs = [import_profile() for _ in range(args.runs)]
+    totals = [modules["Unit_converter"][1] / 1000 for modules, _ in runs]
+    median_ms = statistics.median(totals)
+
+    modules, heavy = runs[-1]
+    print(f"import Unit_converter: median {median_ms:.1f} ms over {args.runs} runs "
+          f"(min {min(totals):.1f}, max {max(totals):.1f})")
+    print("Slowest modules by self time (last run):")
+    for name, (self_us, cumulative_us) in sorted(modules.items(), key=lambda item: -item[1][0])[:args.top]:
+        print(f"  {name:<40}{self_us / 1000:>8.1f} ms self{cumulative_us / 1000:>8.1f} ms total")
+
+    failed = False
+    if heavy:
+        print(f"FAIL: importing Unit_converter loaded {', '.join(heavy)}")
+        failed = True
+    if median_ms > args.max_ms:
+        print(f"FAIL: median import time {median_ms:.1f} ms exceeds the {args.max_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+# bench_unit_regression.py
+# Microbenchmarks for the Unit_converter hot paths (scalar, exact, batch, table, unit
+# algebra) compared against a JSON baseline; exits non-zero when a case regresses.
+#
+# Usage: python benchmarks/bench_unit_regression.py [--baseline benchmarks/unit_baseline.json]
+#        [--tolerance 0.3] [--update]
+# The first run (or --update) records the baseline for this machine.
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Unit_converter as uc
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "unit_baseline.json")
+BATCH = np.random.default_rng(0).uniform(1, 100, 100_000)
+
+
+def cases():
+    """name -> (callable, operations per call)"""
+    table = uc.common_conversions.__wrapped__
+    return {
+        "scalar_linear": (lambda: uc.REGISTRY.convert(12.5, "Length", "Mile", "Kilometer"), 1),
+        "scalar_temperature": (lambda: uc.REGISTRY.convert(98.6, "Temperature", "Fahrenheit", "Celsius"), 1),
+        "scalar_fuel": (lambda: uc.REGISTRY.convert(7.5, "Fuel Economy", uc.L100KM, "Miles per gallon (UK)"), 1),
+        "exact_fraction": (lambda: uc.convert_value(12.5, "Length", "Mile", "Kilometer", "fraction"), 1),
+        "exact_decimal": (lambda: uc.convert_value(12.5, "Length", "Mile", "Kilometer", "decimal"), 1),
+        "batch_100k_temperature": (lambda: uc.convert_batch(BATCH, "Temperature", "Fahrenheit", "Kelvin"), len(BATCH)),
+        "table_uncached": (lambda: table("Length", "Mile"), 1),
+        "table_cached": (lambda: uc.common_conversions("Length", "Mile"), 1),
+        "algebra_cached": (lambda: uc.convert_units(3.0, "kN*m/s^2", "W/s"), 1),
+        "algebra_parse": (lambda: uc._UnitParser("kN*m/s^2").parse(), 1),
+    }
+
+
+def measure(function, operations, repeat=5, budget=0.2):
+    """Best-of-`repeat` nanoseconds per operation, with enough loops to fill `budget` seconds."""
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    loops = max(1, int(loops * budget / 0.2))
+    best = min(timer.repeat(repeat=repeat, number=loops))
+    return best / loops / operations * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed slowdown, 0.3 = 30%%")
+    parser.add_argument("--update", action="store_true", help="record the current results as the baseline")
+    args = parser.parse_args()
+
+    results = {name: measure(function, operations) for name, (function, operations) in cases().items()}
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.update:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    regressions = []
+    print(f"{'case':<26}{'ns/op':>12}{'baseline':>12}{'change':>9}")
+    for name, ns in results.items():
+        if baseline and name in baseline:
+            change = ns / baseline[name] - 1
+            flag = "  REGRESSION" if change > args.tolerance else ""
+            print(f"{name:<26}{ns:>12,.1f}{baseline[name]:>12,.1f}{change:>+9.0%}{flag}")
+            if flag:
+                regressions.append(name)
+        else:
+            print(f"{name:<26}{ns:>12,.1f}{'-':>12}{'-':>9}")
+
+    if baseline is None:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "results": results}, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"FAIL: {len(regressions)} case(s) slower than baseline by more than {args.tolerance:.0%}: "
+              f"{', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
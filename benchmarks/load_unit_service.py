@@ -0,0 +1,116 @@
+# load_unit_service.py
+# Load test for unit_converter_service.py: p50/p99 latency and requests/sec.
+#
+# Usage: python benchmarks/load_unit_service.py [--requests 20000] [--concurrency 64] [--distinct 100]
+#        (starts its own server unless --url points at a running one)
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAIRS = [
+    ("Length", "Mile", "Kilometer"),
+    ("Temperature", "Fahrenheit", "Celsius"),
+    ("Mass", "Pound", "Kilogram"),
+    ("Fuel Economy", "Liter per 100 kilometers", "Miles per gallon (US)"),
+]
+
+
+def make_targets(count, distinct, seed=0):
+    """Request paths; `distinct` controls how many different values (cache hot set) appear."""
+    rng = random.Random(seed)
+    values = [round(rng.uniform(1, 100), 2) for _ in range(distinct)]
+    targets = []
+    for _ in range(count):
+        category, from_unit, to_unit = rng.choice(PAIRS)
+        query = urlencode({"category": category, "from": from_unit, "to": to_unit, "value": rng.choice(values)})
+        targets.append(f"/convert?{query}")
+    return targets
+
+
+async def client(host, port, targets, latencies):
+    """One keep-alive connection sending its share of requests back to back."""
+    reader, writer = await asyncio.open_connection(host, port)
+    for target in targets:
+        start = time.perf_counter()
+        writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        await writer.drain()
+        status = await reader.readline()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line == b"\r\n":
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+        if b" 200 " not in status:
+            raise RuntimeError(f"{target}: {status.decode().strip()}")
+    writer.close()
+
+
+async def run(host, port, targets, concurrency):
+    latencies = []
+    shares = [targets[i::concurrency] for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, share, latencies) for share in shares if share))
+    return time.perf_counter() - start, latencies
+
+
+async def wait_for_server(host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="running service, e.g. http://127.0.0.1:8000")
+    parser.add_argument("--port", type=int, default=8765, help="port for the server this script starts")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--distinct", type=int, default=100, help="distinct values per run (cache hot set)")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = "127.0.0.1", args.port
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "unit_converter_service.py"),
+                                   "--host", host, "--port", str(port)], stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_for_server(host, port))
+        targets = make_targets(args.requests, args.distinct)
+        elapsed, latencies = asyncio.run(run(host, port, targets, args.concurrency))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{len(latencies):,} requests, {args.concurrency} connections, {args.distinct} distinct values")
+    print(f"  throughput {len(latencies) / elapsed:,.0f} req/s")
+    print(f"  p50 {quantiles[49] * 1000:.2f} ms   p99 {quantiles[98] * 1000:.2f} ms   max {latencies[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# stress_library_concurrency.py
+# Runs many writer (and reader) processes against one JSON library and checks no change is lost.
+#
+# Usage: python benchmarks/stress_library_concurrency.py [--writers 8] [--ops 200]
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library_manager import JournalStorage
+
+
+def writer(path, worker, ops, seed):
+    """Add ops books, remove roughly a third of them again, compacting often."""
+    rng = random.Random(seed)
+    # A tiny threshold forces compactions to race with other writers' appends
+    storage = JournalStorage(path, compact_every=rng.randint(5, 50))
+    storage.load()
+    kept = []
+    for i in range(ops):
+        title = f"Worker {worker} Book {i}"
+        storage.add({"title": title, "author": f"Writer {worker}", "year": 2000, "genre": "Test", "read": False})
+        kept.append(title)
+        if rng.random() < 0.33:
+            removed = kept.pop(rng.randrange(len(kept)))
+            assert storage.remove_title(removed) is not None, f"lost {removed}"
+    if rng.random() < 0.5:
+        storage.save()
+    storage.close()
+    return kept
+
+
+def reader(path, stop_at):
+    """Keep refreshing a read-only view until stop_at; return how many refreshes ran."""
+    storage = JournalStorage(path)
+    storage.load()
+    refreshes = 0
+    while time.time() < stop_at:
+        storage.refresh()
+        storage.statistics()
+        refreshes += 1
+    return refreshes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--ops", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library.txt")
+        start = time.perf_counter()
+        with multiprocessing.Pool(args.writers + args.readers) as pool:
+            readers = [pool.apply_async(reader, (path, time.time() + 5)) for _ in range(args.readers)]
+            writers = [pool.apply_async(writer, (path, worker, args.ops, worker)) for worker in range(args.writers)]
+            expected = sorted(title for result in writers for title in result.get())
+            refreshes = sum(result.get() for result in readers)
+        elapsed = time.perf_counter() - start
+
+        storage = JournalStorage(path)
+        storage.load()
+        actual = sorted(book["title"] for book in storage)
+
+    total_ops = args.writers * args.ops
+    print(f"{args.writers} writers x {args.ops} adds (+ removes) in {elapsed:.1f}s "
+          f"({total_ops / elapsed:,.0f} adds/sec), {refreshes:,} reader refreshes")
+    if actual != expected:
+        missing = set(expected) - set(actual)
+        extra = set(actual) - set(expected)
+        print(f"FAILED: {len(missing)} missing, {len(extra)} unexpected books")
+        sys.exit(1)
+    print(f"OK: all {len(expected)} surviving books present, nothing lost or duplicated")
+
+
+if __name__ == "__main__":
+    main()
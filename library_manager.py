@@ -2,16 +2,1417 @@
 # A command-line Personal Library Manager that allows users to manage their book collection.
 
 import os
+import re
+import sys
+import csv
+import shlex
+import argparse
 import json
+import marshal
+import sqlite3
+import time
+import heapq
+import math
+import string
+import zlib
+from collections import Counter, defaultdict
+from itertools import islice
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 def clear_screen():
     """Clear the command line screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
-class LibraryManager:
+BOOK_FIELDS = ("title", "author", "year", "genre", "read")
+SORT_KEYS = ("title", "author", "year", "genre")
+
+# Shared int objects for publication years; a JSON load otherwise creates one per book
+_YEARS = {}
+
+class Book:
+    """
+    Compact record for one book.
+
+    A five-key dict costs a few hundred bytes per book; with __slots__ a
+    record is a fixed 72 bytes. Author and genre strings are interned and
+    years shared, since both repeat heavily across a catalog. Books still
+    support book["title"], keys() and dict(book), so code written against
+    the old dict records keeps working.
+    """
+
+    __slots__ = BOOK_FIELDS
+
+    def __init__(self, title, author, year, genre, read):
+        self.title = title
+        self.author = sys.intern(author)
+        self.year = _YEARS.setdefault(year, year)
+        self.genre = sys.intern(genre)
+        self.read = bool(read)
+
+    @classmethod
+    def from_dict(cls, book):
+        """Build a Book from a dict record (as stored in library.txt)."""
+        if isinstance(book, cls):
+            return book
+        return cls(book["title"], book["author"], book["year"], book["genre"], book["read"])
+
+    def __getitem__(self, field):
+        if field not in BOOK_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def keys(self):
+        return BOOK_FIELDS
+
+    def __eq__(self, other):
+        if isinstance(other, (Book, dict)):
+            return all(self[field] == other[field] for field in BOOK_FIELDS)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Book({', '.join(repr(self[field]) for field in BOOK_FIELDS)})"
+
+def _sort_value(book, sort_key):
+    """Case-insensitive sort value for one field of a book."""
+    value = book[sort_key]
+    return value.casefold() if isinstance(value, str) else value
+
+# Whitespace ignored around titles and authors; spelt out so SQL can trim the same set
+_KEY_WHITESPACE = " \t\n\v\f\r"
+_SQL_KEY_WHITESPACE = "char(32, 9, 10, 11, 12, 13)"
+
+def _match_key(text):
+    """Case-folded text without surrounding whitespace: how titles and authors are matched."""
+    return text.strip(_KEY_WHITESPACE).casefold()
+
+def _split_genres(genre):
+    """Split a genre field such as "Self-Help, Psychology" into its parts."""
+    return {part.strip() for part in genre.split(",") if part.strip()}
+
+class LibraryStats:
+    """
+    Running aggregates over a collection of books.
+
+    Counts are grouped by kind ("total", "read", "genre", "author", "decade",
+    "year") and adjusted on every add and remove, so a summary never needs a
+    pass over the books themselves.
+    """
+
+    def __init__(self):
+        self.counts = defaultdict(Counter)
+
+    @classmethod
+    def from_books(cls, books):
+        """
+        Aggregate many books at once.
+
+        Counts one field at a time over the whole batch, which is several
+        times faster than calling add() per book when loading a catalog.
+
+        Returns:
+            LibraryStats: Aggregates equal to adding every book in turn
+        """
+        stats = cls()
+        books = list(books)
+        if not books:
+            return stats
+        counts = stats.counts
+        counts["total"][""] = len(books)
+        read = sum(1 for book in books if book.read)
+        if read:
+            counts["read"][""] = read
+        counts["author"] = Counter(book.author for book in books)
+        years = counts["year"] = Counter(book.year for book in books)
+        decades = counts["decade"]
+        for year, count in years.items():
+            decades[year // 10 * 10] += count
+        genres = counts["genre"]
+        for genre, count in Counter(book.genre for book in books).items():
+            for part in _split_genres(genre):
+                genres[part] += count
+        return stats
+
+    @staticmethod
+    def keys(book):
+        """Return the (kind, key) counters a book contributes to."""
+        year = book["year"]
+        keys = [("total", ""), ("author", book["author"]), ("decade", year // 10 * 10), ("year", year)]
+        if book["read"]:
+            keys.append(("read", ""))
+        keys.extend(("genre", genre) for genre in _split_genres(book["genre"]))
+        return keys
+
+    def add(self, book, sign=1):
+        """Count a book in (sign=1) or out (sign=-1) of the aggregates."""
+        for kind, key in self.keys(book):
+            counter = self.counts[kind]
+            counter[key] += sign
+            if not counter[key]:
+                del counter[key]
+
+    def remove(self, book):
+        """Count a book out of the aggregates."""
+        self.add(book, -1)
+
+    def items(self):
+        """Yield (kind, key, count) for every non-zero counter."""
+        for kind, counter in self.counts.items():
+            for key, count in counter.items():
+                yield kind, key, count
+
+    def summary(self, top=5):
+        """
+        Summarise the aggregates.
+
+        Args:
+            top (int): How many genres and authors to list
+
+        Returns:
+            dict: total, read, oldest, newest, genres, authors and decades
+        """
+        years = self.counts["year"]
+        return {
+            "total": self.counts["total"][""],
+            "read": self.counts["read"][""],
+            "oldest": min(years) if years else None,
+            "newest": max(years) if years else None,
+            "genres": self.counts["genre"].most_common(top),
+            "authors": self.counts["author"].most_common(top),
+            "decades": sorted(self.counts["decade"].items())
+        }
+
+def _trigrams(text):
+    """Return the set of 3-character substrings of an already case-folded string."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _tokenize(text):
+    """Split text into case-folded words."""
+    return re.findall(r"\w+", text.casefold())
+
+def _deletes(word):
+    """All strings obtained by deleting one character from word."""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+def _edits(word):
+    """
+    All strings one insertion, deletion, substitution or adjacent swap away from word.
+
+    Inserted and substituted characters are ASCII letters, digits and the
+    characters of word itself.
+    """
+    letters = set(string.ascii_lowercase + string.digits + word)
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    edits = {head + tail[1:] for head, tail in splits if tail}
+    edits.update(head + tail[1] + tail[0] + tail[2:] for head, tail in splits if len(tail) > 1)
+    edits.update(head + letter + tail[1:] for head, tail in splits if tail for letter in letters)
+    edits.update(head + letter + tail for head, tail in splits for letter in letters)
+    edits.discard(word)
+    return edits
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insertion, deletion, substitution or adjacent swap."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    return a[i + 1:] == b[i + 1:] or (a[i + 2:] == b[i + 2:] and a[i:i + 2] == b[i:i + 2][::-1])
+
+class RankedIndex:
+    """
+    BM25 word index over title, author and genre with typo tolerance.
+
+    Term frequencies are weighted per field (a title hit counts more than a
+    genre hit). Query words of FUZZY_MIN_LENGTH or more characters that are
+    not in the vocabulary match words one edit away instead; candidates come
+    from a precomputed single-deletion index (as in SymSpell) rather than a
+    comparison against the whole vocabulary, and count for FUZZY_WEIGHT of
+    an exact hit.
+    """
+
+    FIELD_WEIGHTS = {"title": 3.0, "author": 2.0, "genre": 1.0}
+    K1 = 1.2
+    B = 0.75
+    FUZZY_MIN_LENGTH = 4
+    FUZZY_WEIGHT = 0.5
+
     def __init__(self):
-        self.library = []
-        self.file_path = "library.txt"
+        self.postings = {}
+        self.lengths = {}
+        self.total_length = 0.0
+        self._deletes = {}
+
+    def _weighted_terms(self, book):
+        """Return ({word: weighted frequency}, weighted length) for a book."""
+        terms = Counter()
+        for field, weight in self.FIELD_WEIGHTS.items():
+            for word in _tokenize(book[field]):
+                terms[word] += weight
+        return terms, sum(terms.values())
+
+    def add(self, book_id, book):
+        """Index a book."""
+        terms, length = self._weighted_terms(book)
+        self.lengths[book_id] = length
+        self.total_length += length
+        for word, frequency in terms.items():
+            postings = self.postings.get(word)
+            if postings is None:
+                postings = self.postings[word] = {}
+                if len(word) >= self.FUZZY_MIN_LENGTH:
+                    for variant in _deletes(word):
+                        self._deletes.setdefault(variant, set()).add(word)
+            postings[book_id] = frequency
+
+    def remove(self, book_id, book):
+        """Drop a book from the index."""
+        terms, _ = self._weighted_terms(book)
+        self.total_length -= self.lengths.pop(book_id)
+        for word in terms:
+            postings = self.postings[word]
+            del postings[book_id]
+            if not postings:
+                self._drop_word(word)
+
+    def remove_ids(self, book_ids):
+        """Drop several books by id alone, with one pass over the vocabulary."""
+        book_ids = self.lengths.keys() & book_ids
+        if not book_ids:
+            return
+        for book_id in book_ids:
+            self.total_length -= self.lengths.pop(book_id)
+        for word, postings in list(self.postings.items()):
+            for book_id in postings.keys() & book_ids:
+                del postings[book_id]
+            if not postings:
+                self._drop_word(word)
+
+    def _drop_word(self, word):
+        """Remove a word that no book contains any more from the vocabulary."""
+        del self.postings[word]
+        if len(word) >= self.FUZZY_MIN_LENGTH:
+            for variant in _deletes(word):
+                words = self._deletes[variant]
+                words.discard(word)
+                if not words:
+                    del self._deletes[variant]
+
+    def state(self):
+        """Return the index contents as plain dicts, sets and numbers (marshal-friendly)."""
+        return self.postings, self.lengths, self.total_length, self._deletes
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild an index from the result of state()."""
+        index = cls()
+        index.postings, index.lengths, index.total_length, index._deletes = state
+        return index
+
+    def expand(self, word):
+        """
+        Find vocabulary words matching a query word.
+
+        Returns:
+            dict: {vocabulary word: weight}, 1.0 for an exact hit
+        """
+        if word in self.postings:
+            # A correctly spelt word should not be outranked by rare near-misses
+            return {word: 1.0}
+        matches = {}
+        if len(word) < self.FUZZY_MIN_LENGTH:
+            return matches
+
+        candidates = set(self._deletes.get(word, ()))
+        for variant in _deletes(word):
+            if variant in self.postings:
+                candidates.add(variant)
+            candidates.update(self._deletes.get(variant, ()))
+        for candidate in candidates:
+            if _within_one_edit(word, candidate):
+                matches[candidate] = self.FUZZY_WEIGHT
+        return matches
+
+    def search(self, query, k=10):
+        """
+        Score books against query with BM25.
+
+        Returns:
+            list: Up to k (score, book id) pairs, best first
+        """
+        if not self.lengths:
+            return []
+        total_docs = len(self.lengths)
+        average_length = self.total_length / total_docs
+
+        scores = defaultdict(float)
+        for word in set(_tokenize(query)):
+            # Several spellings of one query word may hit the same book; keep the best
+            best = {}
+            for term, weight in self.expand(word).items():
+                postings = self.postings[term]
+                idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for book_id, frequency in postings.items():
+                    norm = self.K1 * (1 - self.B + self.B * self.lengths[book_id] / average_length)
+                    score = weight * idf * frequency * (self.K1 + 1) / (frequency + norm)
+                    if score > best.get(book_id, 0.0):
+                        best[book_id] = score
+            for book_id, score in best.items():
+                scores[book_id] += score
+
+        return heapq.nlargest(k, ((score, book_id) for book_id, score in scores.items()))
+
+class BookCatalog:
+    """
+    In-memory book collection with incrementally maintained indexes.
+
+    Books are kept in insertion order under an internal integer id. For each
+    searchable field a hash index on _match_key (exact match) and a trigram
+    index over the distinct values (substring match) let lookups touch only
+    the handful of values that can match. These indexes and the running
+    statistics are built on first use and then updated on every add and
+    remove, so a one-shot command only pays for the index it actually uses.
+    """
+
+    SEARCH_FIELDS = ("title", "author")
+
+    def __init__(self, books=()):
+        self._books = {}
+        self._next_id = 0
+        self._sorted = {}
+        # Built on the first statistics(), ranked search, lookup and substring
+        # search respectively, then kept up to date
+        self._stats = None
+        self._ranked = None
+        self._exact = None
+        self._grams = None
+        for book in books:
+            self.add(book)
+
+    def __len__(self):
+        return len(self._books)
+
+    def __iter__(self):
+        return iter(self._books.values())
+
+    def add(self, book):
+        """
+        Add a book and index it.
+
+        Args:
+            book (dict or Book): Book record; dicts are converted to Book
+
+        Returns:
+            int: Internal id of the new book
+        """
+        book = Book.from_dict(book)
+        book_id = self._next_id
+        self._next_id += 1
+        self._books[book_id] = book
+        self._sorted.clear()
+        if self._stats is not None:
+            self._stats.add(book)
+        if self._ranked is not None:
+            self._ranked.add(book_id, book)
+        if self._exact is not None:
+            self._index(book_id, book)
+        return book_id
+
+    def _index(self, book_id, book):
+        """Add a book to the hash index, and to the trigram index if it is built."""
+        for field in self.SEARCH_FIELDS:
+            key = _match_key(book[field])
+            ids = self._exact[field].setdefault(key, [])
+            if not ids and self._grams is not None:
+                grams = self._grams[field]
+                for gram in _trigrams(key):
+                    grams.setdefault(gram, set()).add(key)
+            ids.append(book_id)
+
+    def remove(self, book_id):
+        """
+        Remove a book by internal id and drop it from every index.
+
+        Returns:
+            Book: The removed book
+        """
+        book = self._books.pop(book_id)
+        self._sorted.clear()
+        if self._stats is not None:
+            self._stats.remove(book)
+        if self._ranked is not None:
+            self._ranked.remove(book_id, book)
+        if self._exact is None:
+            return book
+
+        for field in self.SEARCH_FIELDS:
+            key = _match_key(book[field])
+            ids = self._exact[field][key]
+            ids.remove(book_id)
+            if ids:
+                continue
+            del self._exact[field][key]
+            if self._grams is None:
+                continue
+            grams = self._grams[field]
+            for gram in _trigrams(key):
+                postings = grams[gram]
+                postings.discard(key)
+                if not postings:
+                    del grams[gram]
+        return book
+
+    def _exact_index(self, field):
+        """Return the hash index for field, building every field's on first use."""
+        if self._exact is None:
+            self._exact = {field: {} for field in self.SEARCH_FIELDS}
+            for book_id, book in self._books.items():
+                self._index(book_id, book)
+        return self._exact[field]
+
+    def _gram_index(self, field):
+        """Return the trigram index for field, building every field's on first use."""
+        if self._grams is None:
+            grams = {name: {} for name in self.SEARCH_FIELDS}
+            for name, index in grams.items():
+                for key in self._exact_index(name):
+                    for gram in _trigrams(key):
+                        index.setdefault(gram, set()).add(key)
+            self._grams = grams
+        return self._grams[field]
+
+    def find(self, field, value):
+        """Return ids of books whose field equals value, ignoring case and surrounding whitespace."""
+        return list(self._exact_index(field).get(_match_key(value), ()))
+
+    def contains(self, title, author):
+        """Check whether a book with this title and author exists, ignoring case and surrounding whitespace."""
+        author = _match_key(author)
+        return any(_match_key(self._books[book_id]["author"]) == author
+                   for book_id in self._exact_index("title").get(_match_key(title), ()))
+
+    def remove_title(self, title):
+        """
+        Remove the first book (in insertion order) with the given title.
+
+        Returns:
+            Book or None: The removed book, or None if no title matched
+        """
+        ids = self._exact_index("title").get(_match_key(title))
+        if not ids:
+            return None
+        return self.remove(ids[0])
+
+    def _matching_keys(self, field, term):
+        """Return the distinct case-folded field values containing term."""
+        if len(term) < 3:
+            # Too short for trigrams; scan the distinct values instead of every book
+            return [key for key in self._exact_index(field) if term in key]
+
+        index = self._gram_index(field)
+        postings = []
+        for gram in _trigrams(term):
+            keys = index.get(gram)
+            if not keys:
+                return []
+            postings.append(keys)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                return []
+        # Sharing every trigram does not guarantee the substring, so confirm it
+        return [key for key in candidates if term in key]
+
+    def search(self, field, term):
+        """
+        Find books whose field contains term, ignoring case.
+
+        Args:
+            field (str): "title" or "author"
+            term (str): Substring to look for
+
+        Returns:
+            list: Matching books in insertion order
+        """
+        keys = self._matching_keys(field, term.casefold())
+        index = self._exact_index(field)
+        ids = [book_id for key in keys for book_id in index[key]]
+        ids.sort()
+        return [self._books[book_id] for book_id in ids]
+
+    def iter_books(self, sort_key=None, offset=0):
+        """
+        Lazily yield books starting at offset.
+
+        Args:
+            sort_key (str): One of SORT_KEYS, or None for insertion order
+            offset (int): Number of books to skip
+
+        Returns:
+            generator: Books in the requested order
+        """
+        if sort_key is None:
+            return islice(self._books.values(), offset, None)
+
+        # Sorting is paid once per key and reused by every page until the
+        # catalog changes
+        order = self._sorted.get(sort_key)
+        if order is None:
+            books = self._books
+            order = sorted(books, key=lambda book_id: _sort_value(books[book_id], sort_key))
+            self._sorted[sort_key] = order
+        return (self._books[order[i]] for i in range(offset, len(order)))
+
+    def ranked_search(self, query, k=10):
+        """
+        Typo-tolerant search across title, author and genre, best matches first.
+
+        Args:
+            query (str): Free-text query
+            k (int): Maximum number of results
+
+        Returns:
+            list: Up to k books ranked by BM25 score
+        """
+        ranked = self.ranked_index()
+        return [self._books[book_id] for _, book_id in ranked.search(query, k)]
+
+    def ranked_index(self, build=True):
+        """
+        Return the RankedIndex behind ranked_search().
+
+        Args:
+            build (bool): Build the index if it does not exist yet
+
+        Returns:
+            RankedIndex or None: None if the index is not built and build is False
+        """
+        if self._ranked is None and build:
+            self._ranked = RankedIndex()
+            for book_id, book in self._books.items():
+                self._ranked.add(book_id, book)
+        return self._ranked
+
+    def attach_ranked_index(self, index):
+        """
+        Adopt a saved RankedIndex instead of building one.
+
+        The index must come from a catalog whose ids name the same books;
+        books added or removed since it was saved are added to or dropped
+        from it, so only the difference is paid for.
+        """
+        books = self._books
+        index.remove_ids(index.lengths.keys() - books.keys())
+        for book_id in books.keys() - index.lengths.keys():
+            index.add(book_id, books[book_id])
+        self._ranked = index
+
+    def statistics(self, top=5):
+        """Return the running statistics summary (see LibraryStats.summary)."""
+        if self._stats is None:
+            self._stats = LibraryStats.from_books(self._books.values())
+        return self._stats.summary(top)
+
+class _FileLock:
+    """
+    Re-entrant exclusive lock shared between processes via a sidecar file.
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._depth = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            self._file = open(self.path, 'a+b')
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            self._file.close()
+            self._file = None
+
+class JournalStorage:
+    """
+    Crash-safe JSON storage backend wrapping an in-memory BookCatalog.
+
+    The library file itself stays a plain JSON array (the snapshot), so any
+    existing library.txt can be dropped in and imported as-is. Every add and
+    remove is appended as one JSON line to "<file>.journal"; startup loads the
+    snapshot and replays the journal, and compaction folds the journal back
+    into a fresh snapshot.
+
+    The first journal line records a CRC of the snapshot it applies to. If a
+    compaction is interrupted after the new snapshot is in place, or the
+    snapshot is replaced by hand, the stale journal is recognised and skipped
+    instead of being applied twice. It also carries a random nonce that is new
+    for every compaction, which is how readers tell that the journal they were
+    following has been replaced (inode numbers and sizes can repeat).
+
+    Several processes may share one library. The journal doubles as the
+    version history: every write takes the "<file>.lock" lock, first applies
+    whatever other processes appended since this one last looked, then
+    appends its own entries, so no change is lost. A remove that someone
+    else already applied simply finds nothing. Reads never take the lock;
+    refresh() follows the journal tail and only locks to reload after
+    another process has compacted.
+
+    Replaying a snapshot and journal always numbers the books the same way,
+    so the ranked search index is saved to "<file>.ranked" under the journal
+    nonce and reused by later processes, which only index the books added or
+    removed since instead of every book.
+    """
+
+    def __init__(self, file_path, compact_every=1000):
+        self.file_path = file_path
+        self.journal_path = file_path + ".journal"
+        self.ranked_path = file_path + ".ranked"
+        self.compact_every = compact_every
+        # When False, appends are flushed but only fsynced by sync() or close()
+        self.durable = True
+        self.catalog = BookCatalog()
+        self._lock = _FileLock(file_path + ".lock")
+        self._snapshot_crc = 0
+        self._pending = 0
+        self._journal = None
+        # Position in, and nonce of, the journal file this catalog reflects
+        self._offset = 0
+        self._journal_nonce = None
+        # Nonce of the journal whose replay numbered the catalog's books; a
+        # compaction by this process keeps its own ids, so it clears the match
+        self._ids_nonce = None
+
+    def load(self):
+        """
+        Load the snapshot and replay the journal on top of it.
+
+        Returns:
+            BookCatalog: The restored catalog
+        """
+        with self._lock:
+            self._load()
+        return self.catalog
+
+    def _load(self):
+        """Rebuild the catalog from the snapshot and journal; the lock must be held."""
+        self.close()
+        data = b""
+        if os.path.exists(self.file_path):
+            with open(self.file_path, 'rb') as file:
+                data = file.read()
+        self._snapshot_crc = zlib.crc32(data)
+        self.catalog = BookCatalog(json.loads(data) if data.strip() else [])
+        self._offset = 0
+        self._journal_nonce = None
+        self._ids_nonce = None
+
+        applied = self._follow()
+        if applied is None or self._offset == 0:
+            # Stale or missing journal
+            self._reset_journal()
+            applied = 0
+        else:
+            if self._offset < os.path.getsize(self.journal_path):
+                # A crash mid-append left a torn last line; drop it
+                with open(self.journal_path, 'r+b') as journal:
+                    journal.truncate(self._offset)
+            if self._journal_nonce is None:
+                # A journal from before base headers had nonces; compact to start one that has
+                self.compact()
+                return
+        self._ids_nonce = self._journal_nonce
+        self._pending = applied
+
+    def _follow(self):
+        """
+        Apply complete journal entries written after the current offset.
+
+        Returns:
+            int or None: Entries applied, or None if the journal was replaced
+            by a compaction or belongs to a different snapshot, in which case
+            the catalog must be reloaded
+        """
+        try:
+            journal = open(self.journal_path, 'rb')
+        except FileNotFoundError:
+            return 0
+
+        applied = 0
+        with journal:
+            if self._journal_nonce is not None:
+                # The base header is written whole by _atomic_write, so it is always complete
+                header = journal.readline()
+                if not header.endswith(b"\n") or json.loads(header).get("nonce") != self._journal_nonce:
+                    # Compacted by another process since we last looked
+                    return None
+
+            journal.seek(self._offset)
+            for line in journal:
+                if not line.endswith(b"\n"):
+                    # Incomplete: a torn write, or another process mid-append
+                    break
+                entry = json.loads(line)
+                op = entry["op"]
+                if op == "base":
+                    if entry["crc"] != self._snapshot_crc:
+                        # The snapshot already contains (or replaced) these changes
+                        return None
+                    self._journal_nonce = entry.get("nonce")
+                elif op == "add":
+                    self.catalog.add(entry["book"])
+                    applied += 1
+                elif op == "remove":
+                    self.catalog.remove_title(entry["title"])
+                    applied += 1
+                self._offset += len(line)
+        return applied
+
+    def refresh(self):
+        """Pick up changes other processes have journaled since the last look."""
+        applied = self._follow()
+        if applied is None:
+            with self._lock:
+                self._load()
+        else:
+            self._pending += applied
+
+    def __len__(self):
+        return len(self.catalog)
+
+    def __iter__(self):
+        return iter(self.catalog)
+
+    def add(self, book):
+        """Add a book to the catalog and journal it."""
+        self.add_many([book])
+
+    def add_many(self, books):
+        """Add several books with a single journal append."""
+        with self._lock:
+            self.refresh()
+            entries = []
+            for book in books:
+                self.catalog.add(book)
+                entries.append({"op": "add", "book": dict(book)})
+            self._append(entries)
+
+    def contains(self, title, author):
+        """Check whether a book with this title and author exists, ignoring case and surrounding whitespace."""
+        return self.catalog.contains(title, author)
+
+    def remove_title(self, title):
+        """
+        Remove the first book with the given title and journal the removal.
+
+        Returns:
+            Book or None: The removed book, or None if no title matched
+        """
+        with self._lock:
+            self.refresh()
+            book = self.catalog.remove_title(title)
+            if book is not None:
+                self._append([{"op": "remove", "title": title}])
+        return book
+
+    def search(self, field, term):
+        """Find books whose field contains term, ignoring case."""
+        return self.catalog.search(field, term)
+
+    def ranked_search(self, query, k=10):
+        """Typo-tolerant search across title, author and genre, best matches first."""
+        if self.catalog.ranked_index(build=False) is None:
+            self._load_ranked_index()
+        return self.catalog.ranked_search(query, k)
+
+    def _load_ranked_index(self):
+        """Attach the saved ranked index if it matches this journal, else build and save one."""
+        nonce = self._journal_nonce
+        if nonce is None or nonce != self._ids_nonce:
+            # Ids are this process's own; ranked_search() builds a private index
+            return
+        try:
+            with open(self.ranked_path, 'rb') as file:
+                saved_nonce, state = marshal.loads(file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            saved_nonce = None
+        if saved_nonce == nonce:
+            self.catalog.attach_ranked_index(RankedIndex.from_state(state))
+            return
+
+        index = self.catalog.ranked_index()
+        try:
+            with self._lock:
+                _atomic_write(self.ranked_path, marshal.dumps((nonce, index.state())))
+        except OSError:
+            # The saved index only saves time; a read-only directory is fine
+            pass
+
+    def iter_books(self, sort_key=None, offset=0):
+        """Lazily yield books starting at offset, optionally sorted."""
+        return self.catalog.iter_books(sort_key, offset)
+
+    def statistics(self, top=5):
+        """Return the running statistics summary (see LibraryStats.summary)."""
+        return self.catalog.statistics(top)
+
+    def _append(self, entries):
+        """Durably append entries to the journal with one write and one fsync; the lock must be held."""
+        if not entries:
+            return
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'ab')
+
+        data = "".join(json.dumps(entry) + "\n" for entry in entries).encode('utf-8')
+        self._journal.write(data)
+        self._journal.flush()
+        if self.durable:
+            os.fsync(self._journal.fileno())
+        self._offset += len(data)
+
+        self._pending += len(entries)
+        # Compacting costs a full rewrite, so only do it once the journal is
+        # comparable in size to the catalog; this keeps appends amortised O(1).
+        if self._pending >= max(self.compact_every, len(self.catalog) // 2):
+            self.compact()
+
+    def compact(self):
+        """Write the catalog, including other processes' changes, as a new snapshot."""
+        with self._lock:
+            self.refresh()
+            self.close()
+            data = json.dumps([dict(book) for book in self.catalog]).encode('utf-8')
+            _atomic_write(self.file_path, data)
+            self._snapshot_crc = zlib.crc32(data)
+            self._reset_journal()
+            self._pending = 0
+
+    def save(self):
+        """Persist the library; for the journal this means compacting it."""
+        self.compact()
+
+    def _reset_journal(self):
+        """Start an empty journal tied to the current snapshot; the lock must be held."""
+        self.close()
+        nonce = os.urandom(8).hex()
+        header = (json.dumps({"op": "base", "crc": self._snapshot_crc, "nonce": nonce}) + "\n").encode('utf-8')
+        _atomic_write(self.journal_path, header)
+        self._journal_nonce = nonce
+        self._offset = len(header)
+
+    def sync(self):
+        """Force journaled changes to disk."""
+        if self._journal is not None:
+            os.fsync(self._journal.fileno())
+
+    def close(self):
+        """Sync and close the journal file handle if open."""
+        if self._journal is not None:
+            self.sync()
+            self._journal.close()
+            self._journal = None
+
+class SQLiteStorage:
+    """
+    SQLite storage backend for large libraries.
+
+    Books live only in the database; nothing is loaded into memory up front.
+    Title, author, year and genre are indexed, and an FTS5 trigram table kept
+    in sync by triggers serves substring searches. A second FTS5 table indexes
+    whole words for ranked search, and its vocabulary stands in for the one
+    RankedIndex keeps in memory. Statistics and listings are answered by SQL
+    so no Python-side pass over the whole library is needed.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS books (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            genre TEXT NOT NULL,
+            read INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS books_title ON books (title COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS books_author ON books (author COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS books_year ON books (year);
+        CREATE INDEX IF NOT EXISTS books_genre ON books (genre COLLATE NOCASE);
+        -- _match_key in SQL: the title without surrounding whitespace, ignoring case
+        CREATE INDEX IF NOT EXISTS books_title_key
+            ON books (trim(title, char(32, 9, 10, 11, 12, 13)) COLLATE NOCASE);
+
+        CREATE TABLE IF NOT EXISTS book_stats (
+            kind TEXT NOT NULL,
+            key NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (kind, key)
+        );
+        CREATE INDEX IF NOT EXISTS book_stats_count ON book_stats (kind, count);
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5 (
+            title, author, genre, content='books', content_rowid='id', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS books_ai AFTER INSERT ON books BEGIN
+            INSERT INTO books_fts (rowid, title, author, genre)
+            VALUES (new.id, new.title, new.author, new.genre);
+        END;
+        CREATE TRIGGER IF NOT EXISTS books_ad AFTER DELETE ON books BEGIN
+            INSERT INTO books_fts (books_fts, rowid, title, author, genre)
+            VALUES ('delete', old.id, old.title, old.author, old.genre);
+        END;
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS books_words USING fts5 (
+            title, author, genre, content='books', content_rowid='id',
+            tokenize="unicode61 remove_diacritics 0 tokenchars '_'"
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS books_words_vocab USING fts5vocab (books_words, row);
+        CREATE TRIGGER IF NOT EXISTS books_words_ai AFTER INSERT ON books BEGIN
+            INSERT INTO books_words (rowid, title, author, genre)
+            VALUES (new.id, new.title, new.author, new.genre);
+        END;
+        CREATE TRIGGER IF NOT EXISTS books_words_ad AFTER DELETE ON books BEGIN
+            INSERT INTO books_words (books_words, rowid, title, author, genre)
+            VALUES ('delete', old.id, old.title, old.author, old.genre);
+        END;
+    """
+    COLUMNS = "title, author, year, genre, read"
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        # SQLite serialises writers itself; wait for a busy database instead of failing
+        self.conn = sqlite3.connect(file_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        has_words = self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'books_words'").fetchone()
+        self.conn.executescript(self.SCHEMA)
+        if not has_words:
+            # Databases from before the word index existed need it filled once
+            with self.conn:
+                self.conn.execute("INSERT INTO books_words (books_words) VALUES ('rebuild')")
+        self._rebuild_stats_if_missing()
+
+    @staticmethod
+    def _to_book(row):
+        return Book(*row)
+
+    def load(self):
+        """Nothing to load; queries go straight to the database."""
+        return self
+
+    def refresh(self):
+        """Nothing to refresh; every query sees other connections' commits."""
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def __bool__(self):
+        return self.conn.execute("SELECT 1 FROM books LIMIT 1").fetchone() is not None
+
+    def __iter__(self):
+        return self.iter_books()
+
+    def iter_books(self, sort_key=None, offset=0):
+        """
+        Lazily yield books starting at offset, optionally sorted.
+
+        The cursor is consumed as the caller iterates, so only the rows that
+        are actually displayed are fetched and converted.
+        """
+        if sort_key is None:
+            order = "id"
+        elif sort_key in SORT_KEYS:
+            collate = " COLLATE NOCASE" if sort_key != "year" else ""
+            order = f"{sort_key}{collate}, id"
+        else:
+            raise ValueError(f"Unsupported sort key: {sort_key}")
+        cursor = self.conn.execute(
+            f"SELECT {self.COLUMNS} FROM books ORDER BY {order} LIMIT -1 OFFSET ?", (offset,)
+        )
+        return map(self._to_book, cursor)
+
+    def add(self, book):
+        """Insert a book and commit."""
+        self.add_many([book])
+
+    def add_many(self, books):
+        """Insert several books and their statistics in one transaction."""
+        rows = []
+        delta = LibraryStats()
+        for book in books:
+            rows.append((book["title"], book["author"], book["year"], book["genre"], int(book["read"])))
+            delta.add(book)
+        with self.conn:
+            self.conn.executemany(f"INSERT INTO books ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?)", rows)
+            self._apply_stats(delta)
+
+    def _apply_stats(self, delta):
+        """Add a LibraryStats delta to the persisted aggregates."""
+        items = list(delta.items())
+        self.conn.executemany(
+            "INSERT INTO book_stats (kind, key, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (kind, key) DO UPDATE SET count = count + excluded.count",
+            items
+        )
+        self.conn.executemany(
+            "DELETE FROM book_stats WHERE kind = ? AND key = ? AND count = 0",
+            ((kind, key) for kind, key, _ in items)
+        )
+
+    def _rebuild_stats_if_missing(self):
+        """Build the aggregates once for databases created before they existed."""
+        has_stats = self.conn.execute("SELECT 1 FROM book_stats LIMIT 1").fetchone()
+        if has_stats or not self:
+            return
+        stats = LibraryStats()
+        for book in self:
+            stats.add(book)
+        with self.conn:
+            self._apply_stats(stats)
+
+    def contains(self, title, author):
+        """Check whether a book with this title and author exists, ignoring case and surrounding whitespace."""
+        # Without ANALYZE data the planner tends to pick the far less selective author index
+        return self.conn.execute(
+            f"SELECT 1 FROM books INDEXED BY books_title_key "
+            f"WHERE trim(title, {_SQL_KEY_WHITESPACE}) = ? COLLATE NOCASE "
+            f"AND trim(author, {_SQL_KEY_WHITESPACE}) = ? COLLATE NOCASE LIMIT 1",
+            (title.strip(_KEY_WHITESPACE), author.strip(_KEY_WHITESPACE))
+        ).fetchone() is not None
+
+    def remove_title(self, title):
+        """
+        Remove the first book (in insertion order) with the given title.
+
+        Returns:
+            Book or None: The removed book, or None if no title matched
+        """
+        with self.conn:
+            row = self.conn.execute(
+                f"SELECT id, {self.COLUMNS} FROM books INDEXED BY books_title_key "
+                f"WHERE trim(title, {_SQL_KEY_WHITESPACE}) = ? COLLATE NOCASE ORDER BY id LIMIT 1",
+                (title.strip(_KEY_WHITESPACE),)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("DELETE FROM books WHERE id = ?", (row[0],))
+            book = self._to_book(row[1:])
+            delta = LibraryStats()
+            delta.remove(book)
+            self._apply_stats(delta)
+        return book
+
+    def search(self, field, term):
+        """
+        Find books whose field contains term, ignoring case.
+
+        Terms of three or more characters use the FTS5 trigram index; shorter
+        ones fall back to LIKE, which scans the table.
+        """
+        if field not in ("title", "author", "genre"):
+            raise ValueError(f"Unsupported search field: {field}")
+        if len(term) >= 3:
+            query = '{%s} : "%s"' % (field, term.replace('"', '""'))
+            sql = (f"SELECT {self.COLUMNS} FROM books WHERE id IN "
+                   "(SELECT rowid FROM books_fts WHERE books_fts MATCH ?) ORDER BY id")
+            params = (query,)
+        else:
+            escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql = f"SELECT {self.COLUMNS} FROM books WHERE {field} LIKE ? ESCAPE '\\' ORDER BY id"
+            params = (f"%{escaped}%",)
+        return [self._to_book(row) for row in self.conn.execute(sql, params)]
+
+    def ranked_search(self, query, k=10):
+        """
+        Typo-tolerant search across title, author and genre, ranked by FTS5's bm25().
+
+        Query words are expanded as RankedIndex.expand() does: a word that
+        some book contains matches only itself, and an unknown word of
+        FUZZY_MIN_LENGTH or more characters matches the indexed words one
+        edit away. A book matches if it contains any expanded word. Unlike
+        RankedIndex, typo matches are not down-weighted, so the order can
+        differ slightly while the matching books are the same.
+        """
+        terms = set()
+        for word in set(_tokenize(query)):
+            terms.update(self._expand(word))
+        if not terms:
+            return []
+        match = " OR ".join('"%s"' % term.replace('"', '""') for term in sorted(terms))
+        weights = ", ".join(str(weight) for weight in RankedIndex.FIELD_WEIGHTS.values())
+        rows = self.conn.execute(
+            f"SELECT {', '.join('b.' + column for column in BOOK_FIELDS)} "
+            f"FROM books_words JOIN books AS b ON b.id = books_words.rowid "
+            f"WHERE books_words MATCH ? ORDER BY bm25(books_words, {weights}) LIMIT ?",
+            (match, k)
+        )
+        return [self._to_book(row) for row in rows]
+
+    def _expand(self, word):
+        """Return the indexed words a query word matches (see ranked_search)."""
+        if self._indexed_words([word]):
+            return [word]
+        if len(word) < RankedIndex.FUZZY_MIN_LENGTH:
+            return []
+        return self._indexed_words(sorted(_edits(word)))
+
+    def _indexed_words(self, words):
+        """Return those of words that occur in some book, looked up in the vocabulary."""
+        found = []
+        # Stay below SQLite's default limit on bound parameters
+        for start in range(0, len(words), 500):
+            chunk = words[start:start + 500]
+            found.extend(term for term, in self.conn.execute(
+                f"SELECT term FROM books_words_vocab WHERE term IN ({', '.join('?' * len(chunk))})", chunk
+            ))
+        return found
+
+    def statistics(self, top=5):
+        """Return the statistics summary from the persisted aggregates."""
+        def count(kind):
+            row = self.conn.execute("SELECT count FROM book_stats WHERE kind = ?", (kind,)).fetchone()
+            return row[0] if row else 0
+
+        def most_common(kind):
+            return self.conn.execute(
+                "SELECT key, count FROM book_stats WHERE kind = ? ORDER BY count DESC LIMIT ?", (kind, top)
+            ).fetchall()
+
+        oldest, newest = self.conn.execute(
+            "SELECT MIN(key), MAX(key) FROM book_stats WHERE kind = 'year'"
+        ).fetchone()
+        return {
+            "total": count("total"),
+            "read": count("read"),
+            "oldest": oldest,
+            "newest": newest,
+            "genres": most_common("genre"),
+            "authors": most_common("author"),
+            "decades": self.conn.execute(
+                "SELECT key, count FROM book_stats WHERE kind = 'decade' ORDER BY key"
+            ).fetchall()
+        }
+
+    def save(self):
+        """Every change is already committed; just let SQLite refresh its planner stats."""
+        self.conn.execute("PRAGMA optimize")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+def migrate_json_to_sqlite(json_path, db_path):
+    """
+    Copy a JSON library file (and any pending journal) into a SQLite database.
+
+    Books the database already holds (same title and author, compared as by
+    contains) are skipped, so running a migration twice adds nothing.
+
+    Args:
+        json_path (str): Existing library file, e.g. library.txt
+        db_path (str): Database to create or append to
+
+    Returns:
+        tuple: (books migrated, books skipped as already present)
+
+    Raises:
+        FileNotFoundError: If neither json_path nor its journal exists
+    """
+    if not (os.path.exists(json_path) or os.path.exists(json_path + ".journal")):
+        # Loading would create an empty journal and lock file next to the missing library
+        raise FileNotFoundError(f"No such library file: {json_path}")
+    source = JournalStorage(json_path)
+    source.load()
+    target = SQLiteStorage(db_path)
+    try:
+        # Checked against the database as it was, so copies within the source all move over
+        fresh = [book for book in source if not target.contains(book["title"], book["author"])]
+        target.add_many(fresh)
+        return len(fresh), len(source) - len(fresh)
+    finally:
+        source.close()
+        target.close()
+
+READ_VALUES = {"yes": True, "true": True, "1": True, "read": True,
+               "no": False, "false": False, "0": False, "unread": False, "": False}
+IMPORT_CHUNK_SIZE = 10000
+MAX_REPORTED_ERRORS = 20
+
+def _read_rows(path):
+    """Stream raw rows from a CSV or JSON-lines file as (line number, dict)."""
+    if path.endswith((".jsonl", ".ndjson")):
+        with open(path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, 1):
+                if line.strip():
+                    try:
+                        yield line_number, json.loads(line)
+                    except ValueError:
+                        yield line_number, None
+    elif path.endswith(".csv"):
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            # The header is line 1, so data rows start at line 2
+            for line_number, row in enumerate(csv.DictReader(file), 2):
+                yield line_number, row
+    else:
+        raise ValueError(f"Unsupported import format: {path} (use .csv or .jsonl)")
+
+def _validate_chunk(rows):
+    """
+    Turn a chunk of raw rows into books.
+
+    Returns:
+        tuple: (list of valid books, list of (line number, error message))
+    """
+    books = []
+    errors = []
+    for line_number, row in rows:
+        if not isinstance(row, dict):
+            errors.append((line_number, "not a valid record"))
+            continue
+        title = str(row.get("title") or "").strip(_KEY_WHITESPACE)
+        author = str(row.get("author") or "").strip(_KEY_WHITESPACE)
+        if not title or not author:
+            errors.append((line_number, "title and author are required"))
+            continue
+        try:
+            year = int(row.get("year"))
+        except (TypeError, ValueError):
+            errors.append((line_number, f"invalid year {row.get('year')!r}"))
+            continue
+        read = row.get("read")
+        if not isinstance(read, bool):
+            read = READ_VALUES.get(str(read if read is not None else "").strip().lower())
+            if read is None:
+                errors.append((line_number, f"invalid read status {row.get('read')!r}"))
+                continue
+        books.append({
+            "title": title,
+            "author": author,
+            "year": year,
+            "genre": str(row.get("genre") or "").strip(),
+            "read": read
+        })
+    return books, errors
+
+def import_books(storage, path, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Stream books from a CSV or JSON-lines file into a storage backend.
+
+    Rows are read and validated one chunk at a time, so memory use does not
+    grow with the file. Books whose title and author already exist (in the
+    library or earlier in the file) are skipped. Each chunk is written with a
+    single add_many call: one journal append or one SQLite transaction.
+    Because duplicates are skipped, an interrupted import can simply be rerun.
+
+    Args:
+        storage: JournalStorage or SQLiteStorage to import into
+        path (str): Source file ending in .csv, .jsonl or .ndjson
+        chunk_size (int): Rows per validation and write batch
+
+    Returns:
+        dict: rows, imported, duplicates, invalid, errors (first few) and seconds
+    """
+    report = {"rows": 0, "imported": 0, "duplicates": 0, "invalid": 0, "errors": []}
+    start = time.perf_counter()
+    rows = _read_rows(path)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        report["rows"] += len(chunk)
+
+        books, errors = _validate_chunk(chunk)
+        report["invalid"] += len(errors)
+        report["errors"].extend(errors[:MAX_REPORTED_ERRORS - len(report["errors"])])
+
+        fresh = []
+        seen = set()
+        for book in books:
+            key = (_match_key(book["title"]), _match_key(book["author"]))
+            if key in seen or storage.contains(book["title"], book["author"]):
+                report["duplicates"] += 1
+                continue
+            seen.add(key)
+            fresh.append(book)
+        storage.add_many(fresh)
+        report["imported"] += len(fresh)
+
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+def export_books(storage, path):
+    """
+    Stream every book from a storage backend to a CSV or JSON-lines file.
+
+    Returns:
+        int: Number of books written
+    """
+    count = 0
+    if path.endswith((".jsonl", ".ndjson")):
+        with open(path, 'w', encoding='utf-8') as file:
+            for book in storage.iter_books():
+                file.write(json.dumps(dict(book)) + "\n")
+                count += 1
+    elif path.endswith(".csv"):
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=BOOK_FIELDS)
+            writer.writeheader()
+            for book in storage.iter_books():
+                writer.writerow({**book, "read": "yes" if book["read"] else "no"})
+                count += 1
+    else:
+        raise ValueError(f"Unsupported export format: {path} (use .csv or .jsonl)")
+    return count
+
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+def open_storage(file_path):
+    """Pick the storage backend from the file extension."""
+    if file_path.endswith(SQLITE_EXTENSIONS):
+        return SQLiteStorage(file_path)
+    return JournalStorage(file_path)
+
+def _atomic_write(path, data):
+    """Replace path with data so readers see either the old or the new file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+class LibraryManager:
+    PAGE_SIZE = 20
+    
+    def __init__(self, file_path="library.txt"):
+        self.file_path = file_path
+        self.library = open_storage(file_path)
         self.load_library()
     
     def add_book(self):
@@ -47,7 +1448,7 @@ class LibraryManager:
             "read": read_status
         }
         
-        self.library.append(book)
+        self.library.add(book)
         print("Book added successfully!")
     
     def remove_book(self):
@@ -58,16 +1459,10 @@ class LibraryManager:
             return
             
         title = input("Enter the title of the book to remove: ")
-        found = False
         
-        for i, book in enumerate(self.library):
-            if book["title"].lower() == title.lower():
-                self.library.pop(i)
-                print("Book removed successfully!")
-                found = True
-                break
-        
-        if not found:
+        if self.library.remove_title(title) is not None:
+            print("Book removed successfully!")
+        else:
             print("Book not found in your library.")
     
     def search_book(self):
@@ -80,24 +1475,32 @@ class LibraryManager:
         print("Search by:")
         print("1. Title")
         print("2. Author")
+        print("3. Anything (ranked, tolerates typos)")
         
         while True:
             try:
                 choice = int(input("Enter your choice: "))
-                if choice in [1, 2]:
+                if choice in [1, 2, 3]:
                     break
                 else:
-                    print("Invalid choice. Please enter 1 or 2.")
+                    print("Invalid choice. Please enter 1, 2 or 3.")
             except ValueError:
                 print("Invalid input. Please enter a number.")
         
-        search_term = input("Enter the title: " if choice == 1 else "Enter the author: ").lower()
+        if choice == 3:
+            query = input("Enter title, author or genre words: ")
+            matching_books = self.library.ranked_search(query, self.PAGE_SIZE)
+            if matching_books:
+                print("\nBest Matches:")
+                self._display_books(matching_books)
+            else:
+                print("No matching books found.")
+            return
+        
+        search_term = input("Enter the title: " if choice == 1 else "Enter the author: ")
         search_key = "title" if choice == 1 else "author"
         
-        matching_books = []
-        for book in self.library:
-            if search_term in book[search_key].lower():
-                matching_books.append(book)
+        matching_books = self.library.search(search_key, search_term)
         
         if matching_books:
             print("\nMatching Books:")
@@ -106,19 +1509,57 @@ class LibraryManager:
             print("No matching books found.")
     
     def display_all_books(self):
-        """Display all books in the library."""
+        """Display the library one page at a time."""
         print("\n=== Your Library ===")
         if not self.library:
             print("Your library is empty!")
             return
+        
+        sort_key = input("Sort by (title/author/year/genre, Enter for date added): ").strip().lower() or None
+        if sort_key is not None and sort_key not in SORT_KEYS:
+            print("Unknown sort key. Showing books in the order they were added.")
+            sort_key = None
+        
+        try:
+            page_size = int(input(f"Books per page (Enter for {self.PAGE_SIZE}): ") or self.PAGE_SIZE)
+        except ValueError:
+            page_size = self.PAGE_SIZE
+        page_size = max(1, page_size)
+        
+        page = 0
+        total_pages = None
+        while True:
+            offset = page * page_size
+            books = list(islice(self.library.iter_books(sort_key, offset), page_size))
+            self._display_books(books, start=offset + 1)
             
-        self._display_books(self.library)
+            # Counted after the first page is on screen so it never delays it
+            if total_pages is None:
+                total_pages = max(1, -(-len(self.library) // page_size))
+            print(f"\nPage {page + 1} of {total_pages}")
+            
+            choice = input("[n]ext, [p]revious, page number or [q]uit: ").strip().lower()
+            if choice in ("n", ""):
+                if page + 1 == total_pages:
+                    break
+                page += 1
+            elif choice == "p":
+                page = max(page - 1, 0)
+            elif choice.isdigit():
+                page = min(max(int(choice), 1), total_pages) - 1
+            elif choice == "q":
+                break
+            else:
+                print("Invalid choice.")
     
-    def _display_books(self, books):
-        """Helper method to display a list of books."""
-        for i, book in enumerate(books, 1):
+    def _display_books(self, books, start=1):
+        """Helper method to display a list of books, numbering from start."""
+        lines = []
+        for i, book in enumerate(books, start):
             read_status = "Read" if book["read"] else "Unread"
-            print(f"{i}. {book['title']} by {book['author']} ({book['year']}) - {book['genre']} - {read_status}")
+            lines.append(f"{i}. {book['title']} by {book['author']} ({book['year']}) - {book['genre']} - {read_status}")
+        if lines:
+            print("\n".join(lines))
     
     def display_statistics(self):
         """Display library statistics."""
@@ -127,34 +1568,47 @@ class LibraryManager:
             print("Your library is empty!")
             return
             
-        total_books = len(self.library)
-        read_books = sum(1 for book in self.library if book["read"])
+        stats = self.library.statistics()
+        total_books = stats["total"]
+        read_books = stats["read"]
         percentage_read = (read_books / total_books) * 100 if total_books > 0 else 0
         
         print(f"Total books: {total_books}")
         print(f"Percentage read: {percentage_read:.1f}%")
+        print(f"Oldest publication year: {stats['oldest']}")
+        print(f"Newest publication year: {stats['newest']}")
+        
+        print("\nTop genres:")
+        for genre, count in stats["genres"]:
+            print(f"  {genre}: {count}")
+        
+        print("\nTop authors:")
+        for author, count in stats["authors"]:
+            print(f"  {author}: {count}")
+        
+        print("\nBooks per decade:")
+        largest = max(count for _, count in stats["decades"])
+        for decade, count in stats["decades"]:
+            bar = "#" * max(1, round(count / largest * 30))
+            print(f"  {decade}s: {bar} {count}")
     
     def save_library(self):
-        """Save the library to a file."""
+        """Save the library through its storage backend."""
         try:
-            with open(self.file_path, 'w') as file:
-                json.dump(self.library, file)
+            self.library.save()
             return True
         except Exception as e:
             print(f"Error saving library: {e}")
             return False
     
     def load_library(self):
-        """Load the library from a file if it exists."""
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, 'r') as file:
-                    self.library = json.load(file)
-                return True
-            except Exception as e:
-                print(f"Error loading library: {e}")
-                return False
-        return False
+        """Load the library through its storage backend."""
+        try:
+            self.library.load()
+            return True
+        except Exception as e:
+            print(f"Error loading library: {e}")
+            return False
     
     def display_menu(self):
         """Display the main menu."""
@@ -182,6 +1636,9 @@ class LibraryManager:
                 input("Press Enter to continue...")
                 continue
             
+            # Pick up changes saved by other sessions sharing this library
+            self.library.refresh()
+            
             if choice == 1:
                 self.add_book()
             elif choice == 2:
@@ -204,6 +1661,186 @@ class LibraryManager:
             input("\nPress Enter to continue...")
 
 
+def build_parser():
+    """Build the argument parser for command mode."""
+    parser = argparse.ArgumentParser(
+        description="Personal Library Manager. Without a command, starts the interactive menu."
+    )
+    parser.add_argument("--library", default="library.txt",
+                        help="library file; .db/.sqlite/.sqlite3 selects the SQLite backend")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    add = commands.add_parser("add", help="add a book")
+    add.add_argument("title")
+    add.add_argument("author")
+    add.add_argument("year", type=int)
+    add.add_argument("genre")
+    add.add_argument("--read", action="store_true", help="mark the book as read")
+
+    remove = commands.add_parser("remove", help="remove a book by title")
+    remove.add_argument("title")
+
+    search = commands.add_parser("search", help="search by title or author")
+    search.add_argument("term")
+    search.add_argument("--by", choices=["title", "author"], default="title")
+    search.add_argument("--fuzzy", action="store_true",
+                        help="ranked, typo-tolerant search across title, author and genre")
+    search.add_argument("--limit", type=int, default=LibraryManager.PAGE_SIZE,
+                        help="maximum results for --fuzzy")
+
+    commands.add_parser("stats", help="show library statistics")
+
+    listing = commands.add_parser("list", help="list one page of books")
+    listing.add_argument("--sort", choices=SORT_KEYS)
+    listing.add_argument("--page", type=int, default=1)
+    listing.add_argument("--page-size", type=int, default=LibraryManager.PAGE_SIZE)
+
+    import_parser = commands.add_parser("import", help="bulk import a .csv or .jsonl file")
+    import_parser.add_argument("file")
+
+    export = commands.add_parser("export", help="export to a .csv or .jsonl file")
+    export.add_argument("file")
+
+    migrate = commands.add_parser("migrate", help="copy a JSON library into a SQLite database")
+    migrate.add_argument("source")
+    migrate.add_argument("target")
+
+    batch = commands.add_parser("batch", help="run commands from a file, one per line ('-' for stdin)")
+    batch.add_argument("file")
+
+    commands.add_parser("menu", help="start the interactive menu (the default)")
+    return parser
+
+def run_command(manager, args):
+    """
+    Execute one parsed command against an already loaded LibraryManager.
+
+    Returns:
+        int: 0 on success, 1 if the command failed
+    """
+    library = manager.library
+    try:
+        if args.command == "add":
+            library.add({"title": args.title, "author": args.author, "year": args.year,
+                         "genre": args.genre, "read": args.read})
+            print(f"Added '{args.title}'.")
+        elif args.command == "remove":
+            if library.remove_title(args.title) is None:
+                print(f"Book not found: {args.title}")
+                return 1
+            print(f"Removed '{args.title}'.")
+        elif args.command == "search":
+            if args.fuzzy:
+                matching_books = library.ranked_search(args.term, args.limit)
+            else:
+                matching_books = library.search(args.by, args.term)
+            if not matching_books:
+                print("No matching books found.")
+                return 1
+            manager._display_books(matching_books)
+        elif args.command == "stats":
+            manager.display_statistics()
+        elif args.command == "list":
+            page_size = max(1, args.page_size)
+            offset = (max(1, args.page) - 1) * page_size
+            manager._display_books(islice(library.iter_books(args.sort, offset), page_size), start=offset + 1)
+        elif args.command == "import":
+            report = import_books(library, args.file)
+            rate = report["rows"] / report["seconds"] if report["seconds"] else 0
+            print(f"Read {report['rows']} rows in {report['seconds']:.1f}s ({rate:,.0f} rows/sec): "
+                  f"{report['imported']} imported, {report['duplicates']} duplicates, {report['invalid']} invalid.")
+            for line_number, error in report["errors"]:
+                print(f"  line {line_number}: {error}")
+        elif args.command == "export":
+            count = export_books(library, args.file)
+            print(f"Exported {count} books to {args.file}.")
+        else:
+            print(f"Command not allowed here: {args.command}")
+            return 1
+    except (OSError, ValueError) as e:
+        # e.g. a missing import file or an unsupported export format
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def run_batch(manager, parser, path):
+    """
+    Run every command in a batch file against one loaded library.
+
+    Blank lines and lines starting with # are skipped. A failing line is
+    reported and the rest of the file still runs.
+
+    Returns:
+        int: 0 if every command succeeded, 1 otherwise
+    """
+    # Each change is still flushed to the journal; the fsync per command is
+    # what would otherwise cap batch throughput.
+    if isinstance(manager.library, JournalStorage):
+        manager.library.durable = False
+
+    status = 0
+    try:
+        file = sys.stdin if path == "-" else open(path, 'r', encoding='utf-8')
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    try:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                # library starts as None so a --library given on the line can be told apart from the default
+                args = parser.parse_args(shlex.split(line), argparse.Namespace(library=None))
+            except (SystemExit, ValueError):
+                print(f"line {line_number}: invalid command: {line}")
+                status = 1
+                continue
+            if args.library is not None:
+                print(f"line {line_number}: --library is not allowed in a batch "
+                      f"(every line runs against {manager.file_path}): {line}")
+                status = 1
+            elif args.command in (None, "batch", "menu", "migrate"):
+                print(f"line {line_number}: command not allowed in a batch: {line}")
+                status = 1
+            elif run_command(manager, args):
+                status = 1
+    finally:
+        if file is not sys.stdin:
+            file.close()
+        if isinstance(manager.library, JournalStorage):
+            manager.library.sync()
+    return status
+
+def main(argv=None):
+    """Entry point: run the interactive menu or a single command / batch."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        try:
+            count, skipped = migrate_json_to_sqlite(args.source, args.target)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"Migrated {count} books from {args.source} to {args.target}."
+              + (f" Skipped {skipped} already in the database." if skipped else ""))
+        return 0
+
+    library_manager = LibraryManager(args.library)
+    if args.command in (None, "menu"):
+        library_manager.run()
+        return 0
+
+    # Changes are already journaled or committed, so command mode skips the
+    # full rewrite that save_library does when leaving the menu.
+    try:
+        if args.command == "batch":
+            return run_batch(library_manager, parser, args.file)
+        return run_command(library_manager, args)
+    finally:
+        library_manager.library.close()
+
+
 if __name__ == "__main__":
-    library_manager = LibraryManager()
-    library_manager.run()
\ No newline at end of file
+    sys.exit(main())
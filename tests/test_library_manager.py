@@ -0,0 +1,287 @@
+# test_library_manager.py
+# Tests for the library_manager storage backends: journal replay and compaction
+# shared between several instances.
+#
+# Usage: python -m pytest tests
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import library_manager as lm
+
+
+def book(n):
+    return {"title": f"Book {n}", "author": f"Author {n % 7}", "year": 1900 + n, "genre": "Fiction", "read": False}
+
+
+def titles(storage):
+    return sorted(b["title"] for b in storage)
+
+
+def test_journal_survives_repeated_compaction_by_another_instance(tmp_path):
+    path = str(tmp_path / "library.txt")
+    stale = lm.JournalStorage(path)
+    stale.load()
+    other = lm.JournalStorage(path)
+    other.load()
+    added = []
+    n = 0
+    for round_ in range(6):
+        for _ in range(3):
+            stale.add(book(n))
+            added.append(n)
+            n += 1
+        # Release the append handle, as an idle session does, so the old inode can be reused
+        stale.close()
+        other.refresh()
+        # Several compactions in a row: new journals soon reuse an earlier journal's inode
+        for compaction in range(3):
+            other.compact()
+            # Grow the new journal past the stale reader's offset
+            for _ in range(round_ + 4 + 10 * compaction):
+                # Titles of varying length so old offsets land mid-line in the new journal
+                other.add(dict(book(n), title=f"Book {n}" + "x" * (n % 5)))
+                added.append(n)
+                n += 1
+        stale.refresh()
+        assert len(stale) == len(other) == len(added)
+        assert titles(stale) == titles(other)
+
+    fresh = lm.JournalStorage(path)
+    fresh.load()
+    assert titles(fresh) == titles(stale)
+
+
+def test_journal_nonce_changes_with_each_compaction(tmp_path):
+    path = str(tmp_path / "library.txt")
+    storage = lm.JournalStorage(path)
+    storage.load()
+    nonces = set()
+    for n in range(5):
+        storage.add(book(n))
+        storage.compact()
+        with open(storage.journal_path, encoding="utf-8") as journal:
+            header = json.loads(journal.readline())
+        assert header["op"] == "base"
+        nonces.add(header["nonce"])
+    assert len(nonces) == 5
+
+
+def test_legacy_journal_without_nonce_is_replayed(tmp_path):
+    path = str(tmp_path / "library.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([book(1)], f)
+    with open(path, "rb") as f:
+        crc = lm.zlib.crc32(f.read())
+    with open(path + ".journal", "w", encoding="utf-8") as f:
+        f.write(json.dumps({"op": "base", "crc": crc}) + "\n")
+        f.write(json.dumps({"op": "add", "book": book(2)}) + "\n")
+
+    storage = lm.JournalStorage(path)
+    storage.load()
+    assert titles(storage) == ["Book 1", "Book 2"]
+    with open(storage.journal_path, encoding="utf-8") as journal:
+        assert "nonce" in json.loads(journal.readline())
+
+
+def test_command_errors_are_reported_not_raised(tmp_path, capsys):
+    library = str(tmp_path / "library.txt")
+    assert lm.main(["--library", library, "export", str(tmp_path / "out.txt")]) == 1
+    assert lm.main(["--library", library, "import", str(tmp_path / "missing.csv")]) == 1
+    assert lm.main(["--library", library, "batch", str(tmp_path / "missing.txt")]) == 1
+    errors = capsys.readouterr().err.splitlines()
+    assert len(errors) == 3 and all(line.startswith("Error: ") for line in errors)
+
+
+def test_batch_skips_failing_lines(tmp_path, capsys):
+    library = str(tmp_path / "library.txt")
+    batch = tmp_path / "batch.txt"
+    batch.write_text(f"import {tmp_path / 'missing.csv'}\n"
+                     "add Dune Herbert 1965 SciFi\n"
+                     f"export {tmp_path / 'out.txt'}\n"
+                     "--library other.txt add Emma Austen 1815 Romance\n"
+                     "add Ubik Dick 1969 SciFi\n", encoding="utf-8")
+    assert lm.main(["--library", library, "batch", str(batch)]) == 1
+    out = capsys.readouterr().out
+    assert "line 4: --library is not allowed in a batch" in out
+
+    storage = lm.JournalStorage(library)
+    storage.load()
+    assert titles(storage) == ["Dune", "Ubik"]
+    assert not os.path.exists("other.txt")
+
+
+def test_catalog_indexes_are_built_on_first_use_and_kept_current():
+    catalog = lm.BookCatalog(book(n) for n in range(50))
+    assert catalog._exact is catalog._grams is catalog._stats is None
+
+    catalog.add(dict(book(50), title="Dune", author="Frank Herbert"))
+    assert [b["title"] for b in catalog.search("author", "herb")] == ["Dune"]
+    assert catalog._grams is not None
+    catalog.remove_title("Dune")
+    catalog.add(dict(book(51), title="Dune Messiah", author="Frank Herbert"))
+    assert [b["title"] for b in catalog.search("title", "dune")] == ["Dune Messiah"]
+    assert [b["title"] for b in catalog.search("author", "herbert")] == ["Dune Messiah"]
+
+    summary = catalog.statistics()
+    catalog.add(book(52))
+    catalog.remove_title("Book 3")
+    expected = lm.LibraryStats()
+    for b in catalog:
+        expected.add(b)
+    catalog.statistics()
+    assert sorted(catalog._stats.items(), key=repr) == sorted(expected.items(), key=repr)
+    assert summary["total"] == 51
+
+
+def test_stats_from_books_matches_adding_one_by_one():
+    books = [lm.Book.from_dict(dict(book(n), genre=["Fiction", "Self-Help, Psychology", "Fiction, "][n % 3],
+                                    read=n % 2 == 0)) for n in range(40)]
+    expected = lm.LibraryStats()
+    for b in books:
+        expected.add(b)
+    assert sorted(lm.LibraryStats.from_books(books).items(), key=repr) == sorted(expected.items(), key=repr)
+    assert lm.LibraryStats.from_books([]).summary() == lm.LibraryStats().summary()
+
+
+CLASSICS = [
+    ("Dune", "Frank Herbert", 1965, "Science Fiction"),
+    ("Dune Messiah", "Frank Herbert", 1969, "Science Fiction"),
+    ("Clean Code", "Robert C. Martin", 2008, "Programming"),
+    ("The Clean Coder", "Robert C. Martin", 2011, "Programming"),
+    ("A Game of Thrones", "George R. R. Martin", 1996, "Fantasy"),
+    ("Emma", "Jane Austen", 1815, "Romance"),
+    ("Pride and Prejudice", "Jane Austen", 1813, "Romance"),
+    ("The Hobbit", "J. R. R. Tolkien", 1937, "Fantasy"),
+    ("Neuromancer", "William Gibson", 1984, "Science Fiction, Cyberpunk"),
+]
+
+
+def classics():
+    return [{"title": t, "author": a, "year": y, "genre": g, "read": False} for t, a, y, g in CLASSICS]
+
+
+def test_fuzzy_search_matches_the_same_books_on_both_backends(tmp_path):
+    json_storage = lm.JournalStorage(str(tmp_path / "library.txt"))
+    json_storage.load()
+    sqlite_storage = lm.SQLiteStorage(str(tmp_path / "library.db"))
+    json_storage.add_many(classics())
+    sqlite_storage.add_many(classics())
+
+    def found(storage, query):
+        return sorted(b["title"] for b in storage.ranked_search(query, k=len(CLASSICS)))
+
+    assert found(sqlite_storage, "dnue") == ["Dune", "Dune Messiah"]
+    # Sharing a trigram ("ber", "ert") with herbert is not a match
+    assert "Clean Code" not in found(sqlite_storage, "dnue herbert")
+    assert sqlite_storage.ranked_search("dnue herbert", k=1)[0]["title"].startswith("Dune")
+    for query in ("dnue", "dnue herbert", "herbret", "frank", "clean", "cleen coder", "martni",
+                  "austin", "hobit", "emma", "emam", "fantasy", "cyberpunk", "gibsn neuromancr",
+                  "the", "cod", "xyzzy", ""):
+        assert found(sqlite_storage, query) == found(json_storage, query), query
+
+    sqlite_storage.remove_title("Dune")
+    json_storage.remove_title("Dune")
+    assert found(sqlite_storage, "dnue") == found(json_storage, "dnue") == ["Dune Messiah"]
+
+
+def test_one_edit_variants_agree_with_within_one_edit():
+    for word in ("dune", "herbert", "a1b"):
+        edits = lm._edits(word)
+        assert word not in edits
+        assert all(lm._within_one_edit(word, edit) for edit in edits)
+    assert {"dnue", "dun", "dunes", "tune"} <= lm._edits("dune")
+
+
+def test_saved_ranked_index_is_reused_and_brought_up_to_date(tmp_path, monkeypatch):
+    path = str(tmp_path / "library.txt")
+    first = lm.JournalStorage(path)
+    first.load()
+    first.add_many(classics())
+    assert [b["title"] for b in first.ranked_search("dnue", k=1)] == ["Dune"]
+    assert os.path.exists(first.ranked_path)
+
+    # Changes made after the index was saved
+    first.remove_title("Dune")
+    first.add(dict(book(1), title="Children of Dune", author="Frank Herbert"))
+
+    second = lm.JournalStorage(path)
+    second.load()
+    indexed = []
+    add = lm.RankedIndex.add
+    monkeypatch.setattr(lm.RankedIndex, "add", lambda index, book_id, b: (indexed.append(b["title"]), add(index, book_id, b)))
+    results = second.ranked_search("dnue herbert", k=len(CLASSICS))
+    # Only the book added since the save was indexed
+    assert indexed == ["Children of Dune"]
+    monkeypatch.undo()
+
+    fresh = lm.BookCatalog(second)
+    assert [b["title"] for b in results] == [b["title"] for b in fresh.ranked_search("dnue herbert", k=len(CLASSICS))]
+
+
+def test_saved_ranked_index_needs_ids_from_a_fresh_load(tmp_path):
+    path = str(tmp_path / "library.txt")
+    storage = lm.JournalStorage(path)
+    storage.load()
+    storage.add_many(classics())
+    storage.remove_title("Dune")
+    # The snapshot renumbers the books on the next load, but this process keeps its ids
+    storage.compact()
+    assert [b["title"] for b in storage.ranked_search("emam")] == ["Emma"]
+    assert not os.path.exists(storage.ranked_path)
+
+    other = lm.JournalStorage(path)
+    other.load()
+    assert [b["title"] for b in other.ranked_search("emam")] == ["Emma"]
+    assert os.path.exists(other.ranked_path)
+
+    with open(other.ranked_path, 'wb') as file:
+        file.write(b"not a saved index")
+    third = lm.JournalStorage(path)
+    third.load()
+    assert sorted(b["title"] for b in third.ranked_search("austen")) == ["Emma", "Pride and Prejudice"]
+    assert os.path.getsize(third.ranked_path) > len(b"not a saved index")
+
+
+@pytest.mark.parametrize("library", ["library.txt", "library.db"])
+@pytest.mark.parametrize("extension", [".csv", ".jsonl"])
+def test_export_then_import_finds_only_duplicates(tmp_path, library, extension):
+    storage = lm.open_storage(str(tmp_path / library))
+    storage.load()
+    # Stored with surrounding whitespace, as in the shipped library.txt
+    storage.add_many([dict(book(1), title="Atomic Habits "), dict(book(2), author=" Author 2\t"), book(3)])
+    exported = str(tmp_path / ("books" + extension))
+    assert lm.export_books(storage, exported) == 3
+
+    report = lm.import_books(storage, exported)
+    assert (report["imported"], report["duplicates"]) == (0, 3)
+    assert len(storage) == 3
+    assert storage.contains("atomic habits", "AUTHOR 1")
+    assert storage.remove_title(" atomic habits")["title"] == "Atomic Habits "
+
+
+def test_migrate_twice_adds_nothing_the_second_time(tmp_path, capsys):
+    source = str(tmp_path / "library.txt")
+    target = str(tmp_path / "library.db")
+    storage = lm.JournalStorage(source)
+    storage.load()
+    # Two copies of one book are both migrated
+    storage.add_many([book(1), book(2), book(2), dict(book(3), title="Book 3 ")])
+    storage.close()
+
+    assert lm.migrate_json_to_sqlite(source, target) == (4, 0)
+    assert lm.main(["migrate", source, target]) == 0
+    assert "Skipped 4 already in the database" in capsys.readouterr().out
+    assert len(lm.SQLiteStorage(target)) == 4
+
+
+def test_migrate_reports_a_missing_source(tmp_path, capsys):
+    missing = str(tmp_path / "missing.txt")
+    assert lm.main(["migrate", missing, str(tmp_path / "library.db")]) == 1
+    assert "No such library file" in capsys.readouterr().err
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,256 @@
+# test_password_strength_meter.py
+# Tests for Password_Strenght_Meter: the pattern-aware entropy estimator (detected
+# patterns, agreement with the meter's scores, a runtime bound for long inputs), the
+# breached-password index, password and passphrase policies, bulk generation and
+# the multi-process audit.
+#
+# Usage: python -m pytest tests
+
+import hashlib
+import itertools
+import math
+import os
+import random
+import re
+import string
+import sys
+import time
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Password_Strenght_Meter as psm
+
+
+@pytest.mark.parametrize("password, pattern", [
+    ("password", "dictionary"),
+    ("drowssap", "dictionary"),
+    ("p@ssw0rd", "l33t"),
+    ("zxcvfr", "spatial"),
+    ("abcabcabc", "repeat"),
+    ("lmnopq", "sequence"),
+    ("12/03/1999", "date"),
+])
+def test_detects_pattern(password, pattern):
+    sequence = psm.estimate_guesses(password)["sequence"]
+    assert [match["pattern"] for match in sequence] == [pattern]
+
+
+def test_patterns_lower_entropy():
+    assert psm.estimate_guesses("Password1!")["entropy"] < 20
+    assert psm.estimate_guesses("xK9#mQ2$vL8!")["entropy"] > 35
+
+
+def test_sequence_covers_password():
+    for password in ("correcthorsebatterystaple", "Tr0ub4dour&3", "summer2019!qwerty"):
+        sequence = psm.estimate_guesses(password)["sequence"]
+        assert "".join(match["token"] for match in sequence) == password
+
+
+@pytest.mark.parametrize("password", [
+    "a" * 1000,
+    "ab" * 2000,
+    "Password1!" * 500,
+    "qwerty123" * 300,
+    "".join(random.Random(0).choices(string.printable[:94], k=10000)),
+])
+def test_long_input_runtime_is_bounded(password):
+    start = time.perf_counter()
+    result = psm.estimate_guesses(password)
+    # Only MAX_ANALYZED_LENGTH characters are matched, so this takes tens of milliseconds
+    assert time.perf_counter() - start < 1.0
+    assert "".join(match["token"] for match in result["sequence"]) == password
+    assert result["entropy"] >= (len(password) - psm.MAX_ANALYZED_LENGTH) * 3.3
+
+
+def test_score_password_matches_check_password_strength():
+    meter = psm.PasswordStrengthMeter(breached_path=None)
+    rng = random.Random(1)
+    for _ in range(500):
+        password = "".join(rng.choices(string.ascii_letters + string.digits + "!@#$", k=rng.randint(1, 20)))
+        result = meter.check_password_strength(password)
+        assert meter.score_password(password) == (result["score"], result["strength"])
+
+
+def sha1_hex(password):
+    return hashlib.sha1(password.encode()).hexdigest().upper()
+
+
+def test_breached_index_round_trip(tmp_path):
+    breached = ["password", "letmein", "dragon", "hunter2"]
+    path = str(tmp_path / "hashed.idx")
+    # HIBP lines with counts, a duplicate and a junk line; small runs exercise the merge
+    lines = [f"{sha1_hex(p)}:{i + 1}\n" for i, p in enumerate(breached)] + [sha1_hex("dragon") + "\n", "junk\n"]
+    assert psm.BreachedPasswordIndex.build(lines, path, run_size=2) == (4, 1)
+
+    index = psm.BreachedPasswordIndex(path)
+    try:
+        assert len(index) == 4
+        assert all(p in index for p in breached)
+        assert "correct horse battery staple" not in index and "Password" not in index
+    finally:
+        index.close()
+
+    plain_path = str(tmp_path / "plain.idx")
+    assert psm.BreachedPasswordIndex.build(["hunter2\n", "\n"], plain_path, hashed=False) == (1, 0)
+    meter = psm.PasswordStrengthMeter(plain_path)
+    assert meter.is_breached("hunter2") and not meter.is_breached("hunter3")
+
+
+@pytest.mark.parametrize("damage", ["empty", "short", "magic", "truncated"])
+def test_breached_index_rejects_damaged_files(tmp_path, capsys, damage):
+    path = tmp_path / "bad.idx"
+    psm.BreachedPasswordIndex.build([sha1_hex("hunter2")], str(path))
+    data = path.read_bytes()
+    path.write_bytes({"empty": b"", "short": data[:10], "magic": b"NOTMAGIC" + data[8:],
+                      "truncated": data[:-8]}[damage])
+    with pytest.raises(ValueError, match="not a breached-password index"):
+        psm.BreachedPasswordIndex(str(path))
+    with pytest.raises(ValueError):
+        psm.PasswordStrengthMeter(str(path))
+
+    passwords = tmp_path / "passwords.txt"
+    passwords.write_text("hunter2\n")
+    assert psm.run_cli(["audit", str(passwords), "--breached", str(path)]) == 1
+    assert "Error:" in capsys.readouterr().err
+
+
+SMALL_CLASSES = {"lower": "ab", "upper": "AB", "digits": "01", "special": "!"}
+
+
+def brute_force_counts(classes, required, lengths):
+    alphabet = "".join(classes.values())
+    return [sum(1 for candidate in itertools.product(alphabet, repeat=length)
+                if all(set(candidate) & set(classes[name]) for name in required))
+            for length in lengths]
+
+
+@pytest.mark.parametrize("no_ambiguous", [False, True])
+def test_policy_counts_match_brute_force(monkeypatch, no_ambiguous):
+    monkeypatch.setattr(psm, "CHARACTER_CLASSES", SMALL_CLASSES)
+    names = list(SMALL_CLASSES)
+    # Every class is required, forbidden or merely allowed
+    for roles in itertools.product(("required", "forbidden", "allowed"), repeat=len(names)):
+        required = [name for name, role in zip(names, roles) if role == "required"]
+        forbidden = [name for name, role in zip(names, roles) if role == "forbidden"]
+        classes = {name: "".join(c for c in chars if not (no_ambiguous and c in psm.AMBIGUOUS_CHARACTERS))
+                   for name, chars in SMALL_CLASSES.items() if name not in forbidden}
+        classes = {name: chars for name, chars in classes.items() if chars}
+        min_length = max(1, len(required))
+        if not classes or any(name not in classes for name in required):
+            with pytest.raises(ValueError):
+                psm.PasswordPolicy(min_length, 4, required, forbidden, "!", no_ambiguous)
+            continue
+
+        policy = psm.PasswordPolicy(min_length, 4, required, forbidden, "!", no_ambiguous)
+        expected = brute_force_counts(classes, required, range(min_length, 5))
+        assert policy.counts == expected, roles
+        assert policy.entropy == pytest.approx(math.log2(sum(expected)))
+
+
+def test_policy_generate_respects_the_policy():
+    policy = psm.PasswordPolicy(8, 12, required=("lower", "digits", "special"), forbidden=("upper",),
+                                special="#%", no_ambiguous=True)
+    allowed = set(policy.alphabet)
+    assert not allowed & set(psm.AMBIGUOUS_CHARACTERS + string.ascii_uppercase)
+    passwords = policy.generate(2000)
+    assert len(passwords) == 2000
+    for password in passwords:
+        assert 8 <= len(password) <= 12
+        assert set(password) <= allowed
+        assert set(password) & set(string.ascii_lowercase)
+        assert set(password) & set(string.digits)
+        assert set(password) & set("#%")
+    # Lengths are drawn in proportion to their counts, so the longest dominates
+    lengths = Counter(len(password) for password in passwords)
+    assert lengths[12] > lengths[11] > lengths[8]
+
+
+def test_policy_entropy():
+    assert psm.PasswordPolicy(10, required=()).entropy == pytest.approx(10 * math.log2(70))
+    # Requiring a class only removes the passwords without it
+    assert psm.PasswordPolicy(10).entropy == pytest.approx(math.log2(
+        sum((-1) ** len(out) * (70 - sum(len(psm.CHARACTER_CLASSES[name]) for name in out)) ** 10
+            for size in range(5) for out in itertools.combinations(psm.CHARACTER_CLASSES, size))))
+
+
+def test_passphrase_policy(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("Apple\nbanana\napple\n\ncherry\ndate\n")
+    policy = psm.PassphrasePolicy(5, separator=".", wordlist_path=str(words))
+    assert policy.entropy == pytest.approx(5 * 2)
+    for phrase in policy.generate(200):
+        parts = phrase.split(".")
+        assert len(parts) == 5 and set(parts) <= {"apple", "banana", "cherry", "date"}
+    capitalized = psm.PassphrasePolicy(3, separator="", capitalize=True, wordlist_path=str(words)).generate()[0]
+    assert re.fullmatch(r"(?:Apple|Banana|Cherry|Date){3}", capitalized)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"required": ("emoji",)},
+    {"forbidden": ("emoji",)},
+    {"required": ("digits",), "forbidden": ("digits",)},
+    {"special": "!é"},
+    {"special": "abc"},
+    {"min_length": 3},
+    {"min_length": 12, "max_length": 10},
+    {"min_length": 0, "required": ()},
+    {"required": (), "forbidden": tuple(psm.CHARACTER_CLASSES)},
+    {"required": ("special",), "forbidden": (), "special": "|`'\"", "no_ambiguous": True},
+])
+def test_invalid_policies_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        psm.PasswordPolicy(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"words": 0},
+    {"separator": ""},
+    {"separator": "x"},
+])
+def test_invalid_passphrase_policies_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        psm.PassphrasePolicy(**kwargs)
+
+
+def test_passphrase_policy_needs_two_words(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("only\nONLY\n")
+    with pytest.raises(ValueError):
+        psm.PassphrasePolicy(4, wordlist_path=str(words))
+
+
+@pytest.mark.parametrize("length", [4, 5, 12, 32])
+def test_generate_strong_passwords_keeps_every_character_class(length):
+    meter = psm.PasswordStrengthMeter(breached_path=None)
+    passwords = meter.generate_strong_passwords(1000, length)
+    assert len(passwords) == 1000
+    alphabet = set("".join(meter.characters.values()))
+    for password in passwords:
+        assert len(password) == length
+        assert set(password) <= alphabet
+        # Rejection sampling must never let a candidate without a class through
+        assert all(set(password) & set(chars) for chars in meter.characters.values())
+    # Short lengths reject most candidates, yet the outputs still vary
+    assert len(set(passwords)) > 900
+
+
+def test_audit_with_workers_matches_single_process(tmp_path):
+    rng = random.Random(7)
+    passwords = ["password", "Password1!", "qwerty", "xK9#mQ2$vL8!", "hunter2"]
+    passwords += ["".join(rng.choices(string.ascii_letters + string.digits + "!@#$", k=rng.randint(1, 16)))
+                  for _ in range(3000)]
+    index = str(tmp_path / "breached.idx")
+    psm.BreachedPasswordIndex.build(["hunter2", "Password1!"], index, hashed=False)
+
+    single = psm.audit_passwords(passwords, workers=1, chunk_size=250, breached_path=index)
+    parallel = psm.audit_passwords(iter(passwords), workers=3, chunk_size=250, breached_path=index)
+    assert single["count"] == parallel["count"] == len(passwords)
+    assert single["strengths"] == parallel["strengths"]
+    assert single["scores"] == parallel["scores"]
+
+    meter = psm.PasswordStrengthMeter(index)
+    expected = Counter(meter.score_password(password)[1] for password in passwords)
+    assert single["strengths"] == dict(expected)
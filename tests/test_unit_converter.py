@@ -0,0 +1,237 @@
+# test_unit_converter.py
+# Correctness tests for the Unit_converter engine: reference values, round trips,
+# cross-checks against the original scalar functions, and seeded random inputs.
+#
+# Usage: python -m pytest tests
+
+import io
+import math
+import os
+import random
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Unit_converter as uc
+
+PAIRS = [(category, from_unit, to_unit)
+         for category, units in uc.CATEGORIES.items()
+         for from_unit in units
+         for to_unit in units]
+
+# (category, from, value, to, expected) checked against published values
+REFERENCE = [
+    ("Length", "Mile", 1, "Kilometer", 1.60934),
+    ("Length", "Foot", 3, "Yard", 1),
+    ("Length", "Inch", 12, "Foot", 1),
+    ("Mass", "Kilogram", 1, "Pound", 2.20462),
+    ("Mass", "Stone", 1, "Pound", 14),
+    ("Area", "Hectare", 1, "Square meter", 10000),
+    ("Area", "Acre", 1, "Square foot", 43560),
+    ("Digital Storage", "Gigabyte", 1, "Bit", 8e9),
+    ("Data Transfer Rate", "Megabyte per second", 1, "Megabit per second", 8),
+    ("Energy", "Kilowatt hour", 1, "Joule", 3.6e6),
+    ("Frequency", "RPM", 60, "Hertz", 1),
+    ("Plane Angle", "Degree", 1, "Minute of arc", 60),
+    ("Pressure", "Atmosphere", 1, "Pascal", 101325),
+    ("Pressure", "Bar", 1, "Kilopascal", 100),
+    ("Speed", "Kilometer per hour", 36, "Meter per second", 10),
+    ("Speed", "Knot", 1, "Kilometer per hour", 1.852),
+    ("Time", "Hour", 1, "Second", 3600),
+    ("Time", "Week", 1, "Day", 7),
+    ("Volume", "Gallon (US)", 1, "Liter", 3.78541),
+    ("Volume", "Liter", 1, "Milliliter", 1000),
+    ("Temperature", "Celsius", 100, "Fahrenheit", 212),
+    ("Temperature", "Celsius", -40, "Fahrenheit", -40),
+    ("Temperature", "Celsius", 0, "Kelvin", 273.15),
+    ("Temperature", "Fahrenheit", 98.6, "Celsius", 37),
+    ("Temperature", "Kelvin", 0, "Fahrenheit", -459.67),
+    ("Fuel Economy", "Liter per 100 kilometers", 10, "Miles per gallon (US)", 23.5215),
+    ("Fuel Economy", "Miles per gallon (US)", 1, "Kilometer per liter", 0.425144),
+    ("Fuel Economy", "Miles per gallon (US)", 1, "Miles per gallon (UK)", 1.20095),
+    ("Fuel Economy", "Kilometer per liter", 20, "Liter per 100 kilometers", 5),
+]
+
+
+def random_values(category, count=25, seed=0):
+    """Seeded random inputs spread over several orders of magnitude."""
+    rng = random.Random(f"{category}-{seed}")
+    values = [10 ** rng.uniform(-3, 6) * rng.choice((1, -1)) for _ in range(count)]
+    if category == "Fuel Economy":
+        # Fuel economy readings are positive
+        values = [abs(value) for value in values]
+    return values + [1, 0.5, 100]
+
+
+def legacy_convert(value, category, from_unit, to_unit):
+    """The original scalar conversion functions and factor ratios."""
+    units = uc.CATEGORIES[category]
+    if category == "Temperature":
+        return uc.convert_temperature(value, from_unit, to_unit)
+    if category == "Fuel Economy":
+        return uc.convert_fuel_economy(value, from_unit, to_unit, units)
+    return value * (units[from_unit] / units[to_unit])
+
+
+@pytest.mark.parametrize("category, from_unit, value, to_unit, expected", REFERENCE)
+def test_reference_values(category, from_unit, value, to_unit, expected):
+    assert uc.REGISTRY.convert(value, category, from_unit, to_unit) == pytest.approx(expected, rel=1e-4, abs=1e-9)
+
+
+@pytest.mark.parametrize("category, from_unit, to_unit", PAIRS)
+def test_round_trip(category, from_unit, to_unit):
+    for value in random_values(category):
+        there = uc.REGISTRY.convert(value, category, from_unit, to_unit)
+        back = uc.REGISTRY.convert(there, category, to_unit, from_unit)
+        assert back == pytest.approx(value, rel=1e-12, abs=1e-9)
+
+
+@pytest.mark.parametrize("category, from_unit, to_unit", PAIRS)
+def test_matches_legacy_functions(category, from_unit, to_unit):
+    for value in random_values(category, seed=1):
+        expected = legacy_convert(value, category, from_unit, to_unit)
+        assert uc.REGISTRY.convert(value, category, from_unit, to_unit) == pytest.approx(expected, rel=1e-12, abs=1e-9)
+
+
+@pytest.mark.parametrize("category", list(uc.CATEGORIES))
+def test_transitivity(category):
+    rng = random.Random(category)
+    units = list(uc.CATEGORIES[category])
+    for _ in range(50):
+        a, b, c = (rng.choice(units) for _ in range(3))
+        value = abs(rng.uniform(0.1, 1000))
+        via_b = uc.REGISTRY.convert(uc.REGISTRY.convert(value, category, a, b), category, b, c)
+        assert via_b == pytest.approx(uc.REGISTRY.convert(value, category, a, c), rel=1e-12, abs=1e-9)
+
+
+@pytest.mark.parametrize("category, from_unit, to_unit", PAIRS)
+def test_fraction_backend_round_trip_is_exact(category, from_unit, to_unit):
+    value = Fraction(37, 3)
+    there = uc.convert_value(value, category, from_unit, to_unit, "fraction")
+    assert uc.convert_value(there, category, to_unit, from_unit, "fraction") == value
+
+
+def test_backends_agree():
+    for category, from_unit, to_unit in PAIRS:
+        exact = uc.convert_value(7.25, category, from_unit, to_unit, "fraction")
+        decimal = uc.convert_value(7.25, category, from_unit, to_unit, "decimal", precision=40)
+        assert isinstance(decimal, Decimal)
+        assert Fraction(decimal) == pytest.approx(exact, rel=1e-35)
+        # The float tables round some constants (e.g. the mile), so agree loosely
+        assert uc.convert_value(7.25, category, from_unit, to_unit) == pytest.approx(float(exact), rel=2e-3)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        uc.convert_value(1, "Length", "Meter", "Foot", "complex")
+
+
+def test_convert_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    for category, from_unit, to_unit in PAIRS:
+        values = random_values(category, seed=2)
+        expected = [uc.REGISTRY.convert(value, category, from_unit, to_unit) for value in values]
+        result = uc.convert_batch(np.array(values), category, from_unit, to_unit)
+        assert result == pytest.approx(expected, rel=1e-12, abs=1e-9)
+
+
+def test_convert_batch_keeps_integer_input_exact():
+    pytest.importorskip("numpy")
+    result = uc.convert_batch([0, 100], "Temperature", "Celsius", "Fahrenheit")
+    assert list(result) == [32, 212]
+
+
+def test_common_conversions_table():
+    pytest.importorskip("pandas")
+    table = uc.common_conversions("Temperature", "Celsius")
+    assert list(table.columns) == ["Fahrenheit", "Kelvin"]
+    assert table.loc["100 Celsius", "Fahrenheit"] == pytest.approx(212)
+    assert uc.common_conversions("Temperature", "Celsius") is table
+
+
+def test_graph_add_edge():
+    graph = uc.ConversionGraph(uc.category_edges("Length"))
+    graph.add_edge("Meter", "Furlong", uc.Transform(1, 0, 0, 201.168))
+    scale, offset, reciprocal = graph.transform("Mile", "Furlong").coefficients()
+    assert scale == pytest.approx(1609.34 / 201.168) and offset == 0 and not reciprocal
+    with pytest.raises(ValueError):
+        graph.transform("Meter", "Parsec")
+
+
+@pytest.mark.parametrize("from_expression, to_expression, expected", [
+    ("km/h", "m/s", 1 / 3.6),
+    ("kN*m", "J", 1000),
+    ("N m", "J", 1),
+    ("MiB/h", "bit/s", 2 ** 20 * 8 / 3600),
+    ("(m/s)^2", "J/kg", 1),
+    ("kWh", "MJ", 3.6),
+    ("1/s", "Hz", 1),
+    ("min", "s", 60),
+    ("mi", "m", 1609.34),
+])
+def test_unit_algebra(from_expression, to_expression, expected):
+    assert uc.convert_units(1, from_expression, to_expression) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("from_expression, to_expression", [
+    ("m", "s"), ("furlong", "m"), ("m^", "m"), ("(m", "m"), ("", "m"),
+    # Out of range: overflowing powers and products, huge exponents, extreme ratios
+    ("km^400", "m^400"), ("km^-400", "m^-400"), ("KiB^100000000", "bit^100000000"),
+    ("EiB^20", "bit^20"), ("Ym^12 Ym^12", "m^24"), ("Ym^12", "ym^12"),
+])
+def test_unit_algebra_errors(from_expression, to_expression):
+    with pytest.raises(ValueError):
+        uc.convert_units(1, from_expression, to_expression)
+
+
+def test_stream_convert():
+    source = io.StringIO("id,miles,note\n1,1,a\n2,,blank\n3,x,bad\n4,10,b\n")
+    target = io.StringIO()
+    rows, skipped = uc.stream_convert(source, target, "Length", "Mile", "Kilometer", ["miles"], chunk_size=2)
+    assert (rows, skipped) == (4, 2)
+    lines = target.getvalue().splitlines()
+    assert lines[0] == "id,miles,note"
+    assert float(lines[1].split(",")[1]) == pytest.approx(1.60934)
+    assert lines[2:4] == ["2,,blank", "3,x,bad"]
+    assert float(lines[4].split(",")[1]) == pytest.approx(16.0934)
+
+
+def test_stream_convert_missing_column():
+    with pytest.raises(ValueError):
+        uc.stream_convert(io.StringIO("a,b\n1,2\n"), io.StringIO(), "Length", "Mile", "Meter", ["c"])
+
+
+@pytest.mark.parametrize("columns, chunk_size", [(["miles", "miles"], 2), (["miles"], 0), (["miles"], -1)])
+def test_stream_convert_rejects_repeated_columns_and_empty_chunks(columns, chunk_size):
+    with pytest.raises(ValueError):
+        uc.stream_convert(io.StringIO("miles\n1\n"), io.StringIO(), "Length", "Mile", "Kilometer", columns, chunk_size)
+
+
+@pytest.mark.parametrize("option", [["--chunk-size", "0"], ["--chunk-size", "-5"], ["--workers", "0"]])
+def test_run_cli_rejects_non_positive_counts(option):
+    with pytest.raises(SystemExit):
+        uc.run_cli(["--category", "Length", "--from", "Mile", "--to", "Kilometer", "--column", "miles"] + option)
+
+
+def test_run_cli_reports_unreadable_and_unwritable_files(tmp_path, capsys):
+    common = ["--category", "Length", "--from", "Mile", "--to", "Kilometer", "--column", "miles"]
+    output = tmp_path / "out.csv"
+    output.write_text("keep\n")
+    assert uc.run_cli([str(tmp_path / "missing.csv"), "-o", str(output)] + common) == 1
+    assert "Error:" in capsys.readouterr().err
+    # A missing input must not truncate the output
+    assert output.read_text() == "keep\n"
+
+    source = tmp_path / "in.csv"
+    source.write_text("miles\n1\n")
+    assert uc.run_cli([str(source), "-o", str(tmp_path / "no-such-dir" / "out.csv")] + common) == 1
+    assert "Error:" in capsys.readouterr().err
+
+
+def test_nan_and_infinity_pass_through():
+    assert math.isnan(uc.REGISTRY.convert(float("nan"), "Length", "Mile", "Meter"))
+    assert uc.REGISTRY.convert(float("inf"), "Mass", "Pound", "Kilogram") == float("inf")
@@ -0,0 +1,133 @@
+# test_unit_converter_service.py
+# Tests for the unit_converter_service HTTP API: routing, validation and error
+# responses, driven over a real socket on an ephemeral port.
+#
+# Usage: python -m pytest tests
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unit_converter_service as service_module
+
+
+def exchange(raw, service=None):
+    """Send raw request bytes to a fresh server; return (status, JSON body or None)."""
+    async def run():
+        service_ = service or service_module.ConversionService()
+        server = await asyncio.start_server(service_.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+        return response
+
+    response = asyncio.run(run())
+    if not response:
+        return None, None
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, json.loads(body)
+
+
+def get(path):
+    return exchange(f"GET {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n\r\n".encode())
+
+
+def post(path, payload, headers=""):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return exchange(f"POST {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+                    f"Content-Length: {len(body)}\r\n{headers}\r\n".encode() + body)
+
+
+def test_health_and_units():
+    assert get("/health")[0] == 200
+    status, units = get("/units")
+    assert status == 200 and "Length" in units
+
+
+def test_convert_one():
+    status, body = get("/convert?category=Length&from=Mile&to=Kilometer&value=1")
+    assert status == 200
+    assert body["result"] == pytest.approx(1.60934)
+
+
+def test_convert_batch():
+    status, body = post("/convert/batch", {"category": "Temperature", "from": "Celsius",
+                                           "to": "Fahrenheit", "values": [0, 100]})
+    assert status == 200 and body["results"] == [32, 212]
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", "1.5"])
+def test_invalid_content_length(length):
+    raw = (f"POST /convert/batch HTTP/1.1\r\nHost: test\r\nContent-Length: {length}\r\n\r\n").encode()
+    status, body = exchange(raw)
+    assert status == 400 and "Content-Length" in body["error"]
+
+
+def test_unexpected_error_answers_500(monkeypatch):
+    service = service_module.ConversionService()
+
+    async def broken(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service, "handle", broken)
+    status, body = exchange(b"GET /health HTTP/1.1\r\nHost: test\r\n\r\n", service)
+    assert status == 500 and body == {"error": "Internal server error"}
+
+
+def test_unknown_endpoint_and_method():
+    assert get("/nope")[0] == 404
+    assert post("/convert", {})[0] == 405
+
+
+@pytest.mark.parametrize("value", ["1e400", "-1e400", "inf", "nan", "abc"])
+def test_convert_one_rejects_non_finite_values(value):
+    status, body = get(f"/convert?category=Length&from=Mile&to=Kilometer&value={value}")
+    assert status == 400 and "error" in body
+
+
+@pytest.mark.parametrize("values", [b"[1" + b"0" * 400 + b"]", b"[1e400]", b"[NaN]", b"[-Infinity]", b'["x"]'])
+def test_convert_batch_rejects_overflow_and_non_finite(values):
+    body = b'{"category": "Length", "from": "Mile", "to": "Meter", "values": ' + values + b"}"
+    status, response = post("/convert/batch", body)
+    assert status == 400 and "error" in response
+
+
+def test_infinite_result_is_null():
+    # 0 L/100km is infinitely efficient: the result is not representable in JSON
+    status, body = get("/convert?category=Fuel%20Economy&from=Liter%20per%20100%20kilometers"
+                       "&to=Miles%20per%20gallon%20(US)&value=0")
+    assert status == 200 and body["result"] is None
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_zero_fuel_consumption_is_null_with_and_without_numpy(monkeypatch, numpy_available):
+    if not numpy_available:
+        # Makes "import numpy" fail, so convert_batch takes its pure-Python path
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    pair = {"category": "Fuel Economy", "from": "Liter per 100 kilometers", "to": "Miles per gallon (US)"}
+    status, body = post("/convert/batch", dict(pair, values=[0, -0.0, 10]))
+    assert status == 200 and body["results"][:2] == [None, None]
+    assert body["results"][2] == pytest.approx(23.5215, rel=1e-3)
+    status, body = get("/convert?category=Fuel%20Economy&from=Liter%20per%20100%20kilometers"
+                       "&to=Miles%20per%20gallon%20(US)&value=0")
+    assert status == 200 and body["result"] is None
+
+
+def test_single_conversions_accept_list_results(monkeypatch):
+    # Without NumPy, convert_batch returns a plain list
+    def list_batch(values, category, from_unit, to_unit):
+        return [value * 1000 for value in values]
+
+    monkeypatch.setattr(service_module, "convert_batch", list_batch)
+    status, body = get("/convert?category=Length&from=Kilometer&to=Meter&value=2")
+    assert status == 200 and body["result"] == 2000
@@ -0,0 +1,317 @@
+"""HTTP API for the Unit_converter conversions.
+
+Run with:  python unit_converter_service.py [--host 127.0.0.1] [--port 8000]
+
+Endpoints (JSON responses):
+    GET  /units                                   categories and their units
+    GET  /convert?category=Length&from=Mile&to=Kilometer&value=3
+    POST /convert/batch  {"category": ..., "from": ..., "to": ..., "values": [...]}
+    GET  /health
+
+Single conversions that arrive within a couple of milliseconds of each other
+are grouped per unit pair and converted with one convert_batch call, and hot
+(category, from, to, value) results are answered from an LRU cache.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import traceback
+from collections import OrderedDict, defaultdict
+from urllib.parse import parse_qs, urlsplit
+
+from Unit_converter import CATEGORIES, convert_batch
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_BATCH_VALUES = 1_000_000
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    """Error answered with a JSON body and the given status code."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _finite(value):
+    # JSON has no Infinity/NaN (e.g. 0 L/100km); report those as null
+    return value if math.isfinite(value) else None
+
+
+def _check_pair(category, from_unit, to_unit):
+    if category not in CATEGORIES:
+        raise HTTPError(400, f"Unknown category: {category!r}")
+    for unit in (from_unit, to_unit):
+        if unit not in CATEGORIES[category]:
+            raise HTTPError(400, f"Unknown {category} unit: {unit!r}")
+
+
+class ResultCache:
+    """LRU cache of conversion results keyed by (category, from, to, value)."""
+
+    def __init__(self, max_entries=100_000):
+        """Create an empty cache.
+
+        Args:
+            max_entries (int): Results kept before the least recently used is dropped.
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached result for key, or None."""
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """Store a result, evicting the oldest entry when full."""
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class ConversionBatcher:
+    """Collects single conversions and runs them as vectorized batches.
+
+    A batch is flushed when it reaches max_batch values or max_delay seconds
+    after its first value arrived, whichever comes first.
+    """
+
+    def __init__(self, cache, max_batch=512, max_delay=0.002):
+        """Create a batcher.
+
+        Args:
+            cache (ResultCache): Where converted results are stored.
+            max_batch (int): Values that trigger an immediate flush.
+            max_delay (float): Longest a value waits for others to join its batch.
+        """
+        self.cache = cache
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending = []
+        self.timer = None
+        self.batches = 0
+
+    def convert(self, category, from_unit, to_unit, value):
+        """Queue one conversion; returns a future for the result."""
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append(((category, from_unit, to_unit), value, future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self):
+        """Convert everything queued, one convert_batch call per unit pair."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        pending, self.pending = self.pending, []
+        if not pending:
+            return
+        self.batches += 1
+
+        groups = defaultdict(list)
+        for pair, value, future in pending:
+            groups[pair].append((value, future))
+        for pair, items in groups.items():
+            try:
+                # A NumPy array, or a plain list when NumPy is not installed
+                results = list(convert_batch([value for value, _ in items], *pair))
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (value, future), result in zip(items, results):
+                self.cache.put((*pair, value), result)
+                if not future.done():
+                    future.set_result(result)
+
+
+class ConversionService:
+    """Routes parsed HTTP requests to the conversion logic."""
+
+    def __init__(self, cache_size=100_000, max_batch=512, max_delay=0.002):
+        """Create the service.
+
+        Args:
+            cache_size (int): Entries in the response cache.
+            max_batch (int): See ConversionBatcher.
+            max_delay (float): See ConversionBatcher.
+        """
+        self.cache = ResultCache(cache_size)
+        self.batcher = ConversionBatcher(self.cache, max_batch, max_delay)
+        self.units = json.dumps({category: list(units) for category, units in CATEGORIES.items()})
+
+    async def handle(self, method, target, body):
+        """Answer one request.
+
+        Args:
+            method (str): HTTP method.
+            target (str): Request path and query string.
+            body (bytes): Request body.
+
+        Returns:
+            tuple: (status code, JSON text)
+        """
+        url = urlsplit(target)
+        if url.path == "/health":
+            return 200, json.dumps({"status": "ok", "cache_hits": self.cache.hits,
+                                    "cache_misses": self.cache.misses, "batches": self.batcher.batches})
+        if url.path == "/units":
+            return 200, self.units
+        if url.path == "/convert":
+            if method != "GET":
+                raise HTTPError(405, "Use GET for /convert")
+            return 200, json.dumps(await self.convert_one(parse_qs(url.query)))
+        if url.path == "/convert/batch":
+            if method != "POST":
+                raise HTTPError(405, "Use POST for /convert/batch")
+            return 200, json.dumps(self.convert_many(body))
+        raise HTTPError(404, f"No such endpoint: {url.path}")
+
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until it closes (asyncio.start_server callback)."""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, target, body, keep_alive = request
+                    status, payload = await self.handle(method, target, body)
+                except HTTPError as e:
+                    status, payload, keep_alive = e.status, json.dumps({"error": str(e)}), False
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception:
+                    # Answer instead of dropping the connection; the details go to the server log
+                    traceback.print_exc()
+                    status, payload, keep_alive = 500, json.dumps({"error": "Internal server error"}), False
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def convert_one(self, query):
+        try:
+            category, from_unit, to_unit = (query[name][0] for name in ("category", "from", "to"))
+            value = float(query["value"][0])
+        except KeyError as e:
+            raise HTTPError(400, f"Missing query parameter: {e.args[0]}")
+        except (ValueError, OverflowError):
+            raise HTTPError(400, "value must be a number")
+        if not math.isfinite(value):
+            raise HTTPError(400, "value must be a finite number")
+        _check_pair(category, from_unit, to_unit)
+
+        key = (category, from_unit, to_unit, value)
+        result = self.cache.get(key)
+        if result is None:
+            result = await self.batcher.convert(category, from_unit, to_unit, value)
+        return {"category": category, "from": from_unit, "to": to_unit,
+                "value": value, "result": _finite(result)}
+
+    def convert_many(self, body):
+        try:
+            request = json.loads(body)
+            category, from_unit, to_unit = request["category"], request["from"], request["to"]
+            values = [float(value) for value in request["values"]]
+        except (ValueError, TypeError, KeyError, OverflowError):
+            raise HTTPError(400, 'Expected JSON {"category", "from", "to", "values": [numbers]}')
+        if not all(map(math.isfinite, values)):
+            # JSON has no Infinity/NaN, so they can't be echoed back either
+            raise HTTPError(400, "values must be finite numbers")
+        if len(values) > MAX_BATCH_VALUES:
+            raise HTTPError(413, f"At most {MAX_BATCH_VALUES} values per batch")
+        _check_pair(category, from_unit, to_unit)
+
+        results = convert_batch(values, category, from_unit, to_unit) if values else []
+        return {"category": category, "from": from_unit, "to": to_unit,
+                "results": [_finite(result) for result in list(results)]}
+
+
+async def _read_request(reader):
+    """Read one HTTP/1.1 request; returns None when the client closed the connection."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPError(400, "Content-Length must be a non-negative integer")
+    if length < 0:
+        raise HTTPError(400, "Content-Length must be a non-negative integer")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+    return method, target, body, keep_alive
+
+
+def _response(status, payload, keep_alive):
+    body = payload.encode()
+    head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode() + body
+
+
+async def serve(host="127.0.0.1", port=8000, **options):
+    """Run the HTTP server until cancelled."""
+    service = ConversionService(**options)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"Serving conversions on http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP API for the Unit_converter conversions.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--cache-size", type=int, default=100_000, help="cached (value, from, to) results")
+    parser.add_argument("--max-batch", type=int, default=512, help="single conversions per batch")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="longest wait for a batch to fill")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, cache_size=args.cache_size,
+                          max_batch=args.max_batch, max_delay=args.max_delay_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()